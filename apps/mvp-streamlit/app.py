@@ -14,13 +14,18 @@ try:
 except ImportError:
     st = None
 
+import os
 import tempfile
 from datetime import time
 
-from core.parser import parse_csv, ParseError
+from core.parser import parse_csv, validate_roster, ParseError
+from core.cache import ParseCache
 from core.scheduler import generate_schedule
 from core.formatter import to_json, to_markdown
-from core.models import Slot
+from core.models import Slot, WEEK_DAYS
+
+# Opt-in parse cache: set PLANZ_PARSE_CACHE_DIR to reuse parses of re-uploaded CSVs
+PARSE_CACHE = ParseCache(os.environ["PLANZ_PARSE_CACHE_DIR"]) if os.environ.get("PLANZ_PARSE_CACHE_DIR") else None
 
 # Error message translations
 ERROR_TRANSLATIONS = {
@@ -186,6 +191,16 @@ def main():
                 st.info("💡 Téléchargez le template fourni pour voir les colonnes requises.")
             except Exception as e:
                 st.error(f"❌ Erreur inattendue : {e}")
+            
+            # Full validation report: every error of the file in one pass
+            availability_file.seek(0)
+            report = validate_roster(availability_file)
+            availability_file.seek(0)
+            if not report.is_valid:
+                st.error(f"❌ **{len(report.issues)} erreur(s) dans le CSV**")
+                with st.expander("🔍 Détail des erreurs", expanded=True):
+                    for issue in report.issues:
+                        st.markdown(f"- `{issue.code.value}` {translate_error_message(issue.message)}")
     
     with col2:
         st.subheader("Créneaux Récurrents (optionnel)")
@@ -315,14 +330,15 @@ def main():
                         recurring_path = tmp_rec.name
                 
                 # Parse students
-                students = parse_csv(avail_path)
+                students = PARSE_CACHE.parse_csv(avail_path) if PARSE_CACHE else parse_csv(avail_path)
                 st.success(f"✅ {len(students)} élèves chargés")
                 
                 # Generate schedule
                 result = generate_schedule(
                     students=students,
                     recurring_slots_path=recurring_path,
-                    coach_reserved_slots=st.session_state.coach_reserved
+                    coach_reserved_slots=st.session_state.coach_reserved,
+                    parse_cache=PARSE_CACHE
                 )
                 
                 # Store result in session
@@ -379,12 +395,9 @@ def main():
         # Schedule display
         st.subheader("Planning Hebdomadaire")
         
-        # Group by day
-        days_order = ["lundi", "mardi", "mercredi", "jeudi", "vendredi", "samedi"]
-        schedule_by_day = {day: [] for day in days_order}
-        
-        for cls in result.schedule:
-            schedule_by_day[cls.slot.day].append(cls)
+        # Group by day (cached on the result, sorted chronologically)
+        days_order = list(WEEK_DAYS)
+        schedule_by_day = result.by_day
         
         # Create tabs for different views
         tab_calendar, tab_list = st.tabs(["📅 Vue Calendrier", "📋 Vue Détaillée"])
@@ -478,7 +491,7 @@ def main():
                     continue
                 
                 with st.expander(f"**{day.capitalize()}** ({len(classes)} cours)", expanded=True):
-                    for cls in sorted(classes, key=lambda c: c.slot.start_time):
+                    for cls in classes:
                         status_icon = {"locked": "🔒", "proposed": "✅", "needs_validation": "⚠️"}.get(cls.status.value, "❓")
                         st.write(
                             f"{status_icon} **{cls.slot.start_time.strftime('%H:%M')}-{cls.slot.end_time.strftime('%H:%M')}** "
@@ -525,7 +538,7 @@ def main():
             if 'students' in st.session_state:
                 students_list = st.session_state.students
                 total_requested = sum(s.sessions_per_week for s in students_list)
-                total_placed_sessions = len(result.schedule)
+                total_placed_sessions = result.total_classes
                 st.caption(f"📊 Cours placés : {total_placed_sessions} / {total_requested} demandés ({total_placed_sessions/total_requested*100:.0f}%)")
             
             for unplaced in result.unplaced:
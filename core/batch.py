@@ -0,0 +1,159 @@
+"""
+Parallel batch parsing of many rosters (parse_many).
+
+This module is responsible for:
+- Parsing many availability CSVs (each with an optional recurring slots
+  CSV) across a process pool
+- Isolating errors per file: one invalid upload never fails the batch
+- Sending parsed rosters back from workers as .planz bytes
+  (core.snapshot) instead of pickled Student / ScheduledClass graphs
+
+Results come back in input order, whatever order workers finish in.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from .models import Student, ScheduledClass
+from .parser import (
+    parse_csv, parse_recurring_slots_csv_with_warnings, ParseError, RosterErrorCode,
+    CSV_ENGINES, DEFAULT_ENGINE
+)
+from .snapshot import RosterSnapshot, snapshot_bytes
+
+
+# A roster path, or (roster path, recurring slots path or None)
+BatchInput = Union[str, os.PathLike, Tuple[Any, Optional[Any]]]
+
+
+@dataclass
+class BatchParseResult:
+    """Outcome of parsing one roster in parse_many.
+    
+    Rosters parsed by a worker arrive as .planz bytes: students and
+    skeleton are decoded on first access, so a batch that only checks
+    errors never pays for building them.
+    """
+    roster_path: str
+    recurring_path: Optional[str] = None
+    warnings: List[Dict[str, Any]] = field(default_factory=list)  # parse_recurring_slots_csv_with_warnings
+    error: Optional[str] = None  # ParseError message (or "Type: message" for other errors)
+    error_code: Optional[RosterErrorCode] = None
+    _students: Optional[List[Student]] = field(default=None, repr=False)
+    _skeleton: Optional[List[ScheduledClass]] = field(default=None, repr=False)
+    _snapshot: Optional[RosterSnapshot] = field(default=None, repr=False, compare=False)
+    
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+    
+    @property
+    def students(self) -> List[Student]:
+        if self._students is None:
+            self._students = self._snapshot.students() if self._snapshot is not None else []
+        return self._students
+    
+    @property
+    def skeleton(self) -> List[ScheduledClass]:
+        if self._skeleton is None:
+            self._skeleton = self._snapshot.skeleton() if self._snapshot is not None else []
+        return self._skeleton
+    
+    @property
+    def student_count(self) -> int:
+        return len(self._snapshot) if self._students is None and self._snapshot is not None else len(self.students)
+
+
+def parse_many(
+    paths: Sequence[BatchInput],
+    workers: Optional[int] = None,
+    engine: str = DEFAULT_ENGINE
+) -> List[BatchParseResult]:
+    """Parse many rosters in parallel, one file per task.
+    
+    Each input is parsed like parse_csv, then, when a recurring slots path
+    is given, like parse_recurring_slots_csv_with_warnings.
+    
+    Args:
+        paths: Roster paths, or (roster path, recurring slots path) pairs
+            (recurring path may be None)
+        workers: Worker processes (default: os.cpu_count()); 1 parses in
+            the calling process
+        engine: CSV reader, one of CSV_ENGINES (see core.parser._read_tables)
+    
+    Returns:
+        One BatchParseResult per input, in input order. Failed inputs have
+        error set; students are kept when only the recurring slots file
+        failed
+    
+    Raises:
+        ValueError: If engine is unknown
+    """
+    if engine not in CSV_ENGINES:
+        raise ValueError(f"Unknown CSV engine '{engine}'. Expected one of: {', '.join(CSV_ENGINES)}")
+    
+    jobs = [_job(item, engine) for item in paths]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(jobs))
+    
+    if workers <= 1:
+        return [_parse_job(job, encode=False) for job in jobs]
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Workers send compact payloads; rosters are decoded here, in input order
+        return [_decode(payload) for payload in executor.map(_parse_job, jobs)]
+
+
+def _job(item: BatchInput, engine: str) -> Tuple[str, Optional[str], str]:
+    if isinstance(item, tuple):
+        roster_path, recurring_path = item
+    else:
+        roster_path, recurring_path = item, None
+    return os.fspath(roster_path), os.fspath(recurring_path) if recurring_path is not None else None, engine
+
+
+def _parse_job(job: Tuple[str, Optional[str], str], encode: bool = True):
+    """Parse one input (runs in a worker).
+    
+    Returns:
+        BatchParseResult if not encode, else the tuple sent back to the
+        parent: (roster_path, recurring_path, .planz bytes, warnings, error, error_code)
+    """
+    roster_path, recurring_path, engine = job
+    result = BatchParseResult(roster_path=roster_path, recurring_path=recurring_path)
+    try:
+        result._students = parse_csv(roster_path, engine)
+        if recurring_path is not None:
+            result._skeleton, result.warnings = parse_recurring_slots_csv_with_warnings(
+                recurring_path, result._students
+            )
+    except ParseError as e:
+        result.error, result.error_code = str(e), e.code
+    except Exception as e:
+        result.error, result.error_code = f"{type(e).__name__}: {e}", RosterErrorCode.UNEXPECTED
+    
+    if not encode:
+        return result
+    return (
+        roster_path,
+        recurring_path,
+        snapshot_bytes(result.students, result.skeleton),
+        result.warnings,
+        result.error,
+        result.error_code
+    )
+
+
+def _decode(payload) -> BatchParseResult:
+    roster_path, recurring_path, data, warnings, error, error_code = payload
+    return BatchParseResult(
+        roster_path=roster_path,
+        recurring_path=recurring_path,
+        _snapshot=RosterSnapshot(data),
+        warnings=warnings,
+        error=error,
+        error_code=error_code
+    )
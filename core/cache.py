@@ -0,0 +1,255 @@
+"""
+Content-addressed on-disk cache for parsed CSVs (opt-in).
+
+This module is responsible for:
+- Caching parse_csv results keyed by the file bytes (path or buffer)
+- Caching parse_recurring_slots_csv results keyed by the file bytes and roster
+- Compact serialization (marshal of plain tuples: names, counts, masks, ranges)
+- Size-bounded LRU eviction (file mtime = last use)
+- Automatic invalidation when the parser, the models or the format change
+
+Entries hold only primitives and are read back with marshal, never pickle,
+so a cache directory cannot execute code when loaded. Parse errors are not
+cached: an invalid file is re-parsed (and re-reported) every time.
+
+Cache hits skip parsing, so parser log messages (e.g. partial linking
+warnings) are only emitted on the first parse.
+"""
+
+import hashlib
+import io
+import logging
+import marshal
+import os
+import sys
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Tuple, Any
+
+from . import models, parser
+from .models import Student, Slot, TimeRange, ScheduledClass, SlotStatus, SLOT_ID_COUNT
+from .parser import parse_csv, parse_recurring_slots_csv, DEFAULT_ENGINE
+
+logger = logging.getLogger(__name__)
+
+
+# Bump when the payload layout below changes
+CACHE_FORMAT_VERSION = 2
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+_ENTRY_SUFFIX = ".planzc"
+
+
+@lru_cache(maxsize=None)
+def _schema_fingerprint() -> bytes:
+    """Digest of everything a cached entry depends on besides the input file.
+    
+    Any edit to core/parser.py or core/models.py, a format bump, or another
+    Python/marshal version yields a new fingerprint, so stale entries are
+    never read (they age out through LRU eviction).
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{CACHE_FORMAT_VERSION}:{marshal.version}:{sys.version_info[:2]}".encode())
+    for module in (parser, models):
+        digest.update(Path(module.__file__).read_bytes())
+    return digest.digest()
+
+
+def _roster_payload(students: List[Student]) -> Tuple[Any, ...]:
+    return tuple(
+        (
+            s.name, s.sessions_per_week, s.availability_mask, s.linked_group, s.notes,
+            tuple((r.day, r.start_minutes, r.end_minutes) for r in s.availability_ranges)
+        )
+        for s in students
+    )
+
+
+def _students_from_payload(payload) -> List[Student]:
+    return [
+        Student.from_ranges(
+            name, sessions, [TimeRange.of(*bounds) for bounds in ranges], linked_group, notes,
+            availability_mask=mask
+        )
+        for name, sessions, mask, linked_group, notes, ranges in payload
+    ]
+
+
+def _skeleton_payload(classes: List[ScheduledClass]) -> Optional[Tuple[Any, ...]]:
+    """Plain-tuple form of recurring classes, None if a slot is off-grid."""
+    if any(c.slot.id >= SLOT_ID_COUNT for c in classes):
+        return None  # Off-grid IDs are per-process: not cacheable
+    return tuple((c.slot.id, tuple(c.students), c.status.value) for c in classes)
+
+
+def _classes_from_payload(payload) -> List[ScheduledClass]:
+    return [
+        ScheduledClass(
+            slot=Slot.from_id(slot_id, is_recurring=True),
+            students=list(names),
+            status=SlotStatus(status)
+        )
+        for slot_id, names, status in payload
+    ]
+
+
+class ParseCache:
+    """Opt-in parse cache stored in a directory.
+    
+    Usage:
+        cache = ParseCache("/var/cache/planz")
+        students = cache.parse_csv("disponibilites.csv")
+        skeleton = cache.parse_recurring_slots_csv("recurring-slots.csv", students)
+    """
+    
+    def __init__(self, directory, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Create (or reuse) a cache directory.
+        
+        Args:
+            directory: Cache directory (created if missing)
+            max_bytes: Total size above which least recently used entries
+                are evicted
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+    
+    # ------------------------------------------------------------------------
+    # Parsing entry points
+    # ------------------------------------------------------------------------
+    
+    def parse_csv(self, file_path, engine: str = DEFAULT_ENGINE) -> List[Student]:
+        """Cached equivalent of core.parser.parse_csv.
+        
+        file_path may be a path or a file-like object (text or bytes), as
+        for parse_csv; a buffer is keyed by its content (see _read_source).
+        """
+        content, source = self._read_source(file_path)
+        key = self._key(b"roster:" + engine.encode(), content)
+        payload = self._load(key)
+        if payload is not None:
+            return _students_from_payload(payload)
+        
+        students = parse_csv(source, engine)
+        self._store(key, _roster_payload(students))
+        return students
+    
+    def parse_recurring_slots_csv(
+        self,
+        file_path,
+        all_students: List[Student],
+        engine: str = DEFAULT_ENGINE
+    ) -> List[ScheduledClass]:
+        """Cached equivalent of core.parser.parse_recurring_slots_csv.
+        
+        The key covers the roster too, since validation depends on it.
+        file_path may be a path or a file-like object, as for parse_csv.
+        """
+        roster_digest = hashlib.sha256(marshal.dumps(_roster_payload(all_students))).digest()
+        content, source = self._read_source(file_path)
+        key = self._key(b"recurring:" + engine.encode(), roster_digest + content)
+        payload = self._load(key)
+        if payload is not None:
+            return _classes_from_payload(payload)
+        
+        classes = parse_recurring_slots_csv(source, all_students, engine)
+        skeleton_payload = _skeleton_payload(classes)
+        if skeleton_payload is not None:
+            self._store(key, skeleton_payload)
+        return classes
+    
+    def clear(self) -> None:
+        """Delete every cache entry."""
+        for entry in self.directory.glob(f"*{_ENTRY_SUFFIX}"):
+            entry.unlink(missing_ok=True)
+    
+    def size_bytes(self) -> int:
+        """Total size of the cache entries."""
+        return sum(entry.stat().st_size for entry in self.directory.glob(f"*{_ENTRY_SUFFIX}"))
+    
+    # ------------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------------
+    
+    @staticmethod
+    def _read_source(path_or_buffer) -> Tuple[bytes, Any]:
+        """Bytes to key on and the source to parse on a miss.
+        
+        A buffer is consumed here (text encoded as UTF-8), so the parser
+        gets a BytesIO of the same bytes instead: the buffer need not be
+        seekable, and a hit and a miss see the same content.
+        """
+        if hasattr(path_or_buffer, "read"):
+            content = path_or_buffer.read()
+            if isinstance(content, str):
+                content = content.encode("utf-8")
+            return content, io.BytesIO(content)
+        try:
+            return Path(path_or_buffer).read_bytes(), path_or_buffer
+        except FileNotFoundError:
+            # Let the parser raise its usual ParseError
+            return b"", path_or_buffer
+    
+    @staticmethod
+    def _key(kind: bytes, content: bytes) -> str:
+        digest = hashlib.sha256(_schema_fingerprint())
+        digest.update(kind)
+        digest.update(content)
+        return digest.hexdigest()
+    
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{_ENTRY_SUFFIX}"
+    
+    def _load(self, key: str):
+        path = self._path(key)
+        try:
+            payload = marshal.loads(path.read_bytes())
+            os.utime(path)  # Mark as recently used
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (EOFError, ValueError, TypeError):
+            logger.warning(f"Dropping corrupted parse cache entry {path.name}")
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return payload
+    
+    def _store(self, key: str, payload) -> None:
+        data = marshal.dumps(payload)
+        if len(data) > self.max_bytes:
+            return
+        
+        # Atomic write: concurrent readers see the old entry or the full new one
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        
+        self._evict()
+    
+    def _evict(self) -> None:
+        """Delete least recently used entries until the cache fits max_bytes."""
+        entries = []
+        for entry in self.directory.glob(f"*{_ENTRY_SUFFIX}"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry))
+        
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
@@ -0,0 +1,187 @@
+"""
+Columnar (struct-of-arrays) representation of a schedule result.
+
+This module is responsible for:
+- Storing a schedule as flat NumPy arrays instead of ScheduledClass objects
+- Interning student names into a single name table
+- Lossless conversion to and from ScheduleResult
+- Cheap pickling between worker processes (batch generation)
+
+A class is row i: slot_ids[i], status_codes[i], recurring[i], and the
+students student_ids[student_offsets[i]:student_offsets[i + 1]] (indices
+into names). core.formatter renders ColumnarScheduleResult directly.
+"""
+
+from dataclasses import dataclass, field
+from datetime import time
+from typing import Dict, List, Any, Tuple, Iterator
+
+import numpy as np
+
+from .models import (
+    Slot, SlotStatus, ScheduledClass, ScheduleResult, UnplacedStudent,
+    WEEK_DAYS, GRID_SIZE, HALF_HOURS_PER_DAY, SLOT_ID_COUNT
+)
+
+
+# Status code = position in SlotStatus declaration order
+STATUS_BY_CODE: Tuple[SlotStatus, ...] = tuple(SlotStatus)
+STATUS_CODES: Dict[SlotStatus, int] = {status: code for code, status in enumerate(STATUS_BY_CODE)}
+
+
+@dataclass(eq=False)
+class ColumnarScheduleResult:
+    """Struct-of-arrays schedule result (compare via to_result(), not ==).
+    
+    Off-grid slot IDs come from a per-process registry, so their
+    (day, start, end) is kept in off_grid_slots: the result stays valid
+    after being unpickled in another process.
+    """
+    slot_ids: np.ndarray  # int32 (n_classes,)
+    status_codes: np.ndarray  # uint8 (n_classes,) index in STATUS_BY_CODE
+    recurring: np.ndarray  # bool (n_classes,) Slot.is_recurring
+    student_offsets: np.ndarray  # int32 (n_classes + 1,)
+    student_ids: np.ndarray  # int32 (n_placements,) index in names
+    names: Tuple[str, ...]
+    off_grid_slots: Dict[int, Tuple[str, time, time]] = field(default_factory=dict)
+    unplaced: List[UnplacedStudent] = field(default_factory=list)
+    warnings: List[Dict[str, Any]] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    explanations: Dict[str, Any] = field(default_factory=dict)
+    
+    @classmethod
+    def from_result(cls, result: ScheduleResult) -> 'ColumnarScheduleResult':
+        """Convert a ScheduleResult (class order and student order are kept).
+        
+        Args:
+            result: Schedule result to convert
+        
+        Returns:
+            Equivalent ColumnarScheduleResult
+        """
+        schedule = result.schedule
+        name_ids: Dict[str, int] = {}
+        student_ids: List[int] = []
+        offsets = [0]
+        off_grid_slots: Dict[int, Tuple[str, time, time]] = {}
+        
+        for scheduled_class in schedule:
+            for name in scheduled_class.students:
+                student_ids.append(name_ids.setdefault(name, len(name_ids)))
+            offsets.append(len(student_ids))
+            slot = scheduled_class.slot
+            if slot.id >= SLOT_ID_COUNT:
+                off_grid_slots[slot.id] = (slot.day, slot.start_time, slot.end_time)
+        
+        return cls(
+            slot_ids=np.fromiter((c.slot.id for c in schedule), dtype=np.int32, count=len(schedule)),
+            status_codes=np.fromiter(
+                (STATUS_CODES[c.status] for c in schedule), dtype=np.uint8, count=len(schedule)
+            ),
+            recurring=np.fromiter((c.slot.is_recurring for c in schedule), dtype=bool, count=len(schedule)),
+            student_offsets=np.array(offsets, dtype=np.int32),
+            student_ids=np.array(student_ids, dtype=np.int32),
+            names=tuple(name_ids),
+            off_grid_slots=off_grid_slots,
+            unplaced=list(result.unplaced),
+            warnings=list(result.warnings),
+            metadata=dict(result.metadata),
+            explanations=dict(result.explanations)
+        )
+    
+    def to_result(self) -> ScheduleResult:
+        """Rebuild the equivalent ScheduleResult."""
+        return ScheduleResult(
+            schedule=[
+                ScheduledClass(slot=self.slot(i), students=self.students(i), status=self.status(i))
+                for i in range(self.total_classes)
+            ],
+            unplaced=list(self.unplaced),
+            warnings=list(self.warnings),
+            metadata=dict(self.metadata),
+            explanations=dict(self.explanations)
+        )
+    
+    # ------------------------------------------------------------------------
+    # Row access
+    # ------------------------------------------------------------------------
+    
+    def __len__(self) -> int:
+        return self.total_classes
+    
+    def slot(self, row: int) -> Slot:
+        """Interned Slot of a class."""
+        slot_id = int(self.slot_ids[row])
+        is_recurring = bool(self.recurring[row])
+        if slot_id < SLOT_ID_COUNT:
+            return Slot.from_id(slot_id, is_recurring)
+        day, start_time, end_time = self.off_grid_slots[slot_id]
+        return Slot.intern(day, start_time, end_time, is_recurring)
+    
+    def students(self, row: int) -> List[str]:
+        """Student names of a class, in their original order."""
+        names = self.names
+        start, end = self.student_offsets[row], self.student_offsets[row + 1]
+        return [names[student_id] for student_id in self.student_ids[start:end].tolist()]
+    
+    def status(self, row: int) -> SlotStatus:
+        return STATUS_BY_CODE[self.status_codes[row]]
+    
+    def iter_rows(self) -> Iterator[Tuple[Slot, List[str], SlotStatus]]:
+        """Yield (slot, students, status) for every class in schedule order."""
+        for row in range(self.total_classes):
+            yield self.slot(row), self.students(row), self.status(row)
+    
+    def day_rows(self) -> Dict[str, np.ndarray]:
+        """Rows per day (every WEEK_DAYS key present), sorted by start time then slot ID."""
+        slot_ids = self.slot_ids.astype(np.int64)
+        days = (slot_ids % GRID_SIZE) // HALF_HOURS_PER_DAY
+        starts = (slot_ids % HALF_HOURS_PER_DAY) * 30
+        
+        off_grid = np.flatnonzero(slot_ids >= SLOT_ID_COUNT)
+        day_index = {day: i for i, day in enumerate(WEEK_DAYS)}
+        for row in off_grid.tolist():
+            slot = self.slot(row)
+            days[row] = day_index.get(slot.day, -1)
+            starts[row] = slot.start_minutes
+        
+        order = np.lexsort((slot_ids, starts))
+        sorted_days = days[order]
+        return {day: order[sorted_days == i] for i, day in enumerate(WEEK_DAYS)}
+    
+    # ------------------------------------------------------------------------
+    # Summary counters (same meaning as on ScheduleResult)
+    # ------------------------------------------------------------------------
+    
+    @property
+    def total_classes(self) -> int:
+        return len(self.slot_ids)
+    
+    @property
+    def placed_count(self) -> int:
+        return len(self.student_ids)
+    
+    @property
+    def unplaced_count(self) -> int:
+        return len(self.unplaced)
+    
+    def placement_rate(self) -> float:
+        """Calculate percentage of students successfully placed."""
+        total = self.placed_count + self.unplaced_count
+        
+        if total == 0:
+            return 0.0
+        
+        return (self.placed_count / total) * 100.0
+    
+    def is_complete(self) -> bool:
+        """Check if all students were successfully placed."""
+        return len(self.unplaced) == 0
+    
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the array columns (name table excluded)."""
+        return (
+            self.slot_ids.nbytes + self.status_codes.nbytes + self.recurring.nbytes
+            + self.student_offsets.nbytes + self.student_ids.nbytes
+        )
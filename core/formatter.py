@@ -4,6 +4,7 @@ Output formatters for schedule results.
 This module is responsible for:
 - Converting ScheduleResult → JSON (machine-readable)
 - Converting ScheduleResult → Markdown (human-readable)
+- Rendering ColumnarScheduleResult directly (no ScheduledClass objects)
 - Formatting UnplacedStudent explanations
 - Saving formatted output to files
 
@@ -12,16 +13,48 @@ Pure formatting module with no business logic.
 
 import json
 from datetime import time, datetime
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, List, Tuple, Union
 
-from .models import ScheduleResult, ScheduledClass, UnplacedStudent, SlotStatus, Slot
+from .models import ScheduleResult, ScheduledClass, UnplacedStudent, SlotStatus, Slot, WEEK_DAYS
+from .columnar import ColumnarScheduleResult
+
+
+# Both result layouts expose unplaced/warnings/metadata/explanations and the
+# summary counters; classes are read through _iter_classes/_classes_by_day.
+AnyScheduleResult = Union[ScheduleResult, ColumnarScheduleResult]
+ClassRow = Tuple[Slot, List[str], SlotStatus]
+
+
+def _iter_classes(schedule_result: AnyScheduleResult) -> Iterator[ClassRow]:
+    """Yield (slot, students, status) for every class, in schedule order."""
+    if isinstance(schedule_result, ColumnarScheduleResult):
+        yield from schedule_result.iter_rows()
+    else:
+        for cls in schedule_result.schedule:
+            yield cls.slot, cls.students, cls.status
+
+
+def _classes_by_day(schedule_result: AnyScheduleResult) -> Dict[str, List[ClassRow]]:
+    """Group (slot, students, status) rows by day, chronologically sorted."""
+    if isinstance(schedule_result, ColumnarScheduleResult):
+        return {
+            day: [
+                (schedule_result.slot(row), schedule_result.students(row), schedule_result.status(row))
+                for row in rows.tolist()
+            ]
+            for day, rows in schedule_result.day_rows().items()
+        }
+    return {
+        day: [(cls.slot, cls.students, cls.status) for cls in classes]
+        for day, classes in schedule_result.by_day.items()
+    }
 
 
 # ============================================================================
 # JSON FORMATTER
 # ============================================================================
 
-def to_json(schedule_result: ScheduleResult) -> Dict[str, Any]:
+def to_json(schedule_result: AnyScheduleResult) -> Dict[str, Any]:
     """Convert ScheduleResult to JSON-serializable dictionary.
     
     Args:
@@ -34,14 +67,15 @@ def to_json(schedule_result: ScheduleResult) -> Dict[str, Any]:
         "metadata": schedule_result.metadata,
         "schedule": [
             {
-                "day": cls.slot.day,
-                "start_time": cls.slot.start_time.strftime("%H:%M"),
-                "end_time": cls.slot.end_time.strftime("%H:%M"),
-                "students": cls.students,
-                "status": cls.status.value,
-                "is_recurring": cls.slot.is_recurring
+                "slot_id": slot.id,
+                "day": slot.day,
+                "start_time": slot.start_time.strftime("%H:%M"),
+                "end_time": slot.end_time.strftime("%H:%M"),
+                "students": list(students),
+                "status": status.value,
+                "is_recurring": slot.is_recurring
             }
-            for cls in schedule_result.schedule
+            for slot, students, status in _iter_classes(schedule_result)
         ],
         "unplaced": [
             {
@@ -55,8 +89,8 @@ def to_json(schedule_result: ScheduleResult) -> Dict[str, Any]:
         "warnings": schedule_result.warnings,
         "explanations": schedule_result.explanations,
         "summary": {
-            "total_classes": len(schedule_result.schedule),
-            "total_unplaced": len(schedule_result.unplaced),
+            "total_classes": schedule_result.total_classes,
+            "total_unplaced": schedule_result.unplaced_count,
             "total_warnings": len(schedule_result.warnings),
             "placement_rate": schedule_result.placement_rate(),
             "is_complete": schedule_result.is_complete()
@@ -64,7 +98,7 @@ def to_json(schedule_result: ScheduleResult) -> Dict[str, Any]:
     }
 
 
-def save_json(schedule_result: ScheduleResult, file_path: str) -> None:
+def save_json(schedule_result: AnyScheduleResult, file_path: str) -> None:
     """Save schedule result as JSON file.
     
     Args:
@@ -80,7 +114,7 @@ def save_json(schedule_result: ScheduleResult, file_path: str) -> None:
 # MARKDOWN FORMATTER
 # ============================================================================
 
-def to_markdown(schedule_result: ScheduleResult) -> str:
+def to_markdown(schedule_result: AnyScheduleResult) -> str:
     """Convert ScheduleResult to human-readable Markdown format.
     
     Visual table by day/time with emoji indicators:
@@ -105,8 +139,8 @@ def to_markdown(schedule_result: ScheduleResult) -> str:
     # Summary
     lines.append("## Résumé")
     lines.append("")
-    lines.append(f"- **Cours planifiés :** {len(schedule_result.schedule)}")
-    lines.append(f"- **Élèves non placés :** {len(schedule_result.unplaced)}")
+    lines.append(f"- **Cours planifiés :** {schedule_result.total_classes}")
+    lines.append(f"- **Élèves non placés :** {schedule_result.unplaced_count}")
     lines.append(f"- **Taux de placement :** {schedule_result.placement_rate():.1f}%")
     lines.append(f"- **Planning complet :** {'✅ Oui' if schedule_result.is_complete() else '⚠️ Non (solution partielle)'}")
     lines.append("")
@@ -115,19 +149,11 @@ def to_markdown(schedule_result: ScheduleResult) -> str:
     lines.append("## Planning Hebdomadaire")
     lines.append("")
     
-    # Group classes by day
-    days_order = ["lundi", "mardi", "mercredi", "jeudi", "vendredi", "samedi"]
-    schedule_by_day = {day: [] for day in days_order}
-    
-    for cls in schedule_result.schedule:
-        schedule_by_day[cls.slot.day].append(cls)
-    
-    # Sort classes by time within each day
-    for day in days_order:
-        schedule_by_day[day].sort(key=lambda cls: (cls.slot.start_time, cls.slot.end_time))
+    # Classes grouped by day, chronologically sorted
+    schedule_by_day = _classes_by_day(schedule_result)
     
     # Render each day
-    for day in days_order:
+    for day in WEEK_DAYS:
         classes = schedule_by_day[day]
         if not classes:
             continue
@@ -135,12 +161,12 @@ def to_markdown(schedule_result: ScheduleResult) -> str:
         lines.append(f"### {day.capitalize()}")
         lines.append("")
         
-        for cls in classes:
-            status_emoji = _get_status_emoji(cls.status)
-            students_str = ", ".join(cls.students)
-            time_str = f"{cls.slot.start_time.strftime('%H:%M')}-{cls.slot.end_time.strftime('%H:%M')}"
+        for slot, students, status in classes:
+            status_emoji = _get_status_emoji(status)
+            students_str = ", ".join(students)
+            time_str = f"{slot.start_time.strftime('%H:%M')}-{slot.end_time.strftime('%H:%M')}"
             
-            lines.append(f"{status_emoji} **{time_str}** - {students_str} ({len(cls.students)} élèves)")
+            lines.append(f"{status_emoji} **{time_str}** - {students_str} ({len(students)} élèves)")
         
         lines.append("")
     
@@ -206,7 +232,7 @@ def to_markdown(schedule_result: ScheduleResult) -> str:
     return "\n".join(lines)
 
 
-def save_markdown(schedule_result: ScheduleResult, file_path: str) -> None:
+def save_markdown(schedule_result: AnyScheduleResult, file_path: str) -> None:
     """Save schedule result as Markdown file.
     
     Args:
@@ -0,0 +1,244 @@
+"""
+Bulk construction of the phase 2 CP-SAT model (build_model).
+
+This module is responsible for:
+- Filling a CpModel's proto (variables, constraints, objective) straight
+  from ProblemMatrix index arrays, without the Python modelling API
+  (NewBoolVar, Add(sum(...)), OnlyEnforceIf build one expression tree per
+  call, which dominated build time on large rosters)
+- Recording where each variable landed in the proto (ModelLayout), so
+  solutions are read back as arrays
+- Reading a constraint's kind on either proto binding (constraint_kind)
+
+The proto is the one the modelling API would build, variable for variable
+and constraint for constraint (names and term order aside): see
+scripts/benchmark_model.py, which keeps the API version as a reference.
+
+Proto variable order:
+1. Assignment literals, one per candidate pair, in candidate_pairs order
+2. Occupancy literals, one per slot with candidate students
+3. Linked group "together" literals (see _add_linked_groups)
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .problem import ProblemMatrix
+
+INT64_MIN = -(2 ** 63)
+INT64_MAX = 2 ** 63 - 1
+
+
+@dataclass
+class ModelLayout:
+    """Proto indices of the variables of a model built by build_model."""
+    pair_rows: np.ndarray  # int (n_pairs,) student row of assignment k (proto variable k)
+    pair_columns: np.ndarray  # int (n_pairs,) slot column of assignment k
+    slot_columns: np.ndarray  # int (n_open,) slots with candidate students, in constraint order
+    slot_used: np.ndarray  # int (n_open,) proto variable of each slot's occupancy literal
+    
+    @property
+    def num_pairs(self) -> int:
+        return self.pair_rows.size
+    
+    def assigned_pairs(self, solution) -> tuple:
+        """(rows, columns) of the assignments set in a solution.
+        
+        Args:
+            solution: Variable values in proto order (CpSolverResponse.solution)
+        
+        Returns:
+            Tuple (rows, columns) of np.ndarray, in candidate_pairs order
+        """
+        values = np.fromiter(solution, dtype=np.int64, count=len(solution))[:self.num_pairs]
+        chosen = values == 1
+        return self.pair_rows[chosen], self.pair_columns[chosen]
+
+
+def build_model(
+    model,
+    problem: ProblemMatrix,
+    include_soft_constraints: bool = True,
+    maximize_placements: bool = False,
+    min_students_per_class: int = 2,
+    max_students_per_class: int = 3
+) -> ModelLayout:
+    """Fill an empty CpModel with the phase 2 model of a problem.
+    
+    Args:
+        model: Empty cp_model.CpModel
+        problem: Shared problem matrix (students × slots)
+        include_soft_constraints: Whether to include soft constraints
+        maximize_placements: If True, maximize number of placements (partial solution)
+        min_students_per_class: Smallest class that may open
+        max_students_per_class: Largest class
+    
+    Returns:
+        ModelLayout of the variables
+    """
+    proto = model.Proto()
+    pair_rows, pair_columns = problem.candidate_pairs()
+    num_pairs = pair_rows.size
+    
+    # Proto variable of each (row, column) assignment, -1 if none
+    pair_index = np.full(problem.availability.shape, -1, dtype=np.int64)
+    pair_index[pair_rows, pair_columns] = np.arange(num_pairs)
+    
+    # Slots in order of first appearance among the pairs; each slot's
+    # assignments in row order (stable sort)
+    columns, first_pair = np.unique(pair_columns, return_index=True)
+    slot_columns = columns[np.argsort(first_pair)]
+    slot_order = np.empty(problem.num_slots, dtype=np.int64)
+    slot_order[slot_columns] = np.arange(slot_columns.size)
+    pair_slots = slot_order[pair_columns]
+    by_slot = np.argsort(pair_slots, kind="stable")
+    slot_ends = np.cumsum(np.bincount(pair_slots, minlength=slot_columns.size))
+    slot_vars = [chunk.tolist() for chunk in np.split(by_slot, slot_ends[:-1])] if slot_columns.size else []
+    
+    _add_bool_vars(proto, num_pairs + slot_columns.size)
+    slot_used = np.arange(num_pairs, num_pairs + slot_columns.size, dtype=np.int64)
+    
+    # HARD CONSTRAINTS
+    
+    # Constraint 1: Each student placed exactly sessions_per_week times
+    # (remaining sessions after skeleton). Pairs are row-major, so each
+    # student's assignments are one contiguous range
+    remaining = problem.remaining_student_indices()
+    row_bounds = np.searchsorted(pair_rows, np.append(remaining, problem.num_students))
+    for i, start, end in zip(remaining.tolist(), row_bounds[:-1].tolist(), row_bounds[1:].tolist()):
+        if start == end:
+            # No candidate slot left: an empty clause (always false), as
+            # Add(sum([]) == n) builds. Mutable access sets the oneof
+            proto.constraints.add().bool_or.literals.extend([])
+            continue
+        sessions = int(problem.remaining_sessions[i])
+        _add_linear(proto, list(range(start, end)), None, sessions, sessions)
+    
+    # Constraint 2: slot capacity (min-max students per class)
+    for vars_list, used in zip(slot_vars, slot_used.tolist()):
+        _add_linear(proto, vars_list, None, 1, INT64_MAX, enforcement=used)
+        _add_linear(proto, vars_list, None, 0, 0, enforcement=-used - 1)
+        _add_linear(proto, vars_list, None, min_students_per_class, INT64_MAX, enforcement=used)
+        _add_linear(proto, vars_list, None, INT64_MIN, max_students_per_class, enforcement=used)
+    
+    # Constraint 3: UN SEUL COURS À LA FOIS, one AddAtMostOne per time point
+    used_by_column = np.full(problem.num_slots, -1, dtype=np.int64)
+    used_by_column[slot_columns] = slot_used
+    for clique in problem.overlap_cliques(np.sort(slot_columns)):
+        proto.constraints.add().at_most_one.literals.extend(used_by_column[clique].tolist())
+    
+    # No skeleton overlap constraint needed: candidate slots already exclude
+    # every slot overlapping the skeleton (see ProblemMatrix.build)
+    
+    # Constraint 4: Linked groups (partial linking)
+    _add_linked_groups(proto, problem, pair_index)
+    
+    # SOFT CONSTRAINTS (if enabled)
+    # Soft 1: Respect recurring habits (weight 10)
+    # TODO: Implement if we have recurring habit data
+    
+    # Soft 2: Balance load per day (weight 5)
+    # TODO: Implement day balance penalty
+    
+    # OBJECTIVE (stored minimized: scaling_factor -1 maximizes)
+    if maximize_placements:
+        # Maximize total placements (for partial solution)
+        coefficient = -1
+    elif include_soft_constraints:
+        # Soft 3: Fill existing classes 2→3 before new slot (weight 3):
+        # -3 per assignment, every assignment belongs to one slot
+        coefficient = 3
+    else:
+        coefficient = 0
+    if coefficient and num_pairs:
+        proto.objective.vars.extend(range(num_pairs))
+        proto.objective.coeffs.extend([coefficient] * num_pairs)
+        proto.objective.scaling_factor = -1
+    
+    return ModelLayout(
+        pair_rows=pair_rows,
+        pair_columns=pair_columns,
+        slot_columns=slot_columns,
+        slot_used=slot_used
+    )
+
+
+def constraint_kind(constraint) -> Optional[str]:
+    """Body a ConstraintProto holds ("linear", "at_most_one", ...), None if empty.
+    
+    OR-Tools exposes the proto either as protobuf messages (the pinned
+    9.8: WhichOneof, HasField) or, in later releases, as pybind11 objects
+    (has_<kind>() only); this reads both.
+    """
+    which_oneof = getattr(constraint, "WhichOneof", None)
+    if which_oneof is not None:
+        return which_oneof("constraint")
+    return next((kind for kind in _constraint_kinds() if getattr(constraint, f"has_{kind}")()), None)
+
+
+@lru_cache(maxsize=None)
+def _constraint_kinds() -> Tuple[str, ...]:
+    """Fields of the ConstraintProto "constraint" oneof (from the shipped cp_model_pb2)."""
+    from ortools.sat import cp_model_pb2
+    return tuple(field.name for field in cp_model_pb2.ConstraintProto.DESCRIPTOR.oneofs_by_name["constraint"].fields)
+
+
+def _add_bool_vars(proto, count: int) -> None:
+    """Append count Boolean variables (domain [0, 1])."""
+    for _ in range(count):
+        proto.variables.add().domain.extend([0, 1])
+
+
+def _add_linear(proto, vars_list: List[int], coeffs, lower: int, upper: int, enforcement=None) -> None:
+    """Append lower <= sum(coeffs · vars) <= upper (coefficients 1 if coeffs is None)."""
+    constraint = proto.constraints.add()
+    if enforcement is not None:
+        constraint.enforcement_literal.append(enforcement)
+    linear = constraint.linear
+    linear.vars.extend(vars_list)
+    linear.coeffs.extend(coeffs if coeffs is not None else [1] * len(vars_list))
+    linear.domain.extend([lower, upper])
+
+
+def _add_linked_groups(proto, problem: ProblemMatrix, pair_index: np.ndarray) -> None:
+    """Linked students share at least min(remaining sessions) classes.
+    
+    One "together" literal per candidate slot common to the group, equal
+    to the conjunction of the members' assignments there: it implies each
+    assignment (one bool_and enforced by the literal), and the assignments
+    together imply it (one clause), then sum(together) >= min_together.
+    The clause is not needed for correctness, but without it assignments
+    never propagate to the together literals, and link-heavy rosters
+    solved markedly slower (scripts/benchmark_model.py). Both are boolean
+    clauses, instead of a product (AddMultiplicationEquality) per slot.
+    
+    Members with no remaining sessions (placed by the skeleton, or pruned
+    by presolve) drop out of their group; the others stay linked.
+    """
+    for group in problem.linked_groups:
+        members = [i for i in group if problem.remaining_sessions[i] > 0]
+        if len(members) < 2:
+            continue
+        
+        # Min sessions together = min(sessions) over the group
+        min_together = int(problem.remaining_sessions[members].min())
+        
+        common_columns = np.flatnonzero(problem.availability[members].all(axis=0) & problem.is_candidate)
+        if common_columns.size == 0:
+            continue
+        
+        together = len(proto.variables)
+        _add_bool_vars(proto, common_columns.size)
+        assignments = pair_index[np.ix_(members, common_columns)].T.tolist()
+        for k, literals in enumerate(assignments):
+            constraint = proto.constraints.add()
+            constraint.enforcement_literal.append(together + k)
+            constraint.bool_and.literals.extend(literals)
+            # All assigned ⇒ together: not(a) or not(b) or together
+            proto.constraints.add().bool_or.literals.extend([-literal - 1 for literal in literals] + [together + k])
+        
+        # At least min_together sessions together
+        _add_linear(proto, list(range(together, together + common_columns.size)), None, min_together, INT64_MAX)
@@ -3,7 +3,9 @@ Data models for the scheduling system.
 
 This module contains all data structures (dataclasses) used across the system:
 - Slot: Time slot representation
-- Student: Student information with availability
+- SlotSet: Bitmap set of slots (union/intersection/difference, overlap expansion)
+- TimeRange: Availability range on one day (expanded to 1h slots on demand)
+- Student: Student information with availability (per-day ranges)
 - ScheduledClass: A scheduled class with assigned students
 - ScheduleResult: Complete scheduling output with metadata
 - UnplacedStudent: Student that couldn't be placed
@@ -11,15 +13,239 @@ This module contains all data structures (dataclasses) used across the system:
 - ValidationResult: Skeleton validation output
 - SchedulingConstraints: Algorithm constraints
 
-Uses dataclasses for Python 3.10+ with type hints.
+Slots live on a fixed weekly grid (6 days x 48 half-hours). Every slot maps
+to a small integer ID (compute_slot_id) and can be interned (Slot.from_id),
+so set operations and dict lookups on slots are integer operations.
+
+Uses dataclasses for Python 3.10+ with type hints. Slot, Student,
+ScheduledClass and UnplacedStudent are frozen and use __slots__ (no
+per-instance __dict__) to keep large rosters compact.
 """
 
+import threading
 from dataclasses import dataclass, field
 from datetime import time
-from typing import List, Optional, Dict, Any
+from functools import lru_cache, total_ordering
+from itertools import chain
+from typing import List, Optional, Dict, Any, Tuple
 from enum import Enum
 
 
+# ============================================================================
+# WEEKLY SLOT GRID
+# ============================================================================
+
+# French day names in week order - dimanche excluded as coach doesn't work Sundays
+WEEK_DAYS = ("lundi", "mardi", "mercredi", "jeudi", "vendredi", "samedi")
+HALF_HOURS_PER_DAY = 48
+GRID_SIZE = len(WEEK_DAYS) * HALF_HOURS_PER_DAY  # 288 half-hour start positions
+STANDARD_DURATION = 2  # Courses last 1h = 2 half-hours
+SLOT_ID_COUNT = GRID_SIZE * HALF_HOURS_PER_DAY  # IDs reserved for on-grid slots
+
+_DAY_INDEX = {day: i for i, day in enumerate(WEEK_DAYS)}
+
+# Off-grid slots (unknown day, minutes not :00/:30, empty range) can still be
+# built by hand; they get stable IDs >= SLOT_ID_COUNT from this registry.
+_OFF_GRID_IDS: Dict[Tuple[str, time, time], int] = {}
+_OFF_GRID_KEYS: List[Tuple[str, time, time]] = []
+_OFF_GRID_LOCK = threading.Lock()
+
+# Interned Slot instances, keyed by (slot_id, is_recurring)
+_INTERNED_SLOTS: Dict[Tuple[int, bool], 'Slot'] = {}
+
+# Distinct availability masks whose slot tuple is kept for sharing (LRU)
+MASK_TEMPLATE_CACHE_SIZE = 4096
+
+# Distinct (day, start, end) ranges whose expansion is kept (LRU)
+EXPANSION_CACHE_SIZE = 1024
+
+# Latest end of a 1h slot expanded from a range (no slot starts at 23:00 or later)
+_LAST_SLOT_END_MINUTES = 23 * 60 + 30
+
+# Interned TimeRange instances, keyed by (day, start_minutes, end_minutes)
+_INTERNED_RANGES: Dict[Tuple[str, int, int], 'TimeRange'] = {}
+
+
+def _grid_slot_id(day: str, start_time: time, end_time: time) -> Optional[int]:
+    """Compute the on-grid ID of a slot, or None if it doesn't fit the grid."""
+    day_index = _DAY_INDEX.get(day)
+    if day_index is None:
+        return None
+    if start_time.minute % 30 or end_time.minute % 30:
+        return None
+    if start_time.second or end_time.second:
+        return None
+    
+    start_index = start_time.hour * 2 + start_time.minute // 30
+    end_index = end_time.hour * 2 + end_time.minute // 30
+    duration = end_index - start_index
+    if duration <= 0:
+        return None
+    
+    # Duration code 0 is the standard 1h course, so 1h slots get IDs 0..287
+    duration_code = (duration - STANDARD_DURATION) % HALF_HOURS_PER_DAY
+    return duration_code * GRID_SIZE + day_index * HALF_HOURS_PER_DAY + start_index
+
+
+def compute_slot_id(day: str, start_time: time, end_time: time) -> int:
+    """Return the canonical integer ID of a (day, start, end) slot.
+    
+    On-grid IDs are laid out as ``duration_code * GRID_SIZE + day * 48 + start``
+    where ``start`` is the half-hour index of the start time. Standard 1h slots
+    therefore occupy IDs 0..287 in chronological order, so their ID doubles as
+    a bit position in availability masks.
+    
+    Args:
+        day: Day name (lowercase French)
+        start_time: Slot start
+        end_time: Slot end
+    
+    Returns:
+        Small integer uniquely identifying the slot
+    """
+    grid_id = _grid_slot_id(day, start_time, end_time)
+    if grid_id is not None:
+        return grid_id
+    
+    key = (day, start_time, end_time)
+    off_grid_id = _OFF_GRID_IDS.get(key)
+    if off_grid_id is None:
+        with _OFF_GRID_LOCK:
+            off_grid_id = _OFF_GRID_IDS.get(key)
+            if off_grid_id is None:
+                off_grid_id = SLOT_ID_COUNT + len(_OFF_GRID_KEYS)
+                _OFF_GRID_KEYS.append(key)
+                _OFF_GRID_IDS[key] = off_grid_id
+    return off_grid_id
+
+
+def decode_slot_id(slot_id: int) -> Tuple[str, time, time]:
+    """Inverse of compute_slot_id: return (day, start_time, end_time).
+    
+    Raises:
+        ValueError: If slot_id does not correspond to any slot
+    """
+    if slot_id < 0:
+        raise ValueError(f"Invalid slot ID: {slot_id}")
+    
+    if slot_id >= SLOT_ID_COUNT:
+        try:
+            return _OFF_GRID_KEYS[slot_id - SLOT_ID_COUNT]
+        except IndexError:
+            raise ValueError(f"Unknown slot ID: {slot_id}")
+    
+    duration_code, position = divmod(slot_id, GRID_SIZE)
+    day_index, start_index = divmod(position, HALF_HOURS_PER_DAY)
+    duration = (duration_code + STANDARD_DURATION - 1) % HALF_HOURS_PER_DAY + 1
+    end_index = start_index + duration
+    if end_index >= HALF_HOURS_PER_DAY:
+        raise ValueError(f"Invalid slot ID: {slot_id} (slot ends after midnight)")
+    
+    return (
+        WEEK_DAYS[day_index],
+        time(hour=start_index // 2, minute=(start_index % 2) * 30),
+        time(hour=end_index // 2, minute=(end_index % 2) * 30),
+    )
+
+
+def slots_to_mask(slots) -> int:
+    """Pack slots into an availability mask (bit N set = slot ID N present)."""
+    mask = 0
+    for slot in slots:
+        mask |= 1 << slot.id
+    return mask
+
+
+def iter_slot_ids(mask: int):
+    """Yield the slot IDs set in a mask, in increasing order."""
+    while mask:
+        lowest_bit = mask & -mask
+        yield lowest_bit.bit_length() - 1
+        mask ^= lowest_bit
+
+
+# ============================================================================
+# SLOT OVERLAP INDEX
+# ============================================================================
+
+_GRID_ID_MASK = (1 << SLOT_ID_COUNT) - 1
+
+
+def _minutes_range(slot_id: int) -> Tuple[str, int, int]:
+    """Return (day, start_minutes, end_minutes) for a slot ID."""
+    day, start_time, end_time = decode_slot_id(slot_id)
+    return (
+        day,
+        start_time.hour * 60 + start_time.minute,
+        end_time.hour * 60 + end_time.minute,
+    )
+
+
+@lru_cache(maxsize=None)
+def overlap_mask(slot_id: int) -> int:
+    """Mask of every on-grid slot ID overlapping this slot (itself included).
+    
+    The overlap relation on the weekly grid is fixed, so each row of this bit
+    matrix is computed once and cached. For a given duration, overlapping
+    start positions form a contiguous run, so a row is built with one shift
+    per duration instead of a scan over all slots.
+    """
+    day, start_min, end_min = _minutes_range(slot_id)
+    day_index = _DAY_INDEX.get(day)
+    if day_index is None:
+        return 0
+    
+    mask = 0
+    day_base = day_index * HALF_HOURS_PER_DAY
+    # Half-open overlap: other_start < end AND start < other_start + duration
+    last_start = -(-end_min // 30) - 1
+    for duration in range(1, HALF_HOURS_PER_DAY):
+        low = max(0, start_min // 30 - duration + 1)
+        high = min(last_start, HALF_HOURS_PER_DAY - 1 - duration)
+        if low > high:
+            continue
+        duration_code = (duration - STANDARD_DURATION) % HALF_HOURS_PER_DAY
+        base = duration_code * GRID_SIZE + day_base
+        mask |= ((1 << (high - low + 1)) - 1) << (base + low)
+    return mask
+
+
+def slots_overlap(slot_id1: int, slot_id2: int) -> bool:
+    """O(1) check whether two slots overlap (half-open intervals)."""
+    if slot_id2 < SLOT_ID_COUNT:
+        return (overlap_mask(slot_id1) >> slot_id2) & 1 == 1
+    if slot_id1 < SLOT_ID_COUNT:
+        return (overlap_mask(slot_id2) >> slot_id1) & 1 == 1
+    
+    # Both off-grid: plain interval comparison
+    day1, start1, end1 = _minutes_range(slot_id1)
+    day2, start2, end2 = _minutes_range(slot_id2)
+    return day1 == day2 and start1 < end2 and start2 < end1
+
+
+def conflict_mask(slot_id: int, candidates_mask: int) -> int:
+    """Subset of candidates_mask whose slots overlap slot_id.
+    
+    The slot itself is included if present in candidates_mask (a slot
+    overlaps itself); callers exclude it when needed.
+    """
+    conflicts = overlap_mask(slot_id) & candidates_mask
+    
+    # Off-grid candidates are rare (hand-built slots): check them one by one
+    off_grid = candidates_mask & ~_GRID_ID_MASK
+    for other_id in iter_slot_ids(off_grid):
+        if slots_overlap(slot_id, other_id):
+            conflicts |= 1 << other_id
+    return conflicts
+
+
+def conflicting_slot_ids(slot_id: int, candidates_mask: int):
+    """Yield the IDs of candidate slots that overlap slot_id, excluding itself."""
+    for other_id in iter_slot_ids(conflict_mask(slot_id, candidates_mask)):
+        if other_id != slot_id:
+            yield other_id
+
+
 class SlotStatus(Enum):
     """Status of a scheduled class."""
     LOCKED = "locked"  # Recurring or manually locked
@@ -45,34 +271,72 @@ class SchedulingConstraints:
     max_timeout_sec: float = 15.0  # Progressive timeout strategy
 
 
-@dataclass
+@total_ordering
+@dataclass(frozen=True, eq=False, slots=True)
 class Slot:
     """Represents a time slot for a class.
     
     Time interval semantics: Half-open intervals [start, end)
     Example: 09:00-10:00 means starts at 09:00:00, ends at 09:59:59
+    
+    Each slot carries a small integer ``id`` (see compute_slot_id) used for
+    hashing, equality and ordering. Use Slot.from_id() to get the shared
+    interned instance instead of allocating a new one. Slots are immutable
+    (frozen, __slots__) so interned instances can be shared safely.
     """
     day: str  # lowercase French day name: lundi, mardi, mercredi, jeudi, vendredi, samedi (no dimanche)
     start_time: time
     end_time: time
     is_recurring: bool = False
+    id: int = field(init=False, repr=False, compare=False)
+    start_minutes: int = field(init=False, repr=False, compare=False)  # minutes since midnight
+    end_minutes: int = field(init=False, repr=False, compare=False)
+    half_hour_index: int = field(init=False, repr=False, compare=False)  # weekly grid start, -1 if off-grid
     
-    def duration_hours(self) -> float:
-        """Calculate duration in hours. Must be exactly 1h for valid courses."""
+    def __post_init__(self):
         start_minutes = self.start_time.hour * 60 + self.start_time.minute
         end_minutes = self.end_time.hour * 60 + self.end_time.minute
-        return (end_minutes - start_minutes) / 60.0
+        day_index = _DAY_INDEX.get(self.day)
+        if day_index is None or start_minutes % 30:
+            half_hour_index = -1
+        else:
+            half_hour_index = day_index * HALF_HOURS_PER_DAY + start_minutes // 30
+        object.__setattr__(self, "id", compute_slot_id(self.day, self.start_time, self.end_time))
+        object.__setattr__(self, "start_minutes", start_minutes)
+        object.__setattr__(self, "end_minutes", end_minutes)
+        object.__setattr__(self, "half_hour_index", half_hour_index)
+    
+    @classmethod
+    def from_id(cls, slot_id: int, is_recurring: bool = False) -> 'Slot':
+        """Return the interned Slot instance for a slot ID.
+        
+        Raises:
+            ValueError: If slot_id does not correspond to any slot
+        """
+        key = (slot_id, is_recurring)
+        slot = _INTERNED_SLOTS.get(key)
+        if slot is None:
+            day, start_time, end_time = decode_slot_id(slot_id)
+            slot = _INTERNED_SLOTS.setdefault(key, cls(day, start_time, end_time, is_recurring))
+        return slot
+    
+    @classmethod
+    def intern(cls, day: str, start_time: time, end_time: time, is_recurring: bool = False) -> 'Slot':
+        """Return the interned Slot instance for (day, start, end)."""
+        return cls.from_id(compute_slot_id(day, start_time, end_time), is_recurring)
+    
+    def duration_hours(self) -> float:
+        """Calculate duration in hours. Must be exactly 1h for valid courses."""
+        return (self.end_minutes - self.start_minutes) / 60.0
     
     def is_valid(self) -> bool:
         """Validate slot: duration must be 1h, times must be :00 or :30."""
         # Check duration
-        if abs(self.duration_hours() - 1.0) > 0.01:  # Allow small float errors
+        if self.end_minutes - self.start_minutes != 60:
             return False
         
         # Check granularity (:00 or :30 only)
-        if self.start_time.minute not in [0, 30]:
-            return False
-        if self.end_time.minute not in [0, 30]:
+        if self.start_minutes % 30 or self.end_minutes % 30:
             return False
         
         # Check start < end
@@ -85,74 +349,386 @@ class Slot:
         """Check if this slot overlaps with another slot on the same day.
         
         Uses half-open interval logic: [start, end)
-        Overlap check: start1 < end2 AND start2 < end1
+        Overlap check: start1 < end2 AND start2 < end1 (looked up in the
+        precomputed overlap index, see overlap_mask)
         """
-        if self.day != other.day:
-            return False
-        
-        # Convert to minutes for comparison
-        self_start_min = self.start_time.hour * 60 + self.start_time.minute
-        self_end_min = self.end_time.hour * 60 + self.end_time.minute
-        other_start_min = other.start_time.hour * 60 + other.start_time.minute
-        other_end_min = other.end_time.hour * 60 + other.end_time.minute
-        
-        return self_start_min < other_end_min and other_start_min < self_end_min
+        return slots_overlap(self.id, other.id)
     
     def __hash__(self):
-        """Make Slot hashable for use in dicts/sets."""
-        return hash((self.day, self.start_time, self.end_time))
+        """Make Slot hashable for use in dicts/sets (hash of the slot ID)."""
+        return self.id
     
     def __eq__(self, other):
-        """Equality check for Slot."""
+        """Equality check for Slot (same slot ID, is_recurring ignored)."""
         if not isinstance(other, Slot):
             return False
-        return (self.day == other.day and 
-                self.start_time == other.start_time and 
-                self.end_time == other.end_time)
+        return self.id == other.id
+    
+    def __lt__(self, other):
+        """Order slots by ID (chronological for 1h slots)."""
+        if not isinstance(other, Slot):
+            return NotImplemented
+        return self.id < other.id
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class SlotSet:
+    """Immutable set of slots backed by a bitmap over slot IDs.
+    
+    Bit N set = slot ID N is a member (same layout as Student.availability_mask),
+    so union, intersection and difference are single integer operations.
+    Iteration yields interned slots in ID order (chronological for 1h slots).
+    """
+    mask: int = 0
+    
+    @classmethod
+    def from_slots(cls, slots) -> 'SlotSet':
+        return cls(slots_to_mask(slots))
+    
+    @classmethod
+    def union_of(cls, sets) -> 'SlotSet':
+        """Union of many SlotSets (or raw masks) in one pass."""
+        mask = 0
+        for other in sets:
+            mask |= other.mask if isinstance(other, SlotSet) else other
+        return cls(mask)
+    
+    def __or__(self, other: 'SlotSet') -> 'SlotSet':
+        return SlotSet(self.mask | other.mask)
+    
+    def __and__(self, other: 'SlotSet') -> 'SlotSet':
+        return SlotSet(self.mask & other.mask)
+    
+    def __sub__(self, other: 'SlotSet') -> 'SlotSet':
+        return SlotSet(self.mask & ~other.mask)
+    
+    def __contains__(self, slot) -> bool:
+        slot_id = slot.id if isinstance(slot, Slot) else slot
+        return (self.mask >> slot_id) & 1 == 1
+    
+    def __len__(self) -> int:
+        return self.mask.bit_count()
+    
+    def __bool__(self) -> bool:
+        return self.mask != 0
+    
+    def __iter__(self):
+        for slot_id in iter_slot_ids(self.mask):
+            yield Slot.from_id(slot_id)
+    
+    def ids(self):
+        """Yield member slot IDs in increasing order."""
+        return iter_slot_ids(self.mask)
+    
+    def expand_overlapping(self, within: Optional['SlotSet'] = None) -> 'SlotSet':
+        """Every slot overlapping at least one member (members included).
+        
+        Args:
+            within: Restrict the result to these slots. Required to catch
+                off-grid slots, which the grid overlap index does not list.
+        
+        Returns:
+            SlotSet of overlapping slots
+        """
+        expanded = 0
+        if within is None:
+            for slot_id in iter_slot_ids(self.mask):
+                expanded |= overlap_mask(slot_id) | (1 << slot_id)
+        else:
+            for slot_id in iter_slot_ids(self.mask):
+                expanded |= conflict_mask(slot_id, within.mask)
+        return SlotSet(expanded)
+    
+    def without_overlapping(self, blocked: 'SlotSet') -> 'SlotSet':
+        """Members that overlap no slot of blocked (partial overlaps included)."""
+        return self - blocked.expand_overlapping(within=self)
+
+
+# Templates are built from blocks of one day of 1h slot IDs
+_TEMPLATE_BLOCK = (1 << HALF_HOURS_PER_DAY) - 1
+
+
+@lru_cache(maxsize=MASK_TEMPLATE_CACHE_SIZE)
+def _mask_template(availability_mask: int) -> Tuple[Slot, ...]:
+    """Interned slots of a mask, in ID order.
+    
+    Rosters reuse a handful of availability patterns, so students with the
+    same mask share one tuple. Masks are split into 48-ID blocks (a day of
+    1h slots) whose slot tuples are memoized too: a new combination of
+    standard day ranges is a concatenation, not a slot-by-slot rebuild.
+    """
+    blocks = []
+    remaining = availability_mask
+    while remaining:
+        shift = (((remaining & -remaining).bit_length() - 1) // HALF_HOURS_PER_DAY) * HALF_HOURS_PER_DAY
+        blocks.append(_block_template(shift, (remaining >> shift) & _TEMPLATE_BLOCK))
+        remaining &= ~(_TEMPLATE_BLOCK << shift)
+    return blocks[0] if len(blocks) == 1 else tuple(chain.from_iterable(blocks))
+
+
+@lru_cache(maxsize=MASK_TEMPLATE_CACHE_SIZE)
+def _block_template(shift: int, block: int) -> Tuple[Slot, ...]:
+    return tuple(Slot.from_id(shift + bit) for bit in iter_slot_ids(block))
+
+
+@dataclass(frozen=True, slots=True)
+class TimeRange:
+    """Availability range on one day: [start, end) in minutes since midnight.
+    
+    A range offers one 1h slot every hour from its start (08:30-11:00 →
+    08:30-09:30, 09:30-10:30). Ranges are interned (TimeRange.of) and their
+    expansion is memoized, so students only hold references to them.
+    """
+    day: str
+    start_minutes: int
+    end_minutes: int
+    
+    @classmethod
+    def of(cls, day: str, start_minutes: int, end_minutes: int) -> 'TimeRange':
+        """Return the interned range for (day, start, end)."""
+        key = (day, start_minutes, end_minutes)
+        time_range = _INTERNED_RANGES.get(key)
+        if time_range is None:
+            time_range = _INTERNED_RANGES.setdefault(key, cls(day, start_minutes, end_minutes))
+        return time_range
+    
+    @classmethod
+    def from_times(cls, day: str, start_time: time, end_time: time) -> 'TimeRange':
+        return cls.of(day, start_time.hour * 60 + start_time.minute, end_time.hour * 60 + end_time.minute)
+    
+    @property
+    def start_time(self) -> time:
+        return time(hour=self.start_minutes // 60, minute=self.start_minutes % 60)
+    
+    @property
+    def end_time(self) -> time:
+        return time(hour=self.end_minutes // 60, minute=self.end_minutes % 60)
+    
+    def contains(self, day: str, start_minutes: int, end_minutes: int) -> bool:
+        """O(1) check that [start, end) on day lies within this range."""
+        return day == self.day and self.start_minutes <= start_minutes and end_minutes <= self.end_minutes
+    
+    def covers(self, slot: Slot) -> bool:
+        """Check the slot lies within this range (e.g. 08:30-09:30 within 08:00-13:00)."""
+        return self.contains(slot.day, slot.start_minutes, slot.end_minutes)
+    
+    def slots(self) -> Tuple[Slot, ...]:
+        """1h interned slots of the range (shared tuple, see EXPANSION_CACHE_SIZE)."""
+        return _range_template(self)[0]
+    
+    @property
+    def mask(self) -> int:
+        """Availability mask of slots()."""
+        return _range_template(self)[1]
+    
+    def __str__(self) -> str:
+        return f"{self.day} {self.start_time.strftime('%H:%M')}-{self.end_time.strftime('%H:%M')}"
+
+
+@lru_cache(maxsize=EXPANSION_CACHE_SIZE)
+def _range_template(time_range: TimeRange) -> Tuple[Tuple[Slot, ...], int]:
+    """Expand a range once: (slots, mask)."""
+    slots = []
+    start = time_range.start_minutes
+    while start + 60 <= min(time_range.end_minutes, _LAST_SLOT_END_MINUTES):
+        slots.append(Slot.intern(
+            time_range.day,
+            time(hour=start // 60, minute=start % 60),
+            time(hour=start // 60 + 1, minute=start % 60)
+        ))
+        start += 60
+    return tuple(slots), slots_to_mask(slots)
+
+
+def _week_order(time_range: TimeRange) -> Tuple[int, str, int, int]:
+    return (
+        _DAY_INDEX.get(time_range.day, len(WEEK_DAYS)), time_range.day,
+        time_range.start_minutes, time_range.end_minutes
+    )
+
+
+def _ranges_from_slots(slots) -> Tuple[TimeRange, ...]:
+    """Merge slots into per-day ranges (overlapping or touching slots join)."""
+    ranges = []
+    for slot in sorted(slots, key=lambda s: (_DAY_INDEX.get(s.day, len(WEEK_DAYS)), s.day, s.start_minutes)):
+        if ranges and ranges[-1][0] == slot.day and slot.start_minutes <= ranges[-1][2]:
+            ranges[-1][2] = max(ranges[-1][2], slot.end_minutes)
+        else:
+            ranges.append([slot.day, slot.start_minutes, slot.end_minutes])
+    return tuple(TimeRange.of(day, start, end) for day, start, end in ranges)
+
+
+@lru_cache(maxsize=MASK_TEMPLATE_CACHE_SIZE)
+def _mask_ranges(availability_mask: int) -> Tuple[TimeRange, ...]:
+    return _ranges_from_slots(_mask_template(availability_mask))
+
+
+@dataclass(frozen=True, slots=True, init=False)
 class Student:
-    """Represents a student with their availability and constraints."""
+    """Represents a student with their availability and constraints.
+    
+    Availability is kept natively as per-day ranges (``availability_ranges``,
+    in week order, several per day allowed) and ``availability_mask`` (bit N
+    set = available on slot ID N), both built once at construction.
+    ``available_slots`` is a view of the mask's 1h interned slots, computed
+    on first access and shared by every student with the same mask.
+    
+    Built from slots (``Student(name, sessions, available_slots=[...])``),
+    the slots are kept as given and the ranges are their per-day union.
+    """
     name: str
     sessions_per_week: int
-    available_slots: List[Slot] = field(default_factory=list)
-    linked_group: Optional[str] = None  # Name of linked student (partial linking supported)
+    availability_ranges: Tuple[TimeRange, ...] = ()
+    linked_group: Optional[str] = None  # Linked student name(s), ';'-separated (partial linking supported)
     notes: str = ""
+    availability_mask: int = field(default=0, repr=False)
+    _slot_view: Optional[Tuple[Slot, ...]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __init__(
+        self,
+        name: str,
+        sessions_per_week: int,
+        available_slots=(),
+        linked_group: Optional[str] = None,
+        notes: str = "",
+        availability_ranges=None,
+        availability_mask: Optional[int] = None
+    ):
+        slot_view = None
+        if available_slots:
+            slot_view = tuple(Slot.from_id(slot.id, slot.is_recurring) for slot in available_slots)
+            if availability_ranges is None:
+                availability_ranges = _ranges_from_slots(slot_view)
+            if availability_mask is None:
+                availability_mask = slots_to_mask(slot_view)
+        
+        ranges = tuple(sorted(availability_ranges or (), key=_week_order))
+        if availability_mask is None:
+            availability_mask = 0
+            for time_range in ranges:
+                availability_mask |= time_range.mask
+        
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "sessions_per_week", sessions_per_week)
+        object.__setattr__(self, "availability_ranges", ranges)
+        object.__setattr__(self, "linked_group", linked_group)
+        object.__setattr__(self, "notes", notes)
+        object.__setattr__(self, "availability_mask", availability_mask)
+        object.__setattr__(self, "_slot_view", slot_view)
+    
+    @classmethod
+    def from_ranges(
+        cls,
+        name: str,
+        sessions_per_week: int,
+        availability_ranges,
+        linked_group: Optional[str] = None,
+        notes: str = "",
+        availability_mask: Optional[int] = None
+    ) -> 'Student':
+        """Build a student from availability ranges.
+        
+        Args:
+            availability_ranges: TimeRange objects (any order)
+            availability_mask: Mask of the ranges, if already known
+                (default: OR of each range's memoized mask)
+        """
+        return cls(
+            name=name,
+            sessions_per_week=sessions_per_week,
+            linked_group=linked_group,
+            notes=notes,
+            availability_ranges=availability_ranges,
+            availability_mask=availability_mask
+        )
+    
+    @classmethod
+    def from_mask(
+        cls,
+        name: str,
+        sessions_per_week: int,
+        availability_mask: int,
+        linked_group: Optional[str] = None,
+        notes: str = ""
+    ) -> 'Student':
+        """Build a student from an availability mask (slots in ID order).
+        
+        Ranges are the per-day union of the mask's slots. Both the slot
+        tuple and the ranges come from bounded caches shared by every
+        student with the same mask (see MASK_TEMPLATE_CACHE_SIZE).
+        """
+        return cls(
+            name=name,
+            sessions_per_week=sessions_per_week,
+            linked_group=linked_group,
+            notes=notes,
+            availability_ranges=_mask_ranges(availability_mask),
+            availability_mask=availability_mask
+        )
+    
+    @property
+    def available_slots(self) -> Tuple[Slot, ...]:
+        """1h slots the student can take (ID order unless given explicitly)."""
+        slot_view = self._slot_view
+        if slot_view is None:
+            slot_view = _mask_template(self.availability_mask)
+            object.__setattr__(self, "_slot_view", slot_view)
+        return slot_view
+    
+    def ranges_on(self, day: str) -> Tuple[TimeRange, ...]:
+        """Availability ranges on a day, chronological."""
+        return tuple(time_range for time_range in self.availability_ranges if time_range.day == day)
+    
+    def covers(self, slot: Slot) -> bool:
+        """Check a slot lies within one of the availability ranges.
+        
+        Unlike is_available_for, the slot need not be one of the expanded
+        1h slots (08:30-09:30 is covered by 08:00-13:00).
+        """
+        return any(time_range.covers(slot) for time_range in self.availability_ranges)
+    
+    def is_available_for(self, slot: Slot) -> bool:
+        """Check if the student is available on this exact slot."""
+        return (self.availability_mask >> slot.id) & 1 == 1
+    
+    def availability_count(self) -> int:
+        """Number of distinct slots the student is available on."""
+        return self.availability_mask.bit_count()
+    
+    @property
+    def linked_names(self) -> Tuple[str, ...]:
+        """Names of the linked students (linked_group lists one or several, ';'-separated)."""
+        if not self.linked_group:
+            return ()
+        return tuple(name.strip() for name in self.linked_group.split(";") if name.strip())
     
     def has_overlapping_availability(self, other: 'Student') -> bool:
         """Check if this student has overlapping availability with another student.
         Required for linked groups (partial linking).
         """
-        for slot1 in self.available_slots:
-            for slot2 in other.available_slots:
-                # Check if slots are on same day and same time
-                if (slot1.day == slot2.day and 
-                    slot1.start_time == slot2.start_time and 
-                    slot1.end_time == slot2.end_time):
-                    return True
-        return False
+        return (self.availability_mask & other.availability_mask) != 0
     
     def get_overlapping_slots(self, other: 'Student') -> List[Slot]:
-        """Get list of slots where both students are available."""
-        overlapping = []
-        for slot1 in self.available_slots:
-            for slot2 in other.available_slots:
-                if (slot1.day == slot2.day and 
-                    slot1.start_time == slot2.start_time and 
-                    slot1.end_time == slot2.end_time):
-                    overlapping.append(slot1)
-                    break
-        return overlapping
+        """Get list of slots where both students are available (chronological)."""
+        common_mask = self.availability_mask & other.availability_mask
+        return [Slot.from_id(slot_id) for slot_id in iter_slot_ids(common_mask)]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScheduledClass:
-    """Represents a scheduled class with students assigned."""
+    """Represents a scheduled class with students assigned.
+    
+    Students are stored as a tuple (any sequence given is converted), so a
+    class cannot change once built and stays hashable.
+    """
     slot: Slot
-    students: List[str]  # Student names
+    students: Tuple[str, ...]  # Student names
     status: SlotStatus = SlotStatus.PROPOSED
     
+    def __post_init__(self):
+        if not isinstance(self.students, tuple):
+            object.__setattr__(self, "students", tuple(self.students))
+    
     def is_full(self) -> bool:
         """Check if class has max capacity (3 students)."""
         return len(self.students) >= 3
@@ -170,7 +746,7 @@ class ScheduledClass:
         return len(self.students) < 2
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UnplacedStudent:
     """Represents a student that couldn't be placed in the schedule."""
     student: str
@@ -179,24 +755,158 @@ class UnplacedStudent:
     suggestions: List[str] = field(default_factory=list)  # Alternative slots or actions
 
 
+class _TrackedList(list):
+    """List that calls an owner callback after every in-place mutation.
+    
+    Used by ScheduleResult so `result.schedule.append(...)` invalidates the
+    cached indexes just like reassigning `result.schedule` does. Wrapping
+    copies the items into a new list: the list it was built from is not
+    tracked.
+    """
+    __slots__ = ("_on_change",)
+    
+    def __init__(self, iterable=(), on_change=None):
+        super().__init__(iterable)
+        self._on_change = on_change
+    
+    def __reduce__(self):
+        # Pickle as a plain list; the owner re-wraps it on unpickling
+        return (list, (list(self),))
+
+
+def _tracked(method_name: str):
+    base = getattr(list, method_name)
+    
+    def method(self, *args, **kwargs):
+        result = base(self, *args, **kwargs)
+        if self._on_change is not None:
+            self._on_change()
+        return result
+    
+    method.__name__ = method_name
+    return method
+
+
+for _name in ("append", "extend", "insert", "remove", "pop", "clear", "sort", "reverse",
+              "__setitem__", "__delitem__", "__iadd__", "__imul__"):
+    setattr(_TrackedList, _name, _tracked(_name))
+del _name
+
+
 @dataclass
 class ScheduleResult:
-    """Complete result of scheduling algorithm including metadata and explanations."""
+    """Complete result of scheduling algorithm including metadata and explanations.
+    
+    Grouped views (by_day, by_slot, by_student, sessions_per_student) and
+    summary counters are built on first access and cached. Reassigning or
+    mutating `schedule` / `unplaced` in place drops the cache. The cached
+    containers are shared: treat them as read-only.
+    
+    Assigned `schedule` / `unplaced` lists are copied (into a tracked
+    list): mutate `result.schedule`, not the list passed in, which the
+    result no longer sees.
+    """
     schedule: List[ScheduledClass]
     unplaced: List[UnplacedStudent] = field(default_factory=list)
     warnings: List[Dict[str, Any]] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
     explanations: Dict[str, Any] = field(default_factory=dict)
+    _cache: Dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in ("schedule", "unplaced"):
+            value = _TrackedList(value, self._invalidate_cache)
+            self.__dict__.get("_cache", {}).clear()
+        object.__setattr__(self, name, value)
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        state = dict(self.__dict__)
+        state["_cache"] = {}
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.schedule = state["schedule"]
+        self.unplaced = state["unplaced"]
+    
+    def _invalidate_cache(self) -> None:
+        self._cache.clear()
+    
+    def _cached(self, key: str, build):
+        cache = self._cache
+        if key not in cache:
+            cache[key] = build()
+        return cache[key]
+    
+    # ------------------------------------------------------------------------
+    # Indexed views
+    # ------------------------------------------------------------------------
+    
+    @property
+    def by_day(self) -> Dict[str, List[ScheduledClass]]:
+        """Classes grouped by day (every WEEK_DAYS key present), sorted by start time."""
+        def build():
+            grouped: Dict[str, List[ScheduledClass]] = {day: [] for day in WEEK_DAYS}
+            for cls in self.schedule:
+                grouped.setdefault(cls.slot.day, []).append(cls)
+            for classes in grouped.values():
+                classes.sort(key=lambda cls: (cls.slot.start_minutes, cls.slot.id))
+            return grouped
+        return self._cached("by_day", build)
+    
+    @property
+    def by_slot(self) -> Dict[Slot, List[str]]:
+        """Student names per slot (classes sharing a slot are merged)."""
+        def build():
+            grouped: Dict[Slot, List[str]] = {}
+            for cls in self.schedule:
+                grouped.setdefault(cls.slot, []).extend(cls.students)
+            return grouped
+        return self._cached("by_slot", build)
+    
+    @property
+    def by_student(self) -> Dict[str, List[ScheduledClass]]:
+        """Classes each student attends, in schedule order."""
+        def build():
+            grouped: Dict[str, List[ScheduledClass]] = {}
+            for cls in self.schedule:
+                for name in cls.students:
+                    grouped.setdefault(name, []).append(cls)
+            return grouped
+        return self._cached("by_student", build)
+    
+    @property
+    def sessions_per_student(self) -> Dict[str, int]:
+        """Number of scheduled sessions per student."""
+        return self._cached(
+            "sessions_per_student",
+            lambda: {name: len(classes) for name, classes in self.by_student.items()}
+        )
+    
+    # ------------------------------------------------------------------------
+    # Summary counters
+    # ------------------------------------------------------------------------
+    
+    @property
+    def total_classes(self) -> int:
+        return len(self.schedule)
+    
+    @property
+    def placed_count(self) -> int:
+        """Individual student placements (a student may appear in several classes)."""
+        return self._cached("placed_count", lambda: sum(len(c.students) for c in self.schedule))
+    
+    @property
+    def unplaced_count(self) -> int:
+        return len(self.unplaced)
     
     def placement_rate(self) -> float:
         """Calculate percentage of students successfully placed.
         
         Returns percentage of individual student placements vs total needed.
         """
-        # Count actual students placed (may appear in multiple classes)
-        placed_count = sum(len(c.students) for c in self.schedule)
-        unplaced_count = len(self.unplaced)
-        total = placed_count + unplaced_count
+        placed_count = self.placed_count
+        total = placed_count + self.unplaced_count
         
         if total == 0:
             return 0.0
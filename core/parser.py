@@ -2,30 +2,48 @@
 CSV parser for student availabilities and recurring slots.
 
 This module is responsible for:
-- Parsing availability CSV → List[Student]
+- Reading CSVs with the stdlib csv module (default) or pandas (engine="pandas",
+  imported only when chosen, so importing core.scheduler never loads it)
+- Parsing availability CSV → List[Student] (column-wise validation and
+  expansion straight to availability masks, no per-row iterrows)
+- Streaming availability CSV → Iterator[Student] in chunks (iter_students)
 - Parsing recurring slots CSV → List[ScheduledClass]
 - Time range expansion (e.g., "08:00-19:00" → list of 1h slots)
 - CSV format validation (field counts, time formats, etc.)
-- Linked group validation (partial linking allowed)
+- Linked group validation (partial linking allowed, groups of up to 3)
+- One-pass validation reports with error codes (validate_roster,
+  validate_recurring_slots; core.validation runs them over test case folders)
+- Week-over-week roster diff (diff_rosters)
 
 Note: Contains one business logic function (parse_recurring_slots_csv_with_warnings)
 that calls scheduler.generate_optimization_suggestions via local import to avoid
 circular dependency.
 """
 
+import csv
+import io
 import logging
-import pandas as pd
+import re
+import numpy as np
+from dataclasses import dataclass, field
 from datetime import time
-from typing import List, Tuple, Optional, Dict, Any
+from enum import Enum
+from typing import List, Tuple, Optional, Dict, Any, Iterator, Sequence, Collection, TYPE_CHECKING
 from pathlib import Path
 
-from .models import Student, Slot, ScheduledClass, SlotStatus
+from .models import (
+    Student, Slot, SlotSet, TimeRange, ScheduledClass, SlotStatus, WEEK_DAYS, GRID_SIZE, HALF_HOURS_PER_DAY,
+    EXPANSION_CACHE_SIZE, _LAST_SLOT_END_MINUTES
+)
+
+if TYPE_CHECKING:
+    from .cache import ParseCache
 
 logger = logging.getLogger(__name__)
 
 
 # French day names (lowercase) - dimanche excluded as coach doesn't work Sundays
-VALID_DAYS = ["lundi", "mardi", "mercredi", "jeudi", "vendredi", "samedi"]
+VALID_DAYS = list(WEEK_DAYS)
 
 # Required columns for availability CSV
 AVAILABILITY_REQUIRED_COLUMNS = [
@@ -39,13 +57,110 @@ AVAILABILITY_REQUIRED_COLUMNS = [
     "groupe_lie", "notes"
 ]
 
+# Rows per chunk for iter_students
+DEFAULT_CHUNK_SIZE = 10_000
+
 # Required columns for recurring slots CSV
 RECURRING_REQUIRED_COLUMNS = ["nom", "jour", "heure_debut", "heure_fin"]
 
+# CSV ingestion engines: stdlib csv module, or pandas (imported on first use)
+CSV_ENGINES = ("csv", "pandas")
+DEFAULT_ENGINE = "csv"
+
+
+class RosterErrorCode(Enum):
+    """Machine-readable kind of a roster error (ParseError.code, RosterIssue.code)."""
+    FILE_NOT_FOUND = "file_not_found"
+    MALFORMED_CSV = "malformed_csv"
+    MISSING_COLUMN = "missing_column"
+    NAME_REQUIRED = "name_required"
+    INVALID_SESSIONS = "invalid_sessions"  # Not an integer, or outside 1-7
+    INCOMPLETE_RANGE = "incomplete_range"  # Only one of {day}_debut / {day}_fin filled
+    INVALID_TIME = "invalid_time"  # Format, granularity or hour
+    RANGE_COUNT_MISMATCH = "range_count_mismatch"  # Different number of start and end times
+    INVALID_RANGE = "invalid_range"  # Start not before end
+    OVERLAPPING_RANGES = "overlapping_ranges"
+    NO_AVAILABILITY = "no_availability"
+    INSUFFICIENT_AVAILABILITY = "insufficient_availability"
+    LINKED_STUDENT_MISSING = "linked_student_missing"
+    LINKED_NOT_RECIPROCAL = "linked_not_reciprocal"
+    LINKED_NO_OVERLAP = "linked_no_overlap"
+    LINKED_GROUP_TOO_LARGE = "linked_group_too_large"  # More than 3 students (one class)
+    # Recurring slots CSV
+    STUDENT_NOT_FOUND = "student_not_found"  # Not in the availability CSV
+    INVALID_DAY = "invalid_day"
+    INVALID_SLOT = "invalid_slot"  # Not 1h, or not on :00 / :30
+    SLOT_NOT_AVAILABLE = "slot_not_available"  # Outside the student's availability
+    CLASS_OVER_CAPACITY = "class_over_capacity"  # More than 3 students on one slot
+    # File layout (checked by core.validation only; the parsers are lenient)
+    EMPTY_FILE = "empty_file"  # Availability CSV without data rows
+    HEADER_MISMATCH = "header_mismatch"  # Columns not in the template order
+    FIELD_COUNT = "field_count"  # Line with more or fewer fields than the header
+    UNEXPECTED = "unexpected"
+
 
 class ParseError(Exception):
-    """Custom exception for parsing errors with clear messages."""
-    pass
+    """Custom exception for parsing errors with clear messages.
+    
+    code is the RosterErrorCode of availability and recurring slots CSV
+    errors (None elsewhere).
+    """
+    
+    def __init__(self, message: str, code: Optional[RosterErrorCode] = None):
+        super().__init__(message)
+        self.code = code
+    
+    def __reduce__(self):
+        return (type(self), (str(self), self.code))
+
+
+@dataclass
+class RosterIssue:
+    """One error found by validate_roster or validate_recurring_slots."""
+    code: RosterErrorCode
+    message: str  # Same text parse_csv would raise
+    row: Optional[int] = None  # CSV line number (header = 1), None for file/column errors
+    student: Optional[str] = None
+    column: Optional[str] = None  # Set for column-level errors
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "code": self.code.value,
+            "message": self.message,
+            "row": self.row,
+            "student": self.student,
+            "column": self.column
+        }
+
+
+@dataclass
+class RosterReport:
+    """Every error of a CSV, collected in one pass (validate_roster, validate_recurring_slots)."""
+    issues: List[RosterIssue] = field(default_factory=list)
+    students: List[Student] = field(default_factory=list)  # Rows without row-level errors
+    classes: List[ScheduledClass] = field(default_factory=list)  # Recurring slots: classes without errors
+    row_count: int = 0
+    
+    @property
+    def is_valid(self) -> bool:
+        return not self.issues
+    
+    def issues_by_code(self) -> Dict[RosterErrorCode, List[RosterIssue]]:
+        """Issues grouped by code, in first-seen order."""
+        grouped: Dict[RosterErrorCode, List[RosterIssue]] = {}
+        for issue in self.issues:
+            grouped.setdefault(issue.code, []).append(issue)
+        return grouped
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form of the report."""
+        return {
+            "valid": self.is_valid,
+            "row_count": self.row_count,
+            "valid_students": len(self.students),
+            "valid_classes": len(self.classes),
+            "issues": [issue.to_dict() for issue in self.issues]
+        }
 
 
 def parse_time(time_str: str) -> time:
@@ -60,30 +175,52 @@ def parse_time(time_str: str) -> time:
     Raises:
         ParseError: If format invalid or not :00 or :30
     """
-    if pd.isna(time_str) or time_str == "":
+    if _is_missing(time_str) or time_str == "":
         return None
     
     try:
         hour, minute = map(int, time_str.split(":"))
     except (ValueError, AttributeError):
-        raise ParseError(f"Invalid time format: '{time_str}'. Expected HH:MM (e.g., '08:00', '17:30')")
+        raise ParseError(
+            f"Invalid time format: '{time_str}'. Expected HH:MM (e.g., '08:00', '17:30')",
+            RosterErrorCode.INVALID_TIME
+        )
     
     # Validate granularity (:00 or :30 only)
     if minute not in [0, 30]:
         raise ParseError(
             f"Invalid time granularity: '{time_str}'. "
-            f"Times must end in :00 or :30 (not :{minute:02d})"
+            f"Times must end in :00 or :30 (not :{minute:02d})",
+            RosterErrorCode.INVALID_TIME
         )
     
     # Validate hour range
     if not (0 <= hour < 24):
-        raise ParseError(f"Invalid hour: {hour}. Must be 0-23")
+        raise ParseError(f"Invalid hour: {hour}. Must be 0-23", RosterErrorCode.INVALID_TIME)
     
     return time(hour=hour, minute=minute)
 
 
-def expand_time_range_to_slots(day: str, start_time: time, end_time: time) -> List[Slot]:
-    """Expand a time range to list of 1-hour slots.
+def _parse_time_list(cell) -> List[time]:
+    """Parse a time cell holding one time or several separated by ';'.
+    
+    Raises:
+        ParseError: If a time is empty or invalid
+    """
+    parts = cell.split(";") if isinstance(cell, str) else [cell]
+    times = []
+    for part in parts:
+        if isinstance(part, str) and not part.strip():
+            raise ParseError(
+                f"Invalid time format: '{cell}'. Expected HH:MM (e.g., '08:00', '17:30')",
+                RosterErrorCode.INVALID_TIME
+            )
+        times.append(parse_time(part))
+    return times
+
+
+def expand_time_range_to_slots(day: str, start_time: time, end_time: time) -> Tuple[Slot, ...]:
+    """Expand a time range to 1-hour slots.
     
     Examples:
         08:00-19:00 → [08:00-09:00, 09:00-10:00, ..., 18:00-19:00] (11 slots)
@@ -96,251 +233,999 @@ def expand_time_range_to_slots(day: str, start_time: time, end_time: time) -> Li
         end_time: End of availability range
     
     Returns:
-        List of 1-hour Slot objects
+        Tuple of 1-hour interned Slot objects, shared by every caller
+        expanding the same range (memoized, see EXPANSION_CACHE_SIZE)
+    
+    Raises:
+        ParseError: If range invalid
+    """
+    return _expansion_template(day, start_time, end_time)[0]
+
+
+def expand_time_range_to_mask(day: str, start_time: time, end_time: time) -> int:
+    """Availability mask of expand_time_range_to_slots (memoized).
     
     Raises:
         ParseError: If range invalid
     """
+    return _expansion_template(day, start_time, end_time)[1]
+
+
+def _expansion_template(day: str, start_time: time, end_time: time) -> Tuple[Tuple[Slot, ...], int]:
+    """Validate a range and return its memoized (slots, mask) from TimeRange."""
     if start_time >= end_time:
         raise ParseError(
-            f"Invalid time range for {day}: start ({start_time}) must be before end ({end_time})"
+            f"Invalid time range for {day}: start ({start_time}) must be before end ({end_time})",
+            RosterErrorCode.INVALID_RANGE
         )
     
-    slots = []
-    current_start = start_time
-    
-    while True:
-        # Calculate end time for 1-hour slot
-        # 08:00 → 09:00, 08:30 → 09:30
-        next_hour = current_start.hour + 1
-        
-        # Handle hour overflow (23:00 + 1h would be invalid)
-        if next_hour > 23:
-            break
-        
-        current_end = time(hour=next_hour, minute=current_start.minute)
-        
-        # Stop if we exceed the end time
-        if current_end > end_time:
-            break
-        
-        slot = Slot(
-            day=day,
-            start_time=current_start,
-            end_time=current_end,
-            is_recurring=False
-        )
-        slots.append(slot)
-        
-        # Move to next slot
-        current_start = current_end
-    
-    return slots
+    time_range = TimeRange.from_times(day, start_time, end_time)
+    return time_range.slots(), time_range.mask
 
 
-def parse_csv(file_path: str) -> List[Student]:
+def parse_csv(file_path: str, engine: str = DEFAULT_ENGINE) -> List[Student]:
     """Parse student availability CSV.
     
+    Rows are validated and expanded column-wise (see _scan_availability).
+    Rows the vectorized scan cannot vouch for are re-parsed one by one with
+    _parse_student_row, which raises the precise row-numbered error.
+    
     Args:
         file_path: Path to CSV file with student availabilities
+        engine: CSV reader, one of CSV_ENGINES (see _read_tables)
     
     Returns:
         List of Student objects
     
     Raises:
         ParseError: If CSV format invalid or validation fails
+        ValueError: If engine is unknown
     """
-    # Read CSV
+    students = []
+    for table in _read_availability_tables(file_path, chunk_size=None, engine=engine):
+        students.extend(_students_from_table(table))
+    
+    # Validate linked groups after all students parsed
     try:
-        df = pd.read_csv(file_path)
-    except FileNotFoundError:
-        raise ParseError(f"File not found: {file_path}")
-    except pd.errors.ParserError as e:
-        raise ParseError(f"Failed to parse CSV: {e}")
+        validate_linked_groups(students)
+    except ParseError as e:
+        raise ParseError(f"Linked group validation failed: {e}", e.code)
+    
+    return students
+
+
+def iter_students(
+    path_or_buffer,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    engine: str = DEFAULT_ENGINE
+) -> Iterator[Student]:
+    """Stream students from an availability CSV, chunk by chunk.
+    
+    Same validation and error messages as parse_csv, but rows are read
+    chunk_size at a time and each validated Student is yielded as soon as
+    its chunk is parsed, so the first row error surfaces without reading
+    the rest of the file. Linked groups are checked in a final pass once
+    every row has been read: only linked students and the set of names
+    are kept until then.
+    
+    With engine="pandas", column types are inferred per chunk, so a row
+    mixing malformed values (e.g. "2.0" and "x" in sessions_par_semaine)
+    may be reported with a different message than parse_csv gives; it is
+    still the same row.
+    
+    Args:
+        path_or_buffer: Path or file-like object with the CSV
+        chunk_size: Rows per chunk (peak memory scales with it)
+        engine: CSV reader, one of CSV_ENGINES (see _read_tables)
+    
+    Yields:
+        Student objects, in file order
+    
+    Raises:
+        ParseError: If CSV format invalid or validation fails (linked group
+            errors are raised after the last student has been yielded)
+        ValueError: If engine is unknown
+    """
+    linked_students = []
+    student_map: Dict[str, Student] = {}
     
-    # Validate required columns exist (case-sensitive)
-    missing_cols = set(AVAILABILITY_REQUIRED_COLUMNS) - set(df.columns)
+    for table in _read_availability_tables(path_or_buffer, chunk_size, engine):
+        for student in _students_from_table(table):
+            if student.linked_group:
+                linked_students.append(student)
+                student_map[student.name] = student
+            else:
+                student_map[student.name] = _UNLINKED_STUDENT
+            yield student
+    
+    try:
+        validate_linked_groups(linked_students, student_map)
+    except ParseError as e:
+        raise ParseError(f"Linked group validation failed: {e}", e.code)
+
+
+def validate_roster(path_or_buffer, engine: str = DEFAULT_ENGINE) -> RosterReport:
+    """Validate an availability CSV in one pass, collecting every error.
+    
+    Same checks and messages as parse_csv, but nothing is raised: file and
+    column errors, every invalid row (all its invalid days, not only the
+    first) and every invalid linked pair are returned in a report. Rows go
+    through the same vectorized scan as parse_csv; only rows it flags are
+    checked one by one. Links to a row that has its own errors are not
+    reported again.
+    
+    Args:
+        path_or_buffer: Path or file-like object with the CSV
+        engine: CSV reader, one of CSV_ENGINES (see _read_tables)
+    
+    Returns:
+        RosterReport (report.students holds the rows without errors)
+    
+    Raises:
+        ValueError: If engine is unknown
+    """
+    report = RosterReport()
+    try:
+        table = next(_read_tables(
+            path_or_buffer, None, engine, "CSV", numeric_columns=("sessions_par_semaine",)
+        ))
+    except ParseError as e:
+        report.issues.append(RosterIssue(code=e.code, message=str(e)))
+        return report
+    
+    # Column-level errors: rows can't be checked without every column
+    missing_cols = _missing_availability_columns(table)
     if missing_cols:
-        raise ParseError(
-            f"Missing required columns: {', '.join(sorted(missing_cols))}. "
-            f"Expected columns: {', '.join(AVAILABILITY_REQUIRED_COLUMNS)}"
+        report.issues.extend(
+            RosterIssue(code=RosterErrorCode.MISSING_COLUMN, message=f"Missing required column: {column}", column=column)
+            for column in missing_cols
         )
+        return report
     
-    students = []
+    # Row-level errors
+    report.row_count = len(table)
+    scan = _scan_availability(table)
+    rows_by_name: Dict[str, int] = {}
+    rejected_names = set()
+    for position, (name, sessions, ranges, mask, linked_group, notes, suspect) in enumerate(zip(
+        scan.names, scan.sessions, scan.ranges, scan.masks, scan.linked_groups, scan.notes, scan.suspect
+    )):
+        idx = table.labels[position]
+        if suspect:
+            student, errors = _check_student_row(idx, table.row(position))
+        else:
+            student, errors = Student.from_ranges(name, sessions, ranges, linked_group, notes, availability_mask=mask), []
+        
+        if errors:
+            rejected_names.add(name)
+            student_name = None if not name or _is_missing(table.columns["nom"][position]) else name
+            report.issues.extend(
+                RosterIssue(code=e.code, message=str(e), row=idx + 2, student=student_name) for e in errors
+            )
+        else:
+            rows_by_name.setdefault(student.name, idx + 2)
+            report.students.append(student)
     
-    for idx, row in df.iterrows():
-        try:
-            # Parse basic info
-            name = str(row["nom"]).strip()
-            if not name or pd.isna(row["nom"]):
-                raise ParseError(f"Row {idx+2}: Student name is required")
-            
-            sessions_per_week = int(row["sessions_par_semaine"])
-            if sessions_per_week <= 0 or sessions_per_week > 7:
-                raise ParseError(
-                    f"Row {idx+2} ({name}): sessions_par_semaine must be 1-7, got {sessions_per_week}"
-                )
-            
-            # Parse availability slots
-            available_slots = []
-            for day in ["lundi", "mardi", "mercredi", "jeudi", "vendredi", "samedi"]:
-                debut_col = f"{day}_debut"
-                fin_col = f"{day}_fin"
-                
-                debut_str = row[debut_col]
-                fin_str = row[fin_col]
-                
-                # Skip if both empty
-                if pd.isna(debut_str) and pd.isna(fin_str):
-                    continue
-                
-                # Both must be filled if one is filled
-                if pd.isna(debut_str) or pd.isna(fin_str):
-                    raise ParseError(
-                        f"Row {idx+2} ({name}): {day} has incomplete time range. "
-                        f"Both {debut_col} and {fin_col} must be filled or both empty."
-                    )
-                
-                # Parse times
-                try:
-                    debut_time = parse_time(debut_str)
-                    fin_time = parse_time(fin_str)
-                except ParseError as e:
-                    raise ParseError(f"Row {idx+2} ({name}): {e}")
-                
-                # Expand range to hourly slots
-                try:
-                    day_slots = expand_time_range_to_slots(day, debut_time, fin_time)
-                    available_slots.extend(day_slots)
-                except ParseError as e:
-                    raise ParseError(f"Row {idx+2} ({name}): {e}")
-            
-            # Check student has at least one availability slot
-            if not available_slots:
-                raise ParseError(
-                    f"Row {idx+2} ({name}): No availability slots defined. "
-                    f"Student must have at least one time range."
-                )
-            
-            # Check enough availability for requested sessions
-            if len(available_slots) < sessions_per_week:
+    # Linked group errors (between rows that are valid on their own)
+    linkable = [s for s in report.students if rejected_names.isdisjoint(s.linked_names)]
+    _, link_errors = _check_linked_groups(linkable, {s.name: s for s in report.students})
+    report.issues.extend(
+        RosterIssue(
+            code=e.code,
+            message=f"Linked group validation failed: {e}",
+            row=rows_by_name.get(name),
+            student=name
+        )
+        for name, e in link_errors
+    )
+    return report
+
+
+# Stands in for students without a linked group during streaming validation
+# (validate_linked_groups only reads their linked_group)
+_UNLINKED_STUDENT = Student(name="", sessions_per_week=0)
+
+
+def _read_availability_tables(path_or_buffer, chunk_size: Optional[int], engine: str) -> Iterator['_CsvTable']:
+    """Read an availability CSV as one table (chunk_size None) or in chunks.
+    
+    Chunks keep the file's row labels, so row numbers in errors are global.
+    
+    Raises:
+        ParseError: If the file is missing, malformed or lacks required columns
+    """
+    checked_columns = False
+    for table in _read_tables(path_or_buffer, chunk_size, engine, "CSV", numeric_columns=("sessions_par_semaine",)):
+        if not checked_columns:
+            # Validate required columns exist (case-sensitive)
+            missing_cols = _missing_availability_columns(table)
+            if missing_cols:
                 raise ParseError(
-                    f"Row {idx+2} ({name}): Only {len(available_slots)} availability slots "
-                    f"but requests {sessions_per_week} sessions/week. Need at least {sessions_per_week} slots."
+                    f"Missing required columns: {', '.join(missing_cols)}. "
+                    f"Expected columns: {', '.join(AVAILABILITY_REQUIRED_COLUMNS)}",
+                    RosterErrorCode.MISSING_COLUMN
                 )
-            
-            # Parse linked group
-            linked_group = row.get("groupe_lie")
-            if pd.isna(linked_group) or linked_group == "":
-                linked_group = None
-            else:
-                linked_group = str(linked_group).strip()
-            
-            # Parse notes
-            notes = row.get("notes", "")
-            if pd.isna(notes):
-                notes = ""
-            else:
-                notes = str(notes).strip()
-            
-            # Create student
-            student = Student(
-                name=name,
-                sessions_per_week=sessions_per_week,
-                available_slots=available_slots,
-                linked_group=linked_group,
-                notes=notes
+            checked_columns = True
+        yield table
+
+
+def _missing_availability_columns(table: '_CsvTable') -> List[str]:
+    """Required availability columns absent from the table, sorted."""
+    return sorted(set(AVAILABILITY_REQUIRED_COLUMNS) - set(table.columns))
+
+
+def _students_from_table(table: '_CsvTable') -> Iterator[Student]:
+    """Yield the students of an availability table, in row order."""
+    scan = _scan_availability(table)
+    for position, (name, sessions, ranges, mask, linked_group, notes, suspect) in enumerate(zip(
+        scan.names, scan.sessions, scan.ranges, scan.masks, scan.linked_groups, scan.notes, scan.suspect
+    )):
+        if suspect:
+            yield _parse_student_row(table.labels[position], table.row(position))
+        else:
+            yield Student.from_ranges(name, sessions, ranges, linked_group, notes, availability_mask=mask)
+
+
+# ============================================================================
+# CSV INGESTION ENGINES
+# ============================================================================
+
+# Cells read as missing: pandas.read_csv's default na_values, so both
+# engines agree on what an empty cell is
+_NA_VALUES = frozenset({
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None",
+    "n/a", "nan", "null"
+})
+
+# Missing cell value (NaN like pandas, so str() of a missing cell is "nan" with both engines)
+_MISSING = float("nan")
+
+
+def _is_missing(value) -> bool:
+    """Scalar pd.isna: True for None and NaN."""
+    return value is None or (isinstance(value, float) and value != value)
+
+
+class _MalformedCSV(Exception):
+    """Raised by an engine for unreadable CSV content (wrapped in ParseError)."""
+
+
+@dataclass
+class _CsvTable:
+    """CSV rows stored by column, as read by either engine.
+    
+    Missing cells are NaN. Other cells are str, except where the engine
+    converts them: pandas infers numeric columns, the csv engine only
+    converts numeric_columns. labels[i] is the data row index of row i
+    (error messages report line labels[i] + 2).
+    """
+    columns: Dict[str, List[Any]]
+    labels: Sequence[int]
+    
+    def __len__(self) -> int:
+        return len(self.labels)
+    
+    def row(self, position: int) -> Dict[str, Any]:
+        """Cells of one row by column name (what _parse_student_row reads)."""
+        return {name: values[position] for name, values in self.columns.items()}
+
+
+def _read_tables(
+    path_or_buffer,
+    chunk_size: Optional[int],
+    engine: str,
+    description: str,
+    numeric_columns: Sequence[str] = ()
+) -> Iterator[_CsvTable]:
+    """Read a CSV as one table (chunk_size None) or chunk_size rows at a time.
+    
+    Engines:
+        "csv": stdlib csv module, cells kept as text except numeric_columns,
+            converted cell by cell (int, else float, else text) where pandas
+            only converts a column whose cells are all numeric
+        "pandas": pandas.read_csv with its type inference; pandas is
+            imported here, on first use
+    
+    Args:
+        path_or_buffer: Path or file-like object (text or bytes)
+        chunk_size: Rows per table, None for a single table
+        engine: One of CSV_ENGINES
+        description: File kind for error messages ("CSV", "recurring slots CSV")
+        numeric_columns: Columns the csv engine converts to numbers
+    
+    Raises:
+        ParseError: If the file is missing or malformed (including not
+            UTF-8 encoded, e.g. a Latin-1 Excel export)
+        ValueError: If engine is unknown
+    """
+    if engine not in CSV_ENGINES:
+        raise ValueError(f"Unknown CSV engine '{engine}'. Expected one of: {', '.join(CSV_ENGINES)}")
+    
+    try:
+        if engine == "pandas":
+            yield from _pandas_tables(path_or_buffer, chunk_size)
+        elif hasattr(path_or_buffer, "read"):
+            yield from _csv_tables(path_or_buffer, chunk_size, numeric_columns)
+        else:
+            with open(path_or_buffer, newline="", encoding="utf-8-sig") as f:
+                yield from _csv_tables(f, chunk_size, numeric_columns)
+    except FileNotFoundError:
+        raise ParseError(f"File not found: {path_or_buffer}", RosterErrorCode.FILE_NOT_FOUND)
+    except (_MalformedCSV, csv.Error) as e:
+        raise ParseError(f"Failed to parse {description}: {e}", RosterErrorCode.MALFORMED_CSV)
+    except UnicodeDecodeError as e:
+        raise ParseError(
+            f"Failed to parse {description}: not UTF-8 encoded (invalid byte "
+            f"{e.object[e.start:e.start + 1]!r}). Save the file as 'CSV UTF-8'",
+            RosterErrorCode.MALFORMED_CSV
+        )
+
+
+def _pandas_tables(path_or_buffer, chunk_size: Optional[int]) -> Iterator[_CsvTable]:
+    import pandas as pd
+    
+    try:
+        if chunk_size is None:
+            frames = iter([pd.read_csv(path_or_buffer)])
+        else:
+            frames = pd.read_csv(path_or_buffer, chunksize=chunk_size)
+        for df in frames:
+            yield _CsvTable(
+                columns={name: df[name].tolist() for name in df.columns},
+                labels=df.index.tolist()
             )
-            students.append(student)
-            
-        except ParseError:
-            raise
-        except Exception as e:
-            raise ParseError(f"Row {idx+2}: Unexpected error: {e}")
+    except (pd.errors.ParserError, pd.errors.EmptyDataError) as e:
+        raise _MalformedCSV(e)
+
+
+def _csv_tables(file, chunk_size: Optional[int], numeric_columns: Sequence[str]) -> Iterator[_CsvTable]:
+    """Tables from an open CSV file (blank lines skipped, like pandas)."""
+    if isinstance(file, (io.RawIOBase, io.BufferedIOBase)):
+        text_file = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+        try:
+            yield from _csv_tables(text_file, chunk_size, numeric_columns)
+        finally:
+            text_file.detach()  # Leave the caller's buffer open
+        return
     
-    # Validate linked groups after all students parsed
+    reader = csv.reader(file)
+    header = next((row for row in reader if row), None)
+    if header is None:
+        raise _MalformedCSV("No columns to parse from file")
+    if header[0].startswith("\ufeff"):  # BOM of a text buffer
+        header[0] = header[0][1:]
+    
+    width = len(header)
+    numeric = frozenset(numeric_columns)
+    first_label = 0
+    rows: List[List[str]] = []
+    for row in reader:
+        if not row:
+            continue
+        if len(row) > width:
+            raise _MalformedCSV(f"Expected {width} fields in line {reader.line_num}, saw {len(row)}")
+        rows.append(row)
+        if len(rows) == chunk_size:
+            yield _table_from_rows(header, rows, first_label, numeric)
+            first_label += len(rows)
+            rows = []
+    
+    if rows or first_label == 0:
+        yield _table_from_rows(header, rows, first_label, numeric)
+
+
+def _table_from_rows(header: List[str], rows: List[List[str]], first_label: int, numeric) -> _CsvTable:
+    """Transpose text rows into a _CsvTable (short rows padded with missing cells)."""
+    width = len(header)
+    padded = [row if len(row) == width else row + [""] * (width - len(row)) for row in rows]
+    cells = list(zip(*padded)) if padded else [()] * width
+    
+    columns: Dict[str, List[Any]] = {}
+    for name, values in zip(header, cells):
+        if name in columns:
+            continue  # Duplicate header: first column wins
+        if name in numeric:
+            columns[name] = [_MISSING if value in _NA_VALUES else _to_number(value) for value in values]
+        else:
+            columns[name] = [_MISSING if value in _NA_VALUES else value for value in values]
+    
+    return _CsvTable(columns=columns, labels=range(first_label, first_label + len(rows)))
+
+
+def _to_number(text: str):
+    """int, else float, else the text itself (sessions_par_semaine cells)."""
     try:
-        validate_linked_groups(students)
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        return text
+
+
+# ============================================================================
+# VECTORIZED AVAILABILITY SCAN
+# ============================================================================
+
+# Fast-path time format. Cells that don't match are not necessarily invalid
+# (parse_time also accepts e.g. " 8:00"): their row goes through _parse_student_row.
+_TIME_PATTERN = re.compile(r"(\d{1,2}):(\d{2})\Z")
+
+_MASK_BYTES = (GRID_SIZE + 7) // 8
+
+
+@dataclass
+class _AvailabilityScan:
+    """Column-wise parse of an availability table (one entry per row).
+    
+    Values of suspect rows are placeholders: those rows must be re-parsed
+    with _parse_student_row.
+    """
+    names: List[str]
+    sessions: List[int]
+    ranges: List[Tuple[TimeRange, ...]]
+    masks: List[int]
+    linked_groups: List[Optional[str]]
+    notes: List[str]
+    suspect: List[bool]
+
+
+def _time_column_minutes(column: List[Any]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Parse a time column to minutes since midnight.
+    
+    A roster column holds few distinct values, so each distinct cell is
+    parsed once and the result broadcast back by code.
+    
+    Returns:
+        Tuple (minutes, empty, rejected): minutes is -1 where the cell is
+        empty or rejected; rejected marks non-empty cells off the fast path
+    """
+    unique_codes = {value: k for k, value in enumerate(dict.fromkeys(column))}
+    codes = np.fromiter(map(unique_codes.__getitem__, column), dtype=np.int64, count=len(column))
+    
+    unique_minutes = np.full(len(unique_codes), -1, dtype=np.int64)
+    unique_empty = np.zeros(len(unique_codes), dtype=bool)
+    for value, k in unique_codes.items():
+        if _is_missing(value):
+            unique_empty[k] = True
+            continue
+        match = _TIME_PATTERN.match(value) if isinstance(value, str) else None
+        if match:
+            hour, minute = int(match.group(1)), int(match.group(2))
+            if hour < 24 and minute in (0, 30):
+                unique_minutes[k] = hour * 60 + minute
+    
+    empty = unique_empty[codes]
+    minutes = unique_minutes[codes]
+    return minutes, empty, ~empty & (minutes < 0)
+
+
+def _text_column(column: List[Any]) -> Tuple[List[str], List[bool]]:
+    """Stripped str() of each cell, plus the empty (missing) flags."""
+    return [str(value).strip() for value in column], [_is_missing(value) for value in column]
+
+
+def _scan_availability(table: _CsvTable) -> _AvailabilityScan:
+    """Validate and expand every row of an availability table column-wise.
+    
+    Applies the same checks as _parse_student_row (name, session bounds,
+    incomplete ranges, time format and granularity, start < end, slot
+    count) as array operations, and packs each row's 1h slots straight
+    into an availability mask. Rows failing or not covered by the fast
+    path are flagged suspect.
+    """
+    columns = table.columns
+    num_rows = len(table)
+    
+    # Names: non-empty text (other cell types go through _parse_student_row)
+    names, _ = _text_column(columns["nom"])
+    suspect = np.fromiter(
+        (not isinstance(value, str) or not name for value, name in zip(columns["nom"], names)),
+        dtype=bool,
+        count=num_rows
+    )
+    
+    # Sessions: int cells, or float cells holding whole numbers
+    sessions = np.zeros(num_rows, dtype=np.int64)
+    for row, value in enumerate(columns["sessions_par_semaine"]):
+        if type(value) is int or (isinstance(value, float) and value.is_integer()):
+            sessions[row] = int(value)
+        else:
+            suspect[row] = True
+    suspect |= (sessions <= 0) | (sessions > 7)
+    
+    # Availability ranges → bit matrix over the weekly grid (1h slots, stride 2)
+    bits = np.zeros((num_rows, GRID_SIZE), dtype=bool)
+    slot_counts = np.zeros(num_rows, dtype=np.int64)
+    half_hours = np.arange(HALF_HOURS_PER_DAY)
+    range_bounds = []  # per day: start and end minutes, -1 when no range
+    for day_index, day in enumerate(VALID_DAYS):
+        start, start_empty, start_rejected = _time_column_minutes(columns[f"{day}_debut"])
+        end, end_empty, end_rejected = _time_column_minutes(columns[f"{day}_fin"])
+        
+        suspect |= start_empty != end_empty  # incomplete range
+        suspect |= start_rejected | end_rejected
+        filled = ~start_empty & ~end_empty & (start >= 0) & (end >= 0)
+        suspect |= filled & (start >= end)
+        
+        active = filled & (start < end)
+        count = np.where(active, np.maximum(0, (np.minimum(end, _LAST_SLOT_END_MINUTES) - start) // 60), 0)
+        first = start // 30
+        offset = half_hours[None, :] - first[:, None]
+        bits[:, day_index * HALF_HOURS_PER_DAY:(day_index + 1) * HALF_HOURS_PER_DAY] = (
+            active[:, None] & (offset >= 0) & (offset < 2 * count[:, None]) & (offset % 2 == 0)
+        )
+        slot_counts += count
+        range_bounds.append(np.where(active, start, -1).tolist())
+        range_bounds.append(np.where(active, end, -1).tolist())
+    
+    suspect |= slot_counts == 0
+    suspect |= slot_counts < sessions
+    
+    packed = np.packbits(bits, axis=1, bitorder="little").tobytes()
+    masks = [
+        int.from_bytes(packed[row * _MASK_BYTES:(row + 1) * _MASK_BYTES], "little")
+        for row in range(num_rows)
+    ]
+    
+    # Ranges: rows sharing the same bounds on every day share one tuple
+    ranges_by_bounds: Dict[Tuple[int, ...], Tuple[TimeRange, ...]] = {}
+    ranges = []
+    for bounds in zip(*range_bounds):
+        row_ranges = ranges_by_bounds.get(bounds)
+        if row_ranges is None:
+            row_ranges = ranges_by_bounds[bounds] = tuple(
+                TimeRange.of(day, bounds[2 * day_index], bounds[2 * day_index + 1])
+                for day_index, day in enumerate(VALID_DAYS)
+                if bounds[2 * day_index] >= 0
+            )
+        ranges.append(row_ranges)
+    
+    # Linked group: empty → None, otherwise stripped text
+    linked_text, linked_empty = _text_column(columns["groupe_lie"])
+    linked_groups = [
+        None if is_empty or raw == "" else text
+        for text, is_empty, raw in zip(linked_text, linked_empty, columns["groupe_lie"])
+    ]
+    
+    notes_text, notes_empty = _text_column(columns["notes"])
+    notes = ["" if is_empty else text for text, is_empty in zip(notes_text, notes_empty)]
+    
+    return _AvailabilityScan(
+        names=names,
+        sessions=sessions.tolist(),
+        ranges=ranges,
+        masks=masks,
+        linked_groups=linked_groups,
+        notes=notes,
+        suspect=suspect.tolist()
+    )
+
+
+def _parse_student_row(idx, row) -> Student:
+    """Parse one availability row (reference path, exact error messages).
+    
+    Args:
+        idx: Row label (error messages report line idx + 2)
+        row: Row cells by column name (dict or pandas Series)
+    
+    Returns:
+        Student object
+    
+    Raises:
+        ParseError: If the row is invalid (its first error, see _check_student_row)
+    """
+    student, errors = _check_student_row(idx, row)
+    if errors:
+        raise errors[0]
+    return student
+
+
+def _check_student_row(idx, row) -> Tuple[Optional[Student], List[ParseError]]:
+    """Validate one availability row, collecting its errors instead of raising.
+    
+    Checks run in the order _parse_student_row reports them; a check whose
+    input is already invalid (e.g. slot count with a bad session count) is
+    skipped rather than reported twice.
+    
+    Returns:
+        Tuple (student, errors): student is None unless errors is empty
+    """
+    try:
+        return _check_student_fields(idx, row)
+    except Exception as e:
+        return None, [ParseError(f"Row {idx+2}: Unexpected error: {e}", RosterErrorCode.UNEXPECTED)]
+
+
+def _check_student_fields(idx, row) -> Tuple[Optional[Student], List[ParseError]]:
+    errors: List[ParseError] = []
+    
+    # Parse basic info
+    name = str(row["nom"]).strip()
+    if not name or _is_missing(row["nom"]):
+        errors.append(ParseError(f"Row {idx+2}: Student name is required", RosterErrorCode.NAME_REQUIRED))
+        where = f"Row {idx+2}"
+    else:
+        where = f"Row {idx+2} ({name})"
+    
+    try:
+        sessions_per_week = int(row["sessions_par_semaine"])
+    except (TypeError, ValueError, OverflowError) as e:
+        sessions_per_week = None
+        errors.append(ParseError(f"Row {idx+2}: Unexpected error: {e}", RosterErrorCode.INVALID_SESSIONS))
+    if sessions_per_week is not None and (sessions_per_week <= 0 or sessions_per_week > 7):
+        errors.append(ParseError(
+            f"{where}: sessions_par_semaine must be 1-7, got {sessions_per_week}",
+            RosterErrorCode.INVALID_SESSIONS
+        ))
+        sessions_per_week = None
+    
+    # Parse availability ranges (memoized range masks, OR-ed per day)
+    ranges = []
+    availability_mask = 0
+    day_errors = False
+    for day in VALID_DAYS:
+        day_ranges, day_mask, error = _check_day_ranges(where, day, row)
+        if error is not None:
+            errors.append(error)
+            day_errors = True
+            continue
+        ranges.extend(day_ranges)
+        availability_mask |= day_mask
+    
+    # Check student has at least one availability slot
+    if not availability_mask and not day_errors:
+        errors.append(ParseError(
+            f"{where}: No availability slots defined. "
+            f"Student must have at least one time range.",
+            RosterErrorCode.NO_AVAILABILITY
+        ))
+    
+    # Check enough availability for requested sessions (popcount of the mask)
+    slot_count = availability_mask.bit_count()
+    if availability_mask and not day_errors and sessions_per_week is not None and slot_count < sessions_per_week:
+        errors.append(ParseError(
+            f"{where}: Only {slot_count} availability slots "
+            f"but requests {sessions_per_week} sessions/week. Need at least {sessions_per_week} slots.",
+            RosterErrorCode.INSUFFICIENT_AVAILABILITY
+        ))
+    
+    if errors:
+        return None, errors
+    
+    # Parse linked group
+    linked_group = row.get("groupe_lie")
+    if _is_missing(linked_group) or linked_group == "":
+        linked_group = None
+    else:
+        linked_group = str(linked_group).strip()
+    
+    # Parse notes
+    notes = row.get("notes", "")
+    if _is_missing(notes):
+        notes = ""
+    else:
+        notes = str(notes).strip()
+    
+    # Create student (ranges as declared, mask packed from their expansions)
+    student = Student.from_ranges(
+        name, sessions_per_week, ranges, linked_group, notes, availability_mask=availability_mask
+    )
+    return student, []
+
+
+def _check_day_ranges(where: str, day: str, row) -> Tuple[List[TimeRange], int, Optional[ParseError]]:
+    """Parse one day's ranges of a row.
+    
+    Returns:
+        Tuple (ranges, mask, error): error is the day's first ParseError,
+        or None (ranges empty when the day is not filled)
+    """
+    debut_col = f"{day}_debut"
+    fin_col = f"{day}_fin"
+    
+    debut_str = row[debut_col]
+    fin_str = row[fin_col]
+    
+    # Skip if both empty
+    if _is_missing(debut_str) and _is_missing(fin_str):
+        return [], 0, None
+    
+    # Both must be filled if one is filled
+    if _is_missing(debut_str) or _is_missing(fin_str):
+        return [], 0, ParseError(
+            f"{where}: {day} has incomplete time range. "
+            f"Both {debut_col} and {fin_col} must be filled or both empty.",
+            RosterErrorCode.INCOMPLETE_RANGE
+        )
+    
+    # Parse times (several ranges per day: "08:00;17:00" / "10:00;19:00")
+    try:
+        debut_times = _parse_time_list(debut_str)
+        fin_times = _parse_time_list(fin_str)
     except ParseError as e:
-        raise ParseError(f"Linked group validation failed: {e}")
+        return [], 0, ParseError(f"{where}: {e}", e.code)
+    if len(debut_times) != len(fin_times):
+        return [], 0, ParseError(
+            f"{where}: {day} has {len(debut_times)} start time(s) "
+            f"but {len(fin_times)} end time(s)",
+            RosterErrorCode.RANGE_COUNT_MISMATCH
+        )
     
-    return students
+    day_ranges = []
+    mask = 0
+    for debut_time, fin_time in zip(debut_times, fin_times):
+        # Expand range to hourly slots
+        try:
+            mask |= expand_time_range_to_mask(day, debut_time, fin_time)
+        except ParseError as e:
+            return [], 0, ParseError(f"{where}: {e}", e.code)
+        day_ranges.append(TimeRange.from_times(day, debut_time, fin_time))
+    
+    day_ranges.sort(key=lambda r: r.start_minutes)
+    for previous, current in zip(day_ranges, day_ranges[1:]):
+        if current.start_minutes < previous.end_minutes:
+            return [], 0, ParseError(
+                f"{where}: {day} ranges overlap ({previous} and {current})",
+                RosterErrorCode.OVERLAPPING_RANGES
+            )
+    return day_ranges, mask, None
 
 
-def validate_linked_groups(students: List[Student]) -> List[Tuple[str, str]]:
+def validate_linked_groups(
+    students: List[Student],
+    student_map: Optional[Dict[str, Student]] = None
+) -> List[Tuple[str, ...]]:
     """Validate linked groups have reciprocal links and overlapping availability.
     
+    A group lists its other members in groupe_lie, ';'-separated
+    (e.g. "Bob;Chloe"), and holds at most 3 students (one class).
+    
     Args:
         students: List of all students
+        student_map: Optional name → student lookup (default: built from
+            students). Lets callers pass only the linked students
     
     Returns:
-        List of validated linked pairs (student1, student2)
+        List of validated linked groups (student, *linked students): pairs
+        for two-student groups
     
     Raises:
-        ParseError: If linked groups invalid
+        ParseError: If linked groups invalid (the first invalid group)
+    """
+    validated_groups, errors = _check_linked_groups(students, student_map)
+    if errors:
+        raise errors[0][1]
+    return validated_groups
+
+
+def _check_linked_groups(
+    students: List[Student],
+    student_map: Optional[Dict[str, Student]] = None
+) -> Tuple[List[Tuple[str, ...]], List[Tuple[str, ParseError]]]:
+    """Check every linked group, collecting errors instead of raising.
+    
+    Returns:
+        Tuple (validated_groups, errors): errors are (student name, ParseError)
+        in student order, one per invalid group
     """
     # Build student lookup
-    student_map = {s.name: s for s in students}
-    validated_pairs = []
+    if student_map is None:
+        student_map = {s.name: s for s in students}
+    validated_groups = []
+    errors = []
     processed = set()
     
     for student in students:
-        if not student.linked_group:
+        linked_names = tuple(name for name in student.linked_names if name != student.name)
+        if not linked_names:
             continue
         
-        # Skip if already processed this pair
-        pair_key = tuple(sorted([student.name, student.linked_group]))
-        if pair_key in processed:
+        # Skip if already processed this group
+        group_key = tuple(sorted({student.name, *linked_names}))
+        if group_key in processed:
             continue
-        processed.add(pair_key)
+        processed.add(group_key)
         
-        # Check linked student exists
-        if student.linked_group not in student_map:
-            raise ParseError(
-                f"{student.name} links to '{student.linked_group}' but that student doesn't exist in CSV"
-            )
+        # Check linked students exist
+        missing = [name for name in linked_names if name not in student_map]
+        if missing:
+            errors.append((student.name, ParseError(
+                f"{student.name} links to '{missing[0]}' but that student doesn't exist in CSV",
+                RosterErrorCode.LINKED_STUDENT_MISSING
+            )))
+            continue
         
-        linked_student = student_map[student.linked_group]
+        # One class holds the whole group
+        if len(group_key) > 3:
+            errors.append((student.name, ParseError(
+                f"{student.name} links to {', '.join(linked_names)}: a linked group has {len(group_key)} students. "
+                f"Maximum 3 students per class.",
+                RosterErrorCode.LINKED_GROUP_TOO_LARGE
+            )))
+            continue
         
-        # Check reciprocity
-        if linked_student.linked_group != student.name:
-            raise ParseError(
+        # Check reciprocity: every member links to all the others
+        members = [student_map[name] for name in linked_names]
+        not_reciprocal = next(
+            (name for name, member in zip(linked_names, members)
+             if set(member.linked_names) != set(group_key) - {name}),
+            None
+        )
+        if not_reciprocal is not None:
+            errors.append((student.name, ParseError(
                 f"{student.name} links to {student.linked_group}, "
-                f"but {student.linked_group} links to '{linked_student.linked_group}' (not reciprocal). "
-                f"Both students must link to each other."
-            )
+                f"but {not_reciprocal} links to '{student_map[not_reciprocal].linked_group}' (not reciprocal). "
+                f"{'Both students' if len(group_key) == 2 else 'All students of the group'} must link to each other.",
+                RosterErrorCode.LINKED_NOT_RECIPROCAL
+            )))
+            continue
         
-        # Check overlapping availability (REQUIRED for partial linking)
-        if not student.has_overlapping_availability(linked_student):
-            raise ParseError(
-                f"{student.name} and {student.linked_group} have NO overlapping availability. "
-                f"Linked groups must have at least one common time slot."
-            )
+        # Check overlapping availability, common to the whole group (REQUIRED for partial linking)
+        common_mask = student.availability_mask
+        for member in members:
+            common_mask &= member.availability_mask
+        if common_mask == 0:
+            errors.append((student.name, ParseError(
+                f"{_join_names((student.name,) + linked_names)} have NO overlapping availability. "
+                f"Linked groups must have at least one common time slot.",
+                RosterErrorCode.LINKED_NO_OVERLAP
+            )))
+            continue
         
         # Warn if sessions_per_week differ (partial linking will apply)
-        if student.sessions_per_week != linked_student.sessions_per_week:
+        sessions = [student.sessions_per_week] + [member.sessions_per_week for member in members]
+        if len(set(sessions)) > 1:
             # Log warning, not an error (partial linking supported)
             logger.warning(
-                f"Partial linking: {student.name} ({student.sessions_per_week} sessions) "
-                f"and {student.linked_group} ({linked_student.sessions_per_week} sessions) "
-                f"have different session counts. "
-                f"min({student.sessions_per_week}, {linked_student.sessions_per_week}) sessions together, rest solo."
+                f"Partial linking: {_join_names((student.name,) + linked_names)} "
+                f"have different session counts ({', '.join(map(str, sessions))}). "
+                f"min({', '.join(map(str, sessions))}) sessions together, rest solo."
             )
         
-        validated_pairs.append((student.name, student.linked_group))
+        validated_groups.append((student.name,) + linked_names)
+    
+    return validated_groups, errors
+
+
+def _join_names(names: Sequence[str]) -> str:
+    """Names as "A and B" or "A, B and C"."""
+    return f"{', '.join(names[:-1])} and {names[-1]}"
+
+
+@dataclass
+class RosterDiff:
+    """Changes between two rosters (diff_rosters), by student name.
+    
+    A student can be in several change lists (e.g. availability and
+    sessions). Notes-only changes are not tracked: they never affect a
+    schedule.
+    """
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    availability_changed: List[str] = field(default_factory=list)  # Mask or ranges differ
+    sessions_changed: List[str] = field(default_factory=list)
+    link_changed: List[str] = field(default_factory=list)
+    unchanged_count: int = 0
+    changed_slots: SlotSet = field(default_factory=SlotSet)  # Old and new availability of changed students
+    affected: List[str] = field(default_factory=list)  # Changed students and their linked partners, new roster order
+    
+    @property
+    def is_empty(self) -> bool:
+        """True if no student needs re-optimizing."""
+        return not (self.added or self.removed or self.availability_changed or self.sessions_changed or self.link_changed)
+    
+    def touches(self, slot: Slot) -> bool:
+        """Check a slot was in the availability of an added, removed or changed student."""
+        return slot in self.changed_slots
+    
+    def stale_classes(self, classes: List[ScheduledClass]) -> List[ScheduledClass]:
+        """Classes of a previous schedule that must be re-optimized.
+        
+        A class is stale if it holds an affected student or its slot is
+        touched (an added or changed student may now fit in it); the other
+        classes can be kept as they are.
+        """
+        affected = set(self.affected) | set(self.removed)
+        return [
+            c for c in classes
+            if c.slot in self.changed_slots or any(name in affected for name in c.students)
+        ]
+    
+    def summary(self) -> Dict[str, int]:
+        return {
+            "added": len(self.added),
+            "removed": len(self.removed),
+            "availability_changed": len(self.availability_changed),
+            "sessions_changed": len(self.sessions_changed),
+            "link_changed": len(self.link_changed),
+            "unchanged": self.unchanged_count
+        }
+
+
+def diff_rosters(old: List[Student], new: List[Student]) -> RosterDiff:
+    """Classify students between two weeks' rosters in one pass.
+    
+    Students are matched by name (dict lookups on the interned name
+    strings); availability is compared on masks and interned range tuples,
+    so the diff is linear in roster size.
+    
+    Args:
+        old: Previous roster (e.g. last week's parse_csv)
+        new: Current roster
+    
+    Returns:
+        RosterDiff; its affected list is what must be re-optimized (changed
+        students plus the partners linked to them in either roster)
+    """
+    old_by_name = {student.name: student for student in old}
+    new_names = set()
+    diff = RosterDiff()
+    changed_mask = 0
+    touched = set()
+    
+    for student in new:
+        name = student.name
+        new_names.add(name)
+        previous = old_by_name.get(name)
+        if previous is None:
+            diff.added.append(name)
+            changed_mask |= student.availability_mask
+            touched.add(name)
+            continue
+        
+        changed = False
+        if (previous.availability_mask != student.availability_mask
+                or previous.availability_ranges != student.availability_ranges):
+            diff.availability_changed.append(name)
+            changed_mask |= previous.availability_mask | student.availability_mask
+            changed = True
+        if previous.sessions_per_week != student.sessions_per_week:
+            diff.sessions_changed.append(name)
+            changed = True
+        if set(previous.linked_names) != set(student.linked_names):
+            diff.link_changed.append(name)
+            changed = True
+        
+        if changed:
+            touched.add(name)
+        else:
+            diff.unchanged_count += 1
+    
+    for student in old:
+        if student.name not in new_names:
+            diff.removed.append(student.name)
+            changed_mask |= student.availability_mask
+            touched.add(student.name)
+    
+    # Partners of changed students are re-optimized with them (old or new link)
+    partners = set()
+    for roster in (old, new):
+        for student in roster:
+            if student.name in touched:
+                partners.update(student.linked_names)
+            elif not touched.isdisjoint(student.linked_names):
+                partners.add(student.name)
+    affected = touched | partners
     
-    return validated_pairs
+    diff.changed_slots = SlotSet(changed_mask)
+    diff.affected = [student.name for student in new if student.name in affected]
+    return diff
 
 
 def parse_recurring_slots_csv_with_warnings(
     file_path: str,
-    all_students: List[Student]
+    all_students: List[Student],
+    parse_cache: Optional['ParseCache'] = None
 ) -> Tuple[List[ScheduledClass], List[Dict[str, Any]]]:
     """Parse recurring slots CSV and generate warnings for single-student slots.
     
     Args:
         file_path: Path to recurring slots CSV
         all_students: List of all students (for validation)
+        parse_cache: Optional core.cache.ParseCache to reuse a previous parse
     
     Returns:
         Tuple of (scheduled_classes, warnings)
@@ -354,7 +1239,10 @@ def parse_recurring_slots_csv_with_warnings(
     from typing import Any, Dict
     
     # Parse recurring slots (now accepts 1 student with NEEDS_VALIDATION)
-    scheduled_classes = parse_recurring_slots_csv(file_path, all_students)
+    if parse_cache is not None:
+        scheduled_classes = parse_cache.parse_recurring_slots_csv(file_path, all_students)
+    else:
+        scheduled_classes = parse_recurring_slots_csv(file_path, all_students)
     
     # Generate warnings for single-student slots
     # Import locally to avoid circular dependency (parser -> scheduler -> parser)
@@ -380,48 +1268,127 @@ def parse_recurring_slots_csv_with_warnings(
     return scheduled_classes, warnings
 
 
-def parse_recurring_slots_csv(file_path: str, all_students: List[Student]) -> List[ScheduledClass]:
+def parse_recurring_slots_csv(
+    file_path: str,
+    all_students: List[Student],
+    engine: str = DEFAULT_ENGINE
+) -> List[ScheduledClass]:
     """Parse recurring slots CSV.
     
     Args:
         file_path: Path to recurring slots CSV
         all_students: List of all students (for validation)
+        engine: CSV reader, one of CSV_ENGINES (see _read_tables)
     
     Returns:
         List of ScheduledClass objects with status=LOCKED or NEEDS_VALIDATION
     
     Raises:
         ParseError: If CSV format invalid or validation fails
+        ValueError: If engine is unknown
     """
-    # Read CSV
-    try:
-        df = pd.read_csv(file_path)
-    except FileNotFoundError:
-        raise ParseError(f"File not found: {file_path}")
-    except pd.errors.ParserError as e:
-        raise ParseError(f"Failed to parse recurring slots CSV: {e}")
+    table = next(_read_tables(file_path, None, engine, "recurring slots CSV"))
     
     # Validate required columns
-    missing_cols = set(RECURRING_REQUIRED_COLUMNS) - set(df.columns)
+    missing_cols = _missing_recurring_columns(table)
     if missing_cols:
         raise ParseError(
-            f"Recurring slots CSV missing columns: {', '.join(sorted(missing_cols))}. "
-            f"Expected: nom, jour, heure_debut, heure_fin"
+            f"Recurring slots CSV missing columns: {', '.join(missing_cols)}. "
+            f"Expected: nom, jour, heure_debut, heure_fin",
+            RosterErrorCode.MISSING_COLUMN
+        )
+    
+    scheduled_classes, errors = _check_recurring_table(table, all_students)
+    if errors:
+        raise errors[0][2]
+    return scheduled_classes
+
+
+def validate_recurring_slots(
+    path_or_buffer,
+    all_students: List[Student],
+    engine: str = DEFAULT_ENGINE,
+    rejected_names: Collection[str] = ()
+) -> RosterReport:
+    """Validate a recurring slots CSV in one pass, collecting every error.
+    
+    Same checks and messages as parse_recurring_slots_csv, but nothing is
+    raised: every invalid row and every over-capacity slot is returned in
+    a report.
+    
+    Args:
+        path_or_buffer: Path or file-like object with the CSV
+        all_students: Students of the availability CSV
+        engine: CSV reader, one of CSV_ENGINES (see _read_tables)
+        rejected_names: Availability rows with their own errors
+            (validate_roster): their recurring rows are skipped instead of
+            being reported as not found
+    
+    Returns:
+        RosterReport (report.classes holds the classes without errors)
+    
+    Raises:
+        ValueError: If engine is unknown
+    """
+    report = RosterReport()
+    try:
+        table = next(_read_tables(path_or_buffer, None, engine, "recurring slots CSV"))
+    except ParseError as e:
+        report.issues.append(RosterIssue(code=e.code, message=str(e)))
+        return report
+    
+    missing_cols = _missing_recurring_columns(table)
+    if missing_cols:
+        report.issues.extend(
+            RosterIssue(code=RosterErrorCode.MISSING_COLUMN, message=f"Missing required column: {column}", column=column)
+            for column in missing_cols
         )
+        return report
     
+    report.row_count = len(table)
+    report.classes, errors = _check_recurring_table(table, all_students, frozenset(rejected_names))
+    report.issues.extend(
+        RosterIssue(code=e.code, message=str(e), row=line, student=name) for line, name, e in errors
+    )
+    return report
+
+
+def _missing_recurring_columns(table: _CsvTable) -> List[str]:
+    """Required recurring slots columns absent from the table, sorted."""
+    return sorted(set(RECURRING_REQUIRED_COLUMNS) - set(table.columns))
+
+
+def _check_recurring_table(
+    table: _CsvTable,
+    all_students: List[Student],
+    skipped_names: Collection[str] = frozenset()
+) -> Tuple[List[ScheduledClass], List[Tuple[Optional[int], Optional[str], ParseError]]]:
+    """Check every row of a recurring slots table and group valid rows into classes.
+    
+    Returns:
+        Tuple (classes, errors): errors are (CSV line or None, student name
+        or None, ParseError), row errors in row order then capacity errors.
+        Classes over capacity are not returned
+    """
     # Build student lookup
     student_map = {s.name: s for s in all_students}
     
     # Group by slot (same slot can have multiple students)
     slot_students = {}
+    errors = []
     
-    for idx, row in df.iterrows():
+    for position, idx in enumerate(table.labels):
+        row = table.row(position)
+        name = None
         try:
             # Parse student name
             name = str(row["nom"]).strip()
+            if name in skipped_names:
+                continue
             if name not in student_map:
                 raise ParseError(
-                    f"Row {idx+2}: Student '{name}' not found in availability CSV"
+                    f"Row {idx+2}: Student '{name}' not found in availability CSV",
+                    RosterErrorCode.STUDENT_NOT_FOUND
                 )
             
             # Parse day
@@ -429,7 +1396,8 @@ def parse_recurring_slots_csv(file_path: str, all_students: List[Student]) -> Li
             if jour not in VALID_DAYS:
                 raise ParseError(
                     f"Row {idx+2} ({name}): Invalid day '{jour}'. "
-                    f"Must be one of: {', '.join(VALID_DAYS)}"
+                    f"Must be one of: {', '.join(VALID_DAYS)}",
+                    RosterErrorCode.INVALID_DAY
                 )
             
             # Parse times
@@ -437,67 +1405,53 @@ def parse_recurring_slots_csv(file_path: str, all_students: List[Student]) -> Li
                 heure_debut = parse_time(row["heure_debut"])
                 heure_fin = parse_time(row["heure_fin"])
             except ParseError as e:
-                raise ParseError(f"Row {idx+2} ({name}): {e}")
+                raise ParseError(f"Row {idx+2} ({name}): {e}", e.code)
             
             # Create slot
-            slot = Slot(
-                day=jour,
-                start_time=heure_debut,
-                end_time=heure_fin,
-                is_recurring=True
-            )
+            slot = Slot.intern(jour, heure_debut, heure_fin, is_recurring=True)
             
             # Validate slot
             if not slot.is_valid():
                 raise ParseError(
                     f"Row {idx+2} ({name}): Invalid slot. "
-                    f"Duration must be 1h and times must be :00 or :30"
+                    f"Duration must be 1h and times must be :00 or :30",
+                    RosterErrorCode.INVALID_SLOT
                 )
             
             # Check slot is within student's availability
             # Accept if the recurring slot is INCLUDED in any availability range
+            # (e.g. 08:30-09:30 within 08:00-13:00)
             student = student_map[name]
-            
-            # Get all availability slots for this day
-            day_slots = [s for s in student.available_slots if s.day == jour]
-            
-            if not day_slots:
-                raise ParseError(
-                    f"Row {idx+2} ({name}): No availability on {jour}"
-                )
-            
-            # Find min/max time for this day to determine availability range
-            # This handles cases like 08:00-13:00 availability containing 08:30-09:30 recurring slot
-            min_start = min(s.start_time for s in day_slots)
-            max_end = max(s.end_time for s in day_slots)
-            
-            # Check if recurring slot is within this range
-            if not (heure_debut >= min_start and heure_fin <= max_end):
+            if not student.covers(slot):
+                day_ranges = student.ranges_on(jour)
+                available = ", ".join(str(r) for r in day_ranges) if day_ranges else f"no availability on {jour}"
                 raise ParseError(
                     f"Row {idx+2} ({name}): Recurring slot {jour} {heure_debut}-{heure_fin} "
-                    f"not within student's availability range ({min_start}-{max_end})"
+                    f"not in student's availability ({available})",
+                    RosterErrorCode.SLOT_NOT_AVAILABLE
                 )
             
-            # Group students by slot
-            slot_key = (slot.day, slot.start_time, slot.end_time)
-            if slot_key not in slot_students:
-                slot_students[slot_key] = (slot, [])
-            slot_students[slot_key][1].append(name)
-            
-        except ParseError:
-            raise
+            # Group students by slot ID
+            if slot.id not in slot_students:
+                slot_students[slot.id] = (slot, [])
+            slot_students[slot.id][1].append(name)
+        
+        except ParseError as e:
+            errors.append((idx + 2, None if _is_missing(row["nom"]) else name, e))
         except Exception as e:
-            raise ParseError(f"Row {idx+2}: Unexpected error: {e}")
+            errors.append((idx + 2, None, ParseError(f"Row {idx+2}: Unexpected error: {e}", RosterErrorCode.UNEXPECTED)))
     
     # Create ScheduledClass objects
     scheduled_classes = []
-    for (day, start, end), (slot, students_names) in slot_students.items():
+    for slot, students_names in slot_students.values():
         # Validate capacity (max 3 students per class)
         if len(students_names) > 3:
-            raise ParseError(
-                f"Recurring slot {day} {start}-{end} has {len(students_names)} students. "
-                f"Maximum 3 students per class."
-            )
+            errors.append((None, None, ParseError(
+                f"Recurring slot {slot.day} {slot.start_time}-{slot.end_time} has {len(students_names)} students. "
+                f"Maximum 3 students per class.",
+                RosterErrorCode.CLASS_OVER_CAPACITY
+            )))
+            continue
         
         # Status: LOCKED if 2-3 students, NEEDS_VALIDATION if 1 student
         status = SlotStatus.LOCKED if len(students_names) >= 2 else SlotStatus.NEEDS_VALIDATION
@@ -509,4 +1463,4 @@ def parse_recurring_slots_csv(file_path: str, all_students: List[Student]) -> Li
         )
         scheduled_classes.append(scheduled_class)
     
-    return scheduled_classes
+    return scheduled_classes, errors
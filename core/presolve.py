@@ -0,0 +1,147 @@
+"""
+Presolve: prune slots and students that can never be part of a solution.
+
+This module is responsible for:
+- Dropping candidate slots that fewer than min_students_per_class live
+  students can attend (no class can open there)
+- Dropping students whose live slots cannot hold their remaining sessions
+  (fewer pairwise non-overlapping slots than sessions)
+- Repeating both until nothing changes (each removal can starve the other
+  side), and recording why each slot and student went
+
+Slots overlapping the skeleton or a coach reserved slot are never
+candidates (ProblemMatrix.build); they are only counted here.
+
+The reduced problem keeps rows and columns: pruned slots stop being
+candidates and pruned students need no sessions, so the CP-SAT model
+(core.model_builder) simply has fewer variables and constraints, and
+solutions map back to the same indices.
+"""
+
+from dataclasses import dataclass, replace
+from typing import Any, Dict
+
+import numpy as np
+
+from .problem import ProblemMatrix
+
+# Slot removal reasons
+SLOT_OVERLAPS_SKELETON = "overlaps_skeleton"  # Excluded by ProblemMatrix.build
+SLOT_RESERVED = "coach_reserved"  # Excluded by ProblemMatrix.build
+SLOT_TOO_FEW_STUDENTS = "too_few_students"
+
+# Student removal reasons
+STUDENT_TOO_FEW_SLOTS = "too_few_slots"
+
+
+@dataclass
+class PresolveResult:
+    """Outcome of presolve on one problem."""
+    problem: ProblemMatrix  # Reduced problem, same rows and columns
+    removed_slots: Dict[int, str]  # slot column → reason (excluded slots included)
+    removed_students: Dict[int, str]  # student row → reason
+    reachable_slots: np.ndarray  # int (n_students,) non-overlapping live slots, when last live
+    rounds: int  # Rounds that removed something
+    pairs_before: int  # Candidate (student, slot) pairs before presolve
+    pairs_after: int
+    
+    def stats(self) -> Dict[str, Any]:
+        """JSON-serializable summary (ScheduleResult.metadata["presolve"])."""
+        slot_reasons: Dict[str, int] = {}
+        for reason in self.removed_slots.values():
+            slot_reasons[reason] = slot_reasons.get(reason, 0) + 1
+        student_reasons: Dict[str, int] = {}
+        for reason in self.removed_students.values():
+            student_reasons[reason] = student_reasons.get(reason, 0) + 1
+        return {
+            "rounds": self.rounds,
+            "candidate_slots": int(self.problem.is_candidate.sum()),
+            "students_to_place": int(self.problem.remaining_student_indices().size),
+            "removed_slots": slot_reasons,
+            "removed_students": student_reasons,
+            "pairs_before": self.pairs_before,
+            "pairs_after": self.pairs_after
+        }
+
+
+def presolve(problem: ProblemMatrix, min_students_per_class: int = 2) -> PresolveResult:
+    """Prune slots and students that no solution can use.
+    
+    Removals follow from the hard constraints (class size, exact session
+    count, one class at a time), but they change the problem: a pruned
+    student is reported unplaced with its reason, where the full model
+    would have made the phase infeasible.
+    
+    Args:
+        problem: Shared problem matrix (students × slots)
+        min_students_per_class: Smallest class that may open
+    
+    Returns:
+        PresolveResult with the reduced problem and removal reasons
+    """
+    removed_slots: Dict[int, str] = {}
+    for j in np.flatnonzero(~problem.is_candidate).tolist():
+        removed_slots[j] = SLOT_OVERLAPS_SKELETON if problem.overlaps_skeleton[j] else SLOT_RESERVED
+    removed_students: Dict[int, str] = {}
+    
+    live_slots = problem.is_candidate.copy()
+    live_students = problem.remaining_sessions > 0
+    pairs_before = int((problem.availability & live_students[:, None] & live_slots[None, :]).sum())
+    reachable = np.zeros(problem.num_students, dtype=np.int64)
+    rounds = 0
+    
+    while True:
+        reach = problem.availability & live_students[:, None] & live_slots[None, :]
+        
+        # Slots no class can open on
+        dead_slots = live_slots & (reach.sum(axis=0) < min_students_per_class)
+        
+        # Students who cannot fit their sessions
+        reachable[live_students] = _max_disjoint_slots(problem, reach)[live_students]
+        dead_students = live_students & (reachable < problem.remaining_sessions)
+        
+        if not dead_slots.any() and not dead_students.any():
+            break
+        rounds += 1
+        for j in np.flatnonzero(dead_slots).tolist():
+            removed_slots[j] = SLOT_TOO_FEW_STUDENTS
+        for i in np.flatnonzero(dead_students).tolist():
+            removed_students[i] = STUDENT_TOO_FEW_SLOTS
+        live_slots &= ~dead_slots
+        live_students &= ~dead_students
+    
+    reduced = replace(
+        problem,
+        is_candidate=live_slots,
+        remaining_sessions=np.where(live_students, problem.remaining_sessions, 0)
+    )
+    return PresolveResult(
+        problem=reduced,
+        removed_slots=removed_slots,
+        removed_students=removed_students,
+        reachable_slots=reachable,
+        rounds=rounds,
+        pairs_before=pairs_before,
+        pairs_after=int(reach.sum())
+    )
+
+
+def _max_disjoint_slots(problem: ProblemMatrix, reach: np.ndarray) -> np.ndarray:
+    """Per student, the most pairwise non-overlapping slots among reach.
+    
+    Earliest-end-first greedy (optimal for interval scheduling), run for
+    every student at once: one vectorized step per slot column, in
+    (day, end, start) order.
+    """
+    order = np.lexsort((problem.slot_start_minutes, problem.slot_end_minutes, problem.slot_days))
+    count = np.zeros(problem.num_students, dtype=np.int64)
+    last_end = np.full(problem.num_students, -1, dtype=np.int64)
+    day = None
+    for j in order.tolist():
+        if problem.slot_days[j] != day:
+            day = problem.slot_days[j]
+            last_end[:] = -1
+        take = reach[:, j] & (problem.slot_start_minutes[j] >= last_end)
+        count += take
+        last_end[take] = problem.slot_end_minutes[j]
+    return count
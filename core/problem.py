@@ -0,0 +1,211 @@
+"""
+Shared NumPy representation of a scheduling problem.
+
+This module is responsible for:
+- Building a student × slot boolean availability matrix once per run
+- Tracking remaining sessions per student after the skeleton
+- Indexing linked groups and candidate slot metadata
+- Vectorized candidate (student, slot) pair enumeration for the solver
+- Time-point cliques of overlapping candidate slots (one AddAtMostOne each)
+
+The solver, optimization suggestions and unplaced explanations all read
+from the same ProblemMatrix instead of rescanning Student.available_slots.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from .models import Student, Slot, SlotSet, ScheduledClass, WEEK_DAYS
+
+
+def _masks_to_matrix(masks: List[int], column_ids: np.ndarray) -> np.ndarray:
+    """Unpack availability masks into a boolean matrix restricted to column_ids.
+    
+    Each Python int mask is serialized little-endian and unpacked with
+    np.unpackbits, so the whole matrix is built in a few vectorized calls.
+    """
+    if not masks or column_ids.size == 0:
+        return np.zeros((len(masks), column_ids.size), dtype=bool)
+    
+    num_bits = int(column_ids.max()) + 1
+    num_bytes = (num_bits + 7) // 8
+    limit = (1 << num_bits) - 1
+    packed = b"".join((mask & limit).to_bytes(num_bytes, "little") for mask in masks)
+    
+    bytes_matrix = np.frombuffer(packed, dtype=np.uint8).reshape(len(masks), num_bytes)
+    bits = np.unpackbits(bytes_matrix, axis=1, bitorder="little")
+    return bits[:, column_ids].astype(bool)
+
+
+@dataclass
+class ProblemMatrix:
+    """Student × slot view of a scheduling problem.
+    
+    Rows are all students (input order), columns are every slot at least one
+    student is available on (sorted by slot ID).
+    """
+    students: List[Student]
+    slots: List[Slot]
+    availability: np.ndarray  # bool (n_students, n_slots)
+    remaining_sessions: np.ndarray  # int (n_students,) sessions left after skeleton
+    linked_pairs: np.ndarray  # int (n_pairs, 2) row indices, first < second
+    linked_groups: List[Tuple[int, ...]]  # Sorted row indices of each linked group (2-3 students)
+    is_candidate: np.ndarray  # bool (n_slots,) overlaps no skeleton or coach reserved slot
+    overlaps_skeleton: np.ndarray  # bool (n_slots,) overlaps a skeleton class
+    slot_days: np.ndarray  # int (n_slots,) index in WEEK_DAYS, -1 if off-grid
+    slot_start_minutes: np.ndarray  # int (n_slots,)
+    slot_end_minutes: np.ndarray  # int (n_slots,)
+    student_index: Dict[str, int]
+    slot_index: Dict[int, int]  # slot ID → column
+    
+    @classmethod
+    def build(
+        cls,
+        students: List[Student],
+        skeleton: Dict[Slot, ScheduledClass],
+        coach_reserved_slots: List[Slot]
+    ) -> 'ProblemMatrix':
+        """Build the matrix once from students, skeleton and coach reserved slots.
+        
+        Args:
+            students: List of all students
+            skeleton: Dictionary of locked recurring classes
+            coach_reserved_slots: Slots reserved by coach (never used)
+        
+        Returns:
+            ProblemMatrix for this run
+        """
+        masks = [student.availability_mask for student in students]
+        universe = SlotSet.union_of(masks)
+        
+        slot_ids = np.fromiter(universe.ids(), dtype=np.int64)
+        slots = [Slot.from_id(int(slot_id)) for slot_id in slot_ids]
+        availability = _masks_to_matrix(masks, slot_ids)
+        
+        # Remaining sessions after skeleton placements
+        placed_counts: Dict[str, int] = {}
+        for scheduled_class in skeleton.values():
+            for name in scheduled_class.students:
+                placed_counts[name] = placed_counts.get(name, 0) + 1
+        remaining_sessions = np.array(
+            [student.sessions_per_week - placed_counts.get(student.name, 0) for student in students],
+            dtype=np.int64
+        )
+        remaining_sessions = np.maximum(remaining_sessions, 0)
+        
+        # Linked groups (each student with the linked students found) and
+        # the pairs within them (unordered, deduplicated)
+        student_index = {student.name: i for i, student in enumerate(students)}
+        groups = set()
+        for i, student in enumerate(students):
+            group = {i}
+            group.update(student_index[name] for name in student.linked_names if name in student_index)
+            if len(group) > 1:
+                groups.add(tuple(sorted(group)))
+        linked_groups = sorted(groups)
+        pairs = {(a, b) for group in linked_groups for k, a in enumerate(group) for b in group[k + 1:]}
+        linked_pairs = np.array(sorted(pairs), dtype=np.int64).reshape(-1, 2)
+        
+        # Slot metadata: candidates exclude every slot overlapping a skeleton
+        # class or a coach reserved slot, partial (half-hour offset) overlaps included
+        skeleton_set = SlotSet.from_slots(skeleton.keys())
+        blocked = skeleton_set | SlotSet.from_slots(coach_reserved_slots)
+        candidates = universe.without_overlapping(blocked)
+        overlapping_skeleton = skeleton_set.expand_overlapping(within=universe)
+        is_candidate = np.array([slot in candidates for slot in slots], dtype=bool)
+        overlaps_skeleton = np.array([slot in overlapping_skeleton for slot in slots], dtype=bool)
+        day_index = {day: i for i, day in enumerate(WEEK_DAYS)}
+        slot_days = np.array([day_index.get(slot.day, -1) for slot in slots], dtype=np.int64)
+        slot_start_minutes = np.array([slot.start_minutes for slot in slots], dtype=np.int64)
+        slot_end_minutes = np.array([slot.end_minutes for slot in slots], dtype=np.int64)
+        
+        return cls(
+            students=students,
+            slots=slots,
+            availability=availability,
+            remaining_sessions=remaining_sessions,
+            linked_pairs=linked_pairs,
+            linked_groups=linked_groups,
+            is_candidate=is_candidate,
+            overlaps_skeleton=overlaps_skeleton,
+            slot_days=slot_days,
+            slot_start_minutes=slot_start_minutes,
+            slot_end_minutes=slot_end_minutes,
+            student_index=student_index,
+            slot_index={slot.id: j for j, slot in enumerate(slots)}
+        )
+    
+    @property
+    def num_students(self) -> int:
+        return len(self.students)
+    
+    @property
+    def num_slots(self) -> int:
+        return len(self.slots)
+    
+    def remaining_student_indices(self) -> np.ndarray:
+        """Rows of students that still need sessions after the skeleton."""
+        return np.flatnonzero(self.remaining_sessions > 0)
+    
+    def candidate_slot_indices(self) -> np.ndarray:
+        """Columns of slots the solver may open (not skeleton, not reserved)."""
+        return np.flatnonzero(self.is_candidate)
+    
+    def candidate_pairs(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized (student row, slot column) pairs the solver needs variables for.
+        
+        Returns:
+            Tuple (rows, columns) from np.nonzero, in row-major order
+        """
+        needs_sessions = self.remaining_sessions > 0
+        return np.nonzero(self.availability & needs_sessions[:, None] & self.is_candidate[None, :])
+    
+    def student_slot_indices(self, student_idx: int) -> np.ndarray:
+        """Columns where a student is available (chronological)."""
+        return np.flatnonzero(self.availability[student_idx])
+    
+    def available_student_indices(self, slot: Slot) -> np.ndarray:
+        """Rows of students available on a slot (empty if nobody is)."""
+        column = self.slot_index.get(slot.id)
+        if column is None:
+            return np.zeros(0, dtype=np.int64)
+        return np.flatnonzero(self.availability[:, column])
+    
+    def overlap_cliques(self, columns: np.ndarray) -> List[np.ndarray]:
+        """Groups of columns whose slots all cover a common time point.
+        
+        Slots are half-open intervals, so two slots overlap iff both cover
+        the later of their two starts: the slots covering each distinct
+        start time of a day form a clique, and every overlapping pair
+        shares at least one of these cliques. A run of on-grid 1h slots
+        thus gives one clique per half-hour, instead of one constraint
+        per overlapping pair.
+        
+        Args:
+            columns: Slot columns to group (e.g. candidate_slot_indices())
+        
+        Returns:
+            Distinct cliques of 2+ columns (sorted), by day then time point
+        """
+        columns_by_day: Dict[str, List[int]] = {}
+        for j in np.asarray(columns).tolist():
+            columns_by_day.setdefault(self.slots[j].day, []).append(j)
+        
+        cliques = []
+        for day_columns in columns_by_day.values():
+            day_columns = np.array(sorted(day_columns), dtype=np.int64)
+            starts = self.slot_start_minutes[day_columns]
+            ends = self.slot_end_minutes[day_columns]
+            points = np.unique(starts)
+            # covers[p, k]: slot k covers time point p
+            covers = (starts[None, :] <= points[:, None]) & (points[:, None] < ends[None, :])
+            previous = None
+            for row in covers:
+                clique = day_columns[row]
+                if clique.size < 2 or (previous is not None and np.array_equal(clique, previous)):
+                    continue
+                cliques.append(clique)
+                previous = clique
+        return cliques
@@ -12,20 +12,44 @@ Two-phase algorithm:
 2. Variations: Optimize placement of remaining students
 """
 
-from typing import List, Dict, Tuple, Optional, Set
+from typing import List, Dict, Tuple, Optional, Set, TYPE_CHECKING
 from datetime import time
 import time as time_module
 
-try:
-    from ortools.sat.python import cp_model
-except ImportError:
-    cp_model = None  # Will be installed later
+# OR-Tools is imported on first solve (_import_cp_model): it loads pandas,
+# which callers that never solve (validation, suggestions) should not pay for
+cp_model = None
 
 from .models import (
     Student, Slot, ScheduledClass, SlotStatus, UnplacedStudent, ScheduleResult,
-    ValidationResult, SchedulingConstraints
+    ValidationResult, SchedulingConstraints, slots_to_mask, iter_slot_ids,
+    conflict_mask
 )
 from .parser import parse_recurring_slots_csv, parse_recurring_slots_csv_with_warnings
+from .model_builder import build_model, ModelLayout
+from .presolve import presolve, PresolveResult, SLOT_TOO_FEW_STUDENTS
+from .problem import ProblemMatrix
+
+if TYPE_CHECKING:
+    from .cache import ParseCache
+
+
+def _import_cp_model():
+    """Import ortools.sat.python.cp_model once, into the module global.
+    
+    Raises:
+        ImportError: If OR-Tools is not installed
+    """
+    global cp_model
+    if cp_model is None:
+        try:
+            from ortools.sat.python import cp_model as module
+        except ImportError:
+            raise ImportError(
+                "OR-Tools not installed. Please install: pip install ortools"
+            )
+        cp_model = module
+    return cp_model
 
 
 # ============================================================================
@@ -80,16 +104,28 @@ def validate_skeleton(
     student_map = {s.name: s for s in all_students}
     
     # Check 1: No overlap between ANY courses (UN SEUL COURS À LA FOIS)
+    # Look up conflicting slot IDs in the overlap index instead of testing every pair
+    class_indices_by_slot = {}
+    for i, scheduled_class in enumerate(skeleton):
+        class_indices_by_slot.setdefault(scheduled_class.slot.id, []).append(i)
+    skeleton_mask = slots_to_mask(c.slot for c in skeleton)
+    
     for i, class1 in enumerate(skeleton):
-        for class2 in skeleton[i+1:]:
-            if class1.slot.overlaps(class2.slot):
-                errors.append(
-                    f"Courses overlap (UN SEUL COURS À LA FOIS violated): "
-                    f"{class1.slot.day} {class1.slot.start_time}-{class1.slot.end_time} "
-                    f"({', '.join(class1.students)}) overlaps with "
-                    f"{class2.slot.day} {class2.slot.start_time}-{class2.slot.end_time} "
-                    f"({', '.join(class2.students)})"
-                )
+        overlapping_indices = sorted(
+            k
+            for slot_id in iter_slot_ids(conflict_mask(class1.slot.id, skeleton_mask))
+            for k in class_indices_by_slot[slot_id]
+            if k > i
+        )
+        for k in overlapping_indices:
+            class2 = skeleton[k]
+            errors.append(
+                f"Courses overlap (UN SEUL COURS À LA FOIS violated): "
+                f"{class1.slot.day} {class1.slot.start_time}-{class1.slot.end_time} "
+                f"({', '.join(class1.students)}) overlaps with "
+                f"{class2.slot.day} {class2.slot.start_time}-{class2.slot.end_time} "
+                f"({', '.join(class2.students)})"
+            )
     
     # Check 2: Capacity per class (2-3 students)
     for scheduled_class in skeleton:
@@ -132,37 +168,37 @@ def validate_skeleton(
             student = student_map[student_name]
             slot = scheduled_class.slot
             
-            # Get all availability slots for this day
-            day_slots = [s for s in student.available_slots if s.day == slot.day]
-            
-            if not day_slots:
+            # Recurring slots at :30 are valid within a :00 availability range
+            if not student.ranges_on(slot.day):
                 errors.append(
                     f"Recurring slot {slot.day} {slot.start_time} "
                     f"for {student_name} has no availability on that day"
                 )
-                continue
-            
-            # Find min/max time for this day to determine availability range
-            # This allows recurring slots at :30 to be valid within a :00 availability range
-            min_start = min(s.start_time for s in day_slots)
-            max_end = max(s.end_time for s in day_slots)
-            
-            # Check if recurring slot is within this range (not exact match)
-            if not (slot.start_time >= min_start and slot.end_time <= max_end):
+            elif not student.covers(slot):
                 errors.append(
                     f"Recurring slot {slot.day} {slot.start_time} "
                     f"for {student_name} not in their availability"
                 )
     
     # Check 5: No overlap with coach reserved slots
+    reserved_indices_by_slot = {}
+    for k, reserved_slot in enumerate(coach_reserved):
+        reserved_indices_by_slot.setdefault(reserved_slot.id, []).append(k)
+    reserved_mask = slots_to_mask(coach_reserved)
+    
     for scheduled_class in skeleton:
-        for reserved_slot in coach_reserved:
-            if scheduled_class.slot.overlaps(reserved_slot):
-                errors.append(
-                    f"Recurring class {scheduled_class.slot.day} {scheduled_class.slot.start_time} "
-                    f"overlaps with coach reserved slot "
-                    f"{reserved_slot.day} {reserved_slot.start_time}-{reserved_slot.end_time}"
-                )
+        overlapping_indices = sorted(
+            k
+            for slot_id in iter_slot_ids(conflict_mask(scheduled_class.slot.id, reserved_mask))
+            for k in reserved_indices_by_slot[slot_id]
+        )
+        for k in overlapping_indices:
+            reserved_slot = coach_reserved[k]
+            errors.append(
+                f"Recurring class {scheduled_class.slot.day} {scheduled_class.slot.start_time} "
+                f"overlaps with coach reserved slot "
+                f"{reserved_slot.day} {reserved_slot.start_time}-{reserved_slot.end_time}"
+            )
     
     is_valid = len(errors) == 0
     return ValidationResult(is_valid=is_valid, errors=errors, warnings=warnings)
@@ -171,7 +207,8 @@ def validate_skeleton(
 def generate_optimization_suggestions(
     slot: Slot,
     current_student: str,
-    all_students: List[Student]
+    all_students: List[Student],
+    problem: Optional[ProblemMatrix] = None
 ) -> List[str]:
     """Generate suggestions for optimizing a single-student recurring slot.
     
@@ -183,6 +220,8 @@ def generate_optimization_suggestions(
         slot: The recurring slot with only 1 student
         current_student: Name of the current student in the slot
         all_students: List of all students
+        problem: Optional ProblemMatrix; if given, compatible students are
+            read from the slot's availability column instead of scanned
     
     Returns:
         List of suggestion strings for optimization
@@ -191,20 +230,19 @@ def generate_optimization_suggestions(
     compatible_students = []
     
     # Find students available on this slot
-    for student in all_students:
-        if student.name == current_student:
-            continue
-        
-        # Check if student is available on this slot
-        is_available = any(
-            avail_slot.day == slot.day and
-            avail_slot.start_time == slot.start_time and
-            avail_slot.end_time == slot.end_time
-            for avail_slot in student.available_slots
-        )
-        
-        if is_available:
-            compatible_students.append(student.name)
+    if problem is not None:
+        for i in problem.available_student_indices(slot):
+            name = problem.students[i].name
+            if name != current_student:
+                compatible_students.append(name)
+    else:
+        for student in all_students:
+            if student.name == current_student:
+                continue
+            
+            # Check if student is available on this slot
+            if _is_student_available_for_slot(student, slot):
+                compatible_students.append(student.name)
     
     if compatible_students:
         # Show top 3 compatible students
@@ -282,35 +320,15 @@ def optimize_variations(
     Returns:
         ScheduleResult with complete or partial solution
     """
-    if cp_model is None:
-        raise ImportError(
-            "OR-Tools not installed. Please install: pip install ortools"
-        )
+    _import_cp_model()
     
     start_time = time_module.time()
     
-    # Get students already placed in skeleton
-    skeleton_placements = get_placed_students_from_skeleton(skeleton)
-    
-    # Filter students who still need placement
-    remaining_students = []
-    for student in all_students:
-        already_placed = skeleton_placements.get(student.name, 0)
-        remaining_sessions = student.sessions_per_week - already_placed
-        
-        if remaining_sessions > 0:
-            # Create a modified student with remaining sessions
-            remaining_student = Student(
-                name=student.name,
-                sessions_per_week=remaining_sessions,
-                available_slots=student.available_slots,
-                linked_group=student.linked_group,
-                notes=student.notes
-            )
-            remaining_students.append(remaining_student)
+    # Build the shared problem representation once for all phases
+    problem = ProblemMatrix.build(all_students, skeleton, constraints.coach_reserved_slots)
     
     # If no students need placement, return skeleton as final schedule
-    if not remaining_students:
+    if not problem.remaining_student_indices().size:
         return ScheduleResult(
             schedule=list(skeleton.values()),
             unplaced=[],
@@ -322,27 +340,26 @@ def optimize_variations(
             }
         )
     
-    # Collect all available slots (excluding skeleton and reserved)
-    all_available_slots = _collect_available_slots(
-        all_students,
-        skeleton,
-        constraints.coach_reserved_slots
-    )
+    # Prune slots and students no solution can use (smaller models, and
+    # students who cannot fit their sessions no longer make every phase infeasible)
+    presolved = presolve(problem, constraints.min_students_per_class)
     
     # Try progressive timeout phases
     result = None
     
     # Phase 2a: All constraints (0-5 sec)
     result = _run_cp_sat_solver(
-        remaining_students,
-        all_available_slots,
+        problem,
         skeleton,
         constraints,
         timeout_sec=5.0,
-        include_soft_constraints=True
+        include_soft_constraints=True,
+        presolved=presolved
     )
     
-    if result.is_complete():
+    # Students pruned by presolve can never be placed: a phase is done once
+    # they are the only ones left
+    if len(result.unplaced) == len(presolved.removed_students):
         result.metadata["phase"] = "2a_all_constraints"
         result.metadata["execution_time_sec"] = time_module.time() - start_time
         return result
@@ -351,15 +368,15 @@ def optimize_variations(
     elapsed = time_module.time() - start_time
     if elapsed < 10.0:
         result = _run_cp_sat_solver(
-            remaining_students,
-            all_available_slots,
+            problem,
             skeleton,
             constraints,
             timeout_sec=10.0 - elapsed,
-            include_soft_constraints=False
+            include_soft_constraints=False,
+            presolved=presolved
         )
         
-        if result.is_complete():
+        if len(result.unplaced) == len(presolved.removed_students):
             result.metadata["phase"] = "2b_hard_only"
             result.metadata["execution_time_sec"] = time_module.time() - start_time
             return result
@@ -368,13 +385,13 @@ def optimize_variations(
     elapsed = time_module.time() - start_time
     if elapsed < 15.0:
         result = _run_cp_sat_solver(
-            remaining_students,
-            all_available_slots,
+            problem,
             skeleton,
             constraints,
             timeout_sec=15.0 - elapsed,
             include_soft_constraints=False,
-            maximize_placements=True
+            maximize_placements=True,
+            presolved=presolved
         )
     
     # Return best partial solution found
@@ -383,185 +400,35 @@ def optimize_variations(
     return result
 
 
-def _collect_available_slots(
-    all_students: List[Student],
-    skeleton: Dict[Slot, ScheduledClass],
-    coach_reserved: List[Slot]
-) -> List[Slot]:
-    """Collect all unique available slots from students, excluding used ones.
-    
-    Args:
-        all_students: List of all students
-        skeleton: Skeleton schedule (slots already used)
-        coach_reserved: Coach reserved slots (never used)
-    
-    Returns:
-        List of available Slot objects
-    """
-    # Collect all unique slots from all students
-    all_slots_set = set()
-    for student in all_students:
-        for slot in student.available_slots:
-            all_slots_set.add(slot)
-    
-    # Remove skeleton slots
-    skeleton_slots = set(skeleton.keys())
-    all_slots_set -= skeleton_slots
-    
-    # Remove coach reserved slots
-    reserved_set = set(coach_reserved)
-    all_slots_set -= reserved_set
-    
-    return list(all_slots_set)
-
-
 def _run_cp_sat_solver(
-    students: List[Student],
-    available_slots: List[Slot],
+    problem: ProblemMatrix,
     skeleton: Dict[Slot, ScheduledClass],
     constraints: SchedulingConstraints,
     timeout_sec: float,
     include_soft_constraints: bool = True,
-    maximize_placements: bool = False
+    maximize_placements: bool = False,
+    presolved: Optional[PresolveResult] = None
 ) -> ScheduleResult:
     """Run OR-Tools CP-SAT solver with given parameters.
     
     Args:
-        students: Students to place
-        available_slots: Available slots for placement
+        problem: Shared problem matrix (students × slots)
         skeleton: Locked skeleton schedule
         constraints: Scheduling constraints
         timeout_sec: Timeout in seconds
         include_soft_constraints: Whether to include soft constraints
         maximize_placements: If True, maximize number of placements (partial solution)
+        presolved: Presolve of problem; the model is built from its reduced
+            problem and pruned students are explained from its reasons
     
     Returns:
         ScheduleResult with solution or partial solution
     """
-    model = cp_model.CpModel()
-    
-    # Create variables: assignment[student_idx][slot_idx] = BoolVar
-    num_students = len(students)
-    num_slots = len(available_slots)
-    
-    assignments = {}
-    for i in range(num_students):
-        for j in range(num_slots):
-            # Only create variable if student available for this slot
-            student = students[i]
-            slot = available_slots[j]
-            
-            if _is_student_available_for_slot(student, slot):
-                assignments[(i, j)] = model.NewBoolVar(f"assign_s{i}_slot{j}")
-    
-    # HARD CONSTRAINTS
-    
-    # Constraint 1: Each student placed exactly sessions_per_week times
-    for i, student in enumerate(students):
-        student_vars = [assignments[(i, j)] for j in range(num_slots) if (i, j) in assignments]
-        model.Add(sum(student_vars) == student.sessions_per_week)
-    
-    # Constraint 2: Slot capacity (2-3 students per class)
-    slot_students = {}  # slot_idx → list of student vars assigned to this slot
-    for (i, j), var in assignments.items():
-        if j not in slot_students:
-            slot_students[j] = []
-        slot_students[j].append(var)
-    
-    for j, vars_list in slot_students.items():
-        total_students = sum(vars_list)
-        # Only enforce capacity if slot is used (at least 1 student)
-        # We'll use: if any student assigned, then 2-3 students
-        slot_used = model.NewBoolVar(f"slot{j}_used")
-        model.Add(total_students >= 1).OnlyEnforceIf(slot_used)
-        model.Add(total_students == 0).OnlyEnforceIf(slot_used.Not())
-        
-        # If slot used, enforce 2-3 students
-        model.Add(total_students >= 2).OnlyEnforceIf(slot_used)
-        model.Add(total_students <= 3).OnlyEnforceIf(slot_used)
-    
-    # Constraint 3: UN SEUL COURS À LA FOIS (no overlap between classes)
-    # For each pair of slots that overlap, at most one can be used
-    for j1 in range(num_slots):
-        for j2 in range(j1 + 1, num_slots):
-            slot1 = available_slots[j1]
-            slot2 = available_slots[j2]
-            
-            if slot1.overlaps(slot2):
-                # At most one of these slots can be used
-                if j1 in slot_students and j2 in slot_students:
-                    slot1_used = model.NewBoolVar(f"overlap_s{j1}_used")
-                    slot2_used = model.NewBoolVar(f"overlap_s{j2}_used")
-                    
-                    # slot1_used iff any student in slot1
-                    model.Add(sum(slot_students[j1]) >= 1).OnlyEnforceIf(slot1_used)
-                    model.Add(sum(slot_students[j1]) == 0).OnlyEnforceIf(slot1_used.Not())
-                    
-                    # slot2_used iff any student in slot2
-                    model.Add(sum(slot_students[j2]) >= 1).OnlyEnforceIf(slot2_used)
-                    model.Add(sum(slot_students[j2]) == 0).OnlyEnforceIf(slot2_used.Not())
-                    
-                    # At most one can be used
-                    model.Add(slot1_used + slot2_used <= 1)
-    
-    # Check overlap with skeleton slots
-    for j in range(num_slots):
-        slot = available_slots[j]
-        for skeleton_slot in skeleton.keys():
-            if slot.overlaps(skeleton_slot):
-                # This available slot cannot be used
-                if j in slot_students:
-                    model.Add(sum(slot_students[j]) == 0)
-    
-    # Constraint 4: Linked groups (partial linking)
-    student_name_to_idx = {s.name: i for i, s in enumerate(students)}
-    
-    for i, student in enumerate(students):
-        if student.linked_group and student.linked_group in student_name_to_idx:
-            linked_idx = student_name_to_idx[student.linked_group]
-            linked_student = students[linked_idx]
-            
-            # Min sessions together = min(student.sessions, linked.sessions)
-            min_together = min(student.sessions_per_week, linked_student.sessions_per_week)
-            
-            # For each slot where both are assigned, count as "together"
-            together_vars = []
-            for j in range(num_slots):
-                if (i, j) in assignments and (linked_idx, j) in assignments:
-                    both_assigned = model.NewBoolVar(f"together_s{i}_s{linked_idx}_slot{j}")
-                    model.AddMultiplicationEquality(
-                        both_assigned,
-                        [assignments[(i, j)], assignments[(linked_idx, j)]]
-                    )
-                    together_vars.append(both_assigned)
-            
-            # At least min_together sessions together
-            if together_vars:
-                model.Add(sum(together_vars) >= min_together)
-    
-    # SOFT CONSTRAINTS (if enabled)
-    objective_terms = []
-    
-    if include_soft_constraints:
-        # Soft 1: Respect recurring habits (weight 10)
-        # TODO: Implement if we have recurring habit data
-        
-        # Soft 2: Balance load per day (weight 5)
-        # TODO: Implement day balance penalty
-        
-        # Soft 3: Fill existing classes 2→3 before new slot (weight 3)
-        # Favor slots that already have 1-2 students from skeleton
-        for j in slot_students:
-            # Penalty for creating new slot vs filling existing
-            objective_terms.append(-3 * sum(slot_students[j]))
-    
-    # OBJECTIVE
-    if maximize_placements:
-        # Maximize total placements (for partial solution)
-        total_placements = sum(assignments.values())
-        model.Maximize(total_placements)
-    elif objective_terms:
-        model.Maximize(sum(objective_terms))
+    model_problem = presolved.problem if presolved is not None else problem
+    model, layout = _build_cp_model(
+        model_problem, include_soft_constraints, maximize_placements,
+        constraints.min_students_per_class, constraints.max_students_per_class
+    )
     
     # SOLVE
     solver = cp_model.CpSolver()
@@ -570,74 +437,104 @@ def _run_cp_sat_solver(
     status = solver.Solve(model)
     
     # EXTRACT SOLUTION
-    return _extract_solution(
+    result = _extract_solution(
         solver,
         status,
-        students,
-        available_slots,
-        assignments,
+        problem,
+        layout,
         skeleton,
-        constraints
+        constraints,
+        presolved
     )
+    if presolved is not None:
+        result.metadata["presolve"] = presolved.stats()
+    return result
 
 
-def _is_student_available_for_slot(student: Student, slot: Slot) -> bool:
-    """Check if student is available for a given slot."""
-    return any(
-        avail_slot.day == slot.day and
-        avail_slot.start_time == slot.start_time and
-        avail_slot.end_time == slot.end_time
-        for avail_slot in student.available_slots
+def _build_cp_model(
+    problem: ProblemMatrix,
+    include_soft_constraints: bool = True,
+    maximize_placements: bool = False,
+    min_students_per_class: int = 2,
+    max_students_per_class: int = 3
+) -> Tuple['cp_model.CpModel', ModelLayout]:
+    """Build the CP-SAT model of a problem (no solve).
+    
+    The proto is filled in bulk (see core.model_builder).
+    
+    Args:
+        problem: Shared problem matrix (students × slots)
+        include_soft_constraints: Whether to include soft constraints
+        maximize_placements: If True, maximize number of placements (partial solution)
+        min_students_per_class: Smallest class that may open (as in presolve)
+        max_students_per_class: Largest class
+    
+    Returns:
+        Tuple (model, layout)
+    """
+    model = cp_model.CpModel()
+    layout = build_model(
+        model,
+        problem,
+        include_soft_constraints=include_soft_constraints,
+        maximize_placements=maximize_placements,
+        min_students_per_class=min_students_per_class,
+        max_students_per_class=max_students_per_class
     )
+    return model, layout
+
+
+def _is_student_available_for_slot(student: Student, slot: Slot) -> bool:
+    """Check if student is available for a given slot (availability mask bit test)."""
+    return student.is_available_for(slot)
 
 
 def _extract_solution(
     solver: 'cp_model.CpSolver',
     status: int,
-    students: List[Student],
-    available_slots: List[Slot],
-    assignments: Dict[Tuple[int, int], 'cp_model.IntVar'],
+    problem: ProblemMatrix,
+    layout: ModelLayout,
     skeleton: Dict[Slot, ScheduledClass],
-    constraints: SchedulingConstraints
+    constraints: SchedulingConstraints,
+    presolved: Optional[PresolveResult] = None
 ) -> ScheduleResult:
     """Extract solution from CP-SAT solver.
     
     Args:
         solver: CP-SAT solver
         status: Solve status
-        students: List of students
-        available_slots: List of available slots
-        assignments: Assignment variables
+        problem: Shared problem matrix
+        layout: Proto indices of the model variables
         skeleton: Skeleton schedule
         constraints: Constraints
+        presolved: Presolve of problem (students it pruned are explained by it)
     
     Returns:
         ScheduleResult with schedule and unplaced students
     """
     # Start with skeleton
     final_schedule = list(skeleton.values())
-    slot_to_students = {slot: list(cls.students) for slot, cls in skeleton.items()}
     
     placed_students = set()
     for cls in skeleton.values():
         placed_students.update(cls.students)
     
-    unplaced = []
+    remaining_indices = problem.remaining_student_indices().tolist()
+    solved = status in [cp_model.OPTIMAL, cp_model.FEASIBLE]
     
-    if status in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
-        # Extract assignments from solution
-        for (i, j), var in assignments.items():
-            if solver.Value(var) == 1:
-                student = students[i]
-                slot = available_slots[j]
-                
-                if slot not in slot_to_students:
-                    slot_to_students[slot] = []
-                slot_to_students[slot].append(student.name)
-                placed_students.add(student.name)
+    if solved:
+        # Extract assignments from solution (one read of the solution vector)
+        new_slot_students: Dict[Slot, List[str]] = {}
+        rows, columns = layout.assigned_pairs(solver.ResponseProto().solution)
+        for i, j in zip(rows.tolist(), columns.tolist()):
+            student = problem.students[i]
+            slot = problem.slots[j]
+            
+            new_slot_students.setdefault(slot, []).append(student.name)
+            placed_students.add(student.name)
         
         # Build ScheduledClass objects for new slots
-        for slot, student_names in slot_to_students.items():
+        for slot, student_names in new_slot_students.items():
             if slot not in skeleton:  # Don't duplicate skeleton
                 scheduled_class = ScheduledClass(
                     slot=slot,
@@ -645,54 +542,49 @@ def _extract_solution(
                     status=SlotStatus.PROPOSED
                 )
                 final_schedule.append(scheduled_class)
-        
-        # Find unplaced students
-        for student in students:
-            if student.name not in placed_students:
-                unplaced_student = _generate_unplaced_explanation(
-                    student,
-                    available_slots,
-                    slot_to_students,
-                    constraints
-                )
-                unplaced.append(unplaced_student)
-    
-    else:  # INFEASIBLE or UNKNOWN
-        # Return skeleton + generate explanations for all students
-        for student in students:
-            if student.name not in placed_students:
-                unplaced_student = _generate_unplaced_explanation(
-                    student,
-                    available_slots,
-                    slot_to_students,
-                    constraints,
-                    infeasible=True
-                )
-                unplaced.append(unplaced_student)
-    
-    return ScheduleResult(
-        schedule=final_schedule,
-        unplaced=unplaced,
-        metadata={
-            "solver_status": _status_to_string(status),
-            "total_students": len(students),
-            "placed_students": len(placed_students),
-            "unplaced_students": len(unplaced)
-        }
-    )
+    
+    result = ScheduleResult(schedule=final_schedule)
+    
+    # Explain unplaced students from the result's cached slot index
+    # (INFEASIBLE or UNKNOWN: skeleton only, every remaining student explained)
+    unplaced = []
+    for i in remaining_indices:
+        if presolved is not None and i in presolved.removed_students:
+            unplaced.append(_generate_presolve_explanation(problem, i, presolved, constraints))
+        elif problem.students[i].name not in placed_students:
+            unplaced_student = _generate_unplaced_explanation(
+                problem,
+                i,
+                result.by_slot,
+                constraints,
+                infeasible=not solved
+            )
+            unplaced.append(unplaced_student)
+    
+    result.unplaced = unplaced
+    result.metadata = {
+        "solver_status": _status_to_string(status),
+        "total_students": len(remaining_indices),
+        "placed_students": len(placed_students),
+        "unplaced_students": len(unplaced)
+    }
+    return result
 
 
 def _generate_unplaced_explanation(
-    student: Student,
-    available_slots: List[Slot],
+    problem: ProblemMatrix,
+    student_idx: int,
     slot_to_students: Dict[Slot, List[str]],
     constraints: SchedulingConstraints,
     infeasible: bool = False
 ) -> UnplacedStudent:
     """Generate human-readable explanation for unplaced student.
     
-    Template-based (no LLM cost).
+    Template-based (no LLM cost). The student's slots are read from their
+    row of the problem matrix.
     """
+    student = problem.students[student_idx]
+    student_slots = [problem.slots[j] for j in problem.student_slot_indices(student_idx)]
     conflicts = []
     suggestions = []
     
@@ -704,7 +596,7 @@ def _generate_unplaced_explanation(
         
         # Check why student couldn't be placed
         # 1. Check if slots are full
-        for slot in student.available_slots:
+        for slot in student_slots:
             if slot in slot_to_students:
                 students_in_slot = slot_to_students[slot]
                 if len(students_in_slot) >= 3:
@@ -714,7 +606,7 @@ def _generate_unplaced_explanation(
                     )
         
         # 2. Generate suggestions from available slots
-        for slot in student.available_slots[:3]:  # Top 3 suggestions
+        for slot in student_slots[:3]:  # Top 3 suggestions
             if slot not in slot_to_students or len(slot_to_students[slot]) < 3:
                 suggestions.append(
                     f"Proposer {slot.day.capitalize()} {slot.start_time.strftime('%H:%M')} "
@@ -735,6 +627,47 @@ def _generate_unplaced_explanation(
     )
 
 
+def _generate_presolve_explanation(
+    problem: ProblemMatrix,
+    student_idx: int,
+    presolved: PresolveResult,
+    constraints: SchedulingConstraints
+) -> UnplacedStudent:
+    """Explain a student pruned by presolve (not enough usable slots).
+    
+    Template-based, from the presolve reasons of the student's slots.
+    """
+    student = problem.students[student_idx]
+    sessions = int(problem.remaining_sessions[student_idx])
+    reachable = int(presolved.reachable_slots[student_idx])
+    student_columns = problem.student_slot_indices(student_idx).tolist()
+    blocked = sum(1 for j in student_columns if j in presolved.removed_slots
+                  and presolved.removed_slots[j] != SLOT_TOO_FEW_STUDENTS)
+    too_few = sum(1 for j in student_columns if presolved.removed_slots.get(j) == SLOT_TOO_FEW_STUDENTS)
+    
+    conflicts = [
+        f"{reachable} créneau(x) possible(s) sans chevauchement pour {sessions} séance(s) à placer"
+    ]
+    if blocked:
+        conflicts.append(f"{blocked} créneau(x) de ses dispos bloqué(s) par les cours récurrents ou réservés")
+    if too_few:
+        conflicts.append(
+            f"{too_few} créneau(x) de ses dispos sans assez d'élèves disponibles "
+            f"(minimum {constraints.min_students_per_class} par cours)"
+        )
+    
+    suggestions = ["Contacter l'élève pour élargir ses disponibilités"]
+    if reachable > 0:
+        suggestions.append(f"Réduire à {reachable} séance(s) par semaine")
+    
+    return UnplacedStudent(
+        student=student.name,
+        reason="Pas assez de créneaux possibles pour ses séances",
+        conflicts=conflicts,
+        suggestions=suggestions
+    )
+
+
 def _status_to_string(status: int) -> str:
     """Convert CP-SAT status to string."""
     if cp_model is None:
@@ -757,7 +690,8 @@ def _status_to_string(status: int) -> str:
 def generate_schedule(
     students: List[Student],
     recurring_slots_path: Optional[str] = None,
-    coach_reserved_slots: Optional[List[Slot]] = None
+    coach_reserved_slots: Optional[List[Slot]] = None,
+    parse_cache: Optional['ParseCache'] = None
 ) -> ScheduleResult:
     """Main entry point for schedule generation.
     
@@ -765,6 +699,7 @@ def generate_schedule(
         students: List of all students with availabilities
         recurring_slots_path: Optional path to recurring slots CSV
         coach_reserved_slots: Optional list of coach reserved slots
+        parse_cache: Optional core.cache.ParseCache for the recurring slots CSV
     
     Returns:
         ScheduleResult with complete or partial schedule
@@ -783,7 +718,8 @@ def generate_schedule(
         # Parse recurring slots with warnings for single-student slots
         skeleton_classes, recurring_warnings = parse_recurring_slots_csv_with_warnings(
             recurring_slots_path,
-            students
+            students,
+            parse_cache
         )
         
         # Validate skeleton
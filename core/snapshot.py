@@ -0,0 +1,446 @@
+"""
+Binary roster snapshots (.planz) with memory-mapped loading.
+
+This module is responsible for:
+- Saving a parsed roster (and optionally a skeleton) to a .planz file
+- Loading it with mmap: every section is a zero-copy NumPy view of the file
+- Rebuilding Student / ScheduledClass objects on demand from those views
+- Encoding to bytes (snapshot_bytes) for transfer between processes
+
+Layout (little-endian, sections 8-byte aligned):
+- Fixed header: magic, format version, counts, mask width and base
+- Section directory: (offset, length in bytes) of each section in _SECTIONS
+- Interned string table: UTF-8 data + offsets (names, links, notes, days)
+- Per student: name, session count, linked name, notes (string IDs),
+  availability mask (mask_width bytes) and ranges (offsets into range arrays)
+- Linked pairs: student indices (first < second), as in ProblemMatrix
+- Skeleton: slot ID (-1 if off-grid), day/start/end, status, recurring flag,
+  students (offsets into string IDs)
+
+Several processes loading the same file share its pages through the OS
+page cache. Snapshots are written atomically (temp file + rename), so a
+reader never sees a partial file and an open mapping stays valid after
+the snapshot is rewritten.
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+from datetime import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .columnar import STATUS_BY_CODE, STATUS_CODES
+from .models import Student, Slot, TimeRange, ScheduledClass, SLOT_ID_COUNT
+
+
+SNAPSHOT_MAGIC = b"PLANZSNP"
+SNAPSHOT_VERSION = 1
+
+# Magic, version, reserved, students, ranges, classes, placements, strings,
+# mask width and mask base (bytes)
+_HEADER = struct.Struct("<8sHHIIIIIII")
+_DIRECTORY_ENTRY = struct.Struct("<QQ")
+
+# Section name → dtype, in file order
+_SECTIONS: Tuple[Tuple[str, str], ...] = (
+    ("string_offsets", "<u8"),
+    ("string_data", "u1"),
+    ("name_ids", "<i4"),
+    ("sessions", "<i4"),
+    ("linked_ids", "<i4"),  # -1: no linked group
+    ("notes_ids", "<i4"),
+    ("masks", "u1"),  # num_students × mask_width, from byte mask_base of each mask
+    ("linked_pairs", "<i4"),  # num_pairs × 2
+    ("range_offsets", "<u4"),  # num_students + 1
+    ("range_days", "<i4"),
+    ("range_bounds", "<u2"),  # num_ranges × 2 (start, end minutes)
+    ("class_slot_ids", "<i4"),  # -1: off-grid slot
+    ("class_days", "<i4"),
+    ("class_bounds", "<u2"),  # num_classes × 2
+    ("class_status", "u1"),  # index in STATUS_BY_CODE
+    ("class_recurring", "u1"),
+    ("class_offsets", "<u4"),  # num_classes + 1
+    ("class_student_ids", "<i4"),
+)
+
+_ALIGNMENT = 8
+
+
+class SnapshotError(Exception):
+    """Raised when a file is not a readable .planz snapshot."""
+    pass
+
+
+class _StringTable:
+    """Interns strings to consecutive IDs while a snapshot is built."""
+    
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+    
+    def add(self, text: str) -> int:
+        return self.ids.setdefault(text, len(self.ids))
+    
+    def encode(self) -> Tuple[np.ndarray, np.ndarray]:
+        encoded = [text.encode("utf-8") for text in self.ids]
+        offsets = np.zeros(len(encoded) + 1, dtype="<u8")
+        np.cumsum([len(data) for data in encoded], out=offsets[1:])
+        return offsets, np.frombuffer(b"".join(encoded), dtype="u1")
+
+
+def save_snapshot(
+    path,
+    students: Sequence[Student],
+    skeleton: Sequence[ScheduledClass] = ()
+) -> None:
+    """Write students (and an optional skeleton) to a .planz snapshot.
+    
+    Students come back equal (==) from load_snapshot; available_slots is
+    rebuilt from the mask, in slot ID order.
+    
+    Args:
+        path: Destination file (replaced atomically)
+        students: Roster, e.g. parse_csv output
+        skeleton: Recurring classes, e.g. parse_recurring_slots_csv output
+    """
+    data = snapshot_bytes(students, skeleton)
+    
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def snapshot_bytes(students: Sequence[Student], skeleton: Sequence[ScheduledClass] = ()) -> bytes:
+    """Encode students (and an optional skeleton) in the .planz format.
+    
+    RosterSnapshot(data) reads the result back without a file, e.g. after
+    sending it between processes.
+    """
+    strings = _StringTable()
+    num_students = len(students)
+    
+    # Students
+    name_ids = np.fromiter((strings.add(s.name) for s in students), dtype="<i4", count=num_students)
+    sessions = np.fromiter((s.sessions_per_week for s in students), dtype="<i4", count=num_students)
+    linked_ids = np.fromiter(
+        (strings.add(s.linked_group) if s.linked_group is not None else -1 for s in students),
+        dtype="<i4",
+        count=num_students
+    )
+    notes_ids = np.fromiter((strings.add(s.notes) for s in students), dtype="<i4", count=num_students)
+    
+    # Masks: only the bytes some student uses (1h slots are one band of slot IDs)
+    combined = 0
+    for student in students:
+        combined |= student.availability_mask
+    mask_base = ((combined & -combined).bit_length() - 1) // 8 if combined else 0
+    mask_width = (combined.bit_length() + 7) // 8 - mask_base
+    masks = np.frombuffer(
+        b"".join((s.availability_mask >> (8 * mask_base)).to_bytes(mask_width, "little") for s in students),
+        dtype="u1"
+    )
+    
+    # Linked pairs (unordered, deduplicated, same as ProblemMatrix.linked_pairs)
+    student_index = {s.name: i for i, s in enumerate(students)}
+    pairs = set()
+    for i, student in enumerate(students):
+        group = {i}
+        group.update(student_index[name] for name in student.linked_names if name in student_index)
+        group = sorted(group)
+        pairs.update((a, b) for k, a in enumerate(group) for b in group[k + 1:])
+    linked_pairs = np.array(sorted(pairs), dtype="<i4").reshape(-1)
+    
+    # Ranges
+    range_offsets = np.zeros(num_students + 1, dtype="<u4")
+    np.cumsum([len(s.availability_ranges) for s in students], out=range_offsets[1:])
+    all_ranges = [r for s in students for r in s.availability_ranges]
+    range_days = np.fromiter((strings.add(r.day) for r in all_ranges), dtype="<i4", count=len(all_ranges))
+    range_bounds = np.array([(r.start_minutes, r.end_minutes) for r in all_ranges], dtype="<u2").reshape(-1)
+    
+    # Skeleton
+    num_classes = len(skeleton)
+    class_slot_ids = np.fromiter(
+        (c.slot.id if c.slot.id < SLOT_ID_COUNT else -1 for c in skeleton), dtype="<i4", count=num_classes
+    )
+    class_days = np.fromiter((strings.add(c.slot.day) for c in skeleton), dtype="<i4", count=num_classes)
+    class_bounds = np.array(
+        [(c.slot.start_minutes, c.slot.end_minutes) for c in skeleton], dtype="<u2"
+    ).reshape(-1)
+    class_status = np.fromiter((STATUS_CODES[c.status] for c in skeleton), dtype="u1", count=num_classes)
+    class_recurring = np.fromiter((c.slot.is_recurring for c in skeleton), dtype="u1", count=num_classes)
+    class_offsets = np.zeros(num_classes + 1, dtype="<u4")
+    np.cumsum([len(c.students) for c in skeleton], out=class_offsets[1:])
+    class_student_ids = np.array(
+        [strings.add(name) for c in skeleton for name in c.students], dtype="<i4"
+    )
+    
+    string_offsets, string_data = strings.encode()
+    sections = {
+        "string_offsets": string_offsets,
+        "string_data": string_data,
+        "name_ids": name_ids,
+        "sessions": sessions,
+        "linked_ids": linked_ids,
+        "notes_ids": notes_ids,
+        "masks": masks,
+        "linked_pairs": linked_pairs,
+        "range_offsets": range_offsets,
+        "range_days": range_days,
+        "range_bounds": range_bounds,
+        "class_slot_ids": class_slot_ids,
+        "class_days": class_days,
+        "class_bounds": class_bounds,
+        "class_status": class_status,
+        "class_recurring": class_recurring,
+        "class_offsets": class_offsets,
+        "class_student_ids": class_student_ids,
+    }
+    
+    header = _HEADER.pack(
+        SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0, num_students, len(all_ranges), num_classes,
+        len(class_student_ids), len(strings.ids), mask_width, mask_base
+    )
+    offset = _align(_HEADER.size + _DIRECTORY_ENTRY.size * len(_SECTIONS))
+    directory = []
+    chunks = []
+    for name, dtype in _SECTIONS:
+        data = sections[name].astype(dtype, copy=False).tobytes()
+        directory.append(_DIRECTORY_ENTRY.pack(offset, len(data)))
+        padded_length = _align(len(data))
+        chunks.append(data + b"\0" * (padded_length - len(data)))
+        offset += padded_length
+    
+    directory_end = _HEADER.size + _DIRECTORY_ENTRY.size * len(_SECTIONS)
+    padding = b"\0" * (_align(directory_end) - directory_end)
+    return b"".join([header, *directory, padding, *chunks])
+
+
+def load_snapshot(path) -> 'RosterSnapshot':
+    """Memory-map a .planz snapshot.
+    
+    Nothing is decoded up front: sections are NumPy views of the mapping,
+    and Student / ScheduledClass objects are built when asked for.
+    
+    Args:
+        path: Snapshot written by save_snapshot
+    
+    Returns:
+        RosterSnapshot (close it, or use it as a context manager, to unmap)
+    
+    Raises:
+        SnapshotError: If the file is not a valid snapshot of this version
+    """
+    with open(path, "rb") as f:
+        try:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as e:  # Empty file
+            raise SnapshotError(f"{path}: {e}")
+    try:
+        return RosterSnapshot(buffer)
+    except SnapshotError:
+        buffer.close()
+        raise
+
+
+class RosterSnapshot:
+    """Read-only view of a .planz snapshot (memory-mapped file or bytes).
+    
+    Usage:
+        with load_snapshot("roster.planz") as snapshot:
+            students = snapshot.students()
+            skeleton = snapshot.skeleton()
+    """
+    
+    def __init__(self, buffer):
+        """Wrap a buffer holding a snapshot (mmap from load_snapshot, or snapshot_bytes output).
+        
+        Raises:
+            SnapshotError: If the buffer is not a valid snapshot of this version
+        """
+        if len(buffer) < _HEADER.size:
+            raise SnapshotError("File too short for a .planz header")
+        (
+            magic, version, _, self.num_students, self.num_ranges, self.num_classes,
+            num_placements, num_strings, self.mask_width, self.mask_base
+        ) = _HEADER.unpack_from(buffer, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise SnapshotError("Not a .planz snapshot (bad magic)")
+        if version != SNAPSHOT_VERSION:
+            raise SnapshotError(f"Unsupported .planz version {version} (expected {SNAPSHOT_VERSION})")
+        
+        self._buffer = buffer
+        self._arrays: Dict[str, np.ndarray] = {}
+        directory_end = _HEADER.size + _DIRECTORY_ENTRY.size * len(_SECTIONS)
+        if len(buffer) < directory_end:
+            raise SnapshotError("Truncated .planz section directory")
+        for position, (name, dtype) in enumerate(_SECTIONS):
+            offset, length = _DIRECTORY_ENTRY.unpack_from(buffer, _HEADER.size + position * _DIRECTORY_ENTRY.size)
+            if offset + length > len(buffer) or length % np.dtype(dtype).itemsize:
+                raise SnapshotError(f"Corrupted .planz section '{name}'")
+            self._arrays[name] = np.frombuffer(buffer, dtype=dtype, count=length // np.dtype(dtype).itemsize, offset=offset)
+        
+        expected_sizes = {
+            "string_offsets": num_strings + 1,
+            "name_ids": self.num_students,
+            "masks": self.num_students * self.mask_width,
+            "range_offsets": self.num_students + 1,
+            "range_bounds": self.num_ranges * 2,
+            "class_bounds": self.num_classes * 2,
+            "class_offsets": self.num_classes + 1,
+            "class_student_ids": num_placements,
+        }
+        for name, size in expected_sizes.items():
+            if self._arrays[name].size != size:
+                raise SnapshotError(f"Corrupted .planz section '{name}'")
+        
+        self._strings: List[Optional[str]] = [None] * num_strings
+    
+    # ------------------------------------------------------------------------
+    # Raw sections (zero-copy views, valid until close())
+    # ------------------------------------------------------------------------
+    
+    @property
+    def sessions(self) -> np.ndarray:
+        """Sessions per week of each student."""
+        return self._arrays["sessions"]
+    
+    @property
+    def masks(self) -> np.ndarray:
+        """Availability bitmasks, one little-endian row of mask_width bytes per student.
+        
+        Row bytes start at byte mask_base of the mask (bit 8 * mask_base).
+        """
+        return self._arrays["masks"].reshape(self.num_students, self.mask_width)
+    
+    @property
+    def linked_pairs(self) -> np.ndarray:
+        """Linked student index pairs (n_pairs, 2), first < second."""
+        return self._arrays["linked_pairs"].reshape(-1, 2)
+    
+    # ------------------------------------------------------------------------
+    # Decoded objects
+    # ------------------------------------------------------------------------
+    
+    def __len__(self) -> int:
+        return self.num_students
+    
+    def string(self, string_id: int) -> str:
+        """Entry of the interned string table (decoded once)."""
+        text = self._strings[string_id]
+        if text is None:
+            offsets = self._arrays["string_offsets"]
+            text = self._arrays["string_data"][offsets[string_id]:offsets[string_id + 1]].tobytes().decode("utf-8")
+            self._strings[string_id] = text
+        return text
+    
+    @property
+    def names(self) -> List[str]:
+        """Student names, in roster order."""
+        return [self.string(string_id) for string_id in self._arrays["name_ids"].tolist()]
+    
+    def student(self, index: int) -> Student:
+        """Rebuild one student."""
+        if not 0 <= index < self.num_students:
+            raise IndexError(index)
+        return self._students(range(index, index + 1))[0]
+    
+    def students(self) -> List[Student]:
+        """Rebuild every student, in roster order (equal to the saved ones)."""
+        return self._students(range(self.num_students))
+    
+    def skeleton(self) -> List[ScheduledClass]:
+        """Rebuild the saved skeleton classes, in their saved order."""
+        arrays = self._arrays
+        bounds = arrays["class_bounds"].tolist()
+        offsets = arrays["class_offsets"].tolist()
+        student_ids = arrays["class_student_ids"].tolist()
+        classes = []
+        for i, (slot_id, day_id, status_code, recurring) in enumerate(zip(
+            arrays["class_slot_ids"].tolist(), arrays["class_days"].tolist(),
+            arrays["class_status"].tolist(), arrays["class_recurring"].tolist()
+        )):
+            if slot_id >= 0:
+                slot = Slot.from_id(slot_id, bool(recurring))
+            else:
+                start, end = bounds[2 * i], bounds[2 * i + 1]
+                slot = Slot.intern(self.string(day_id), _minutes_to_time(start), _minutes_to_time(end), bool(recurring))
+            classes.append(ScheduledClass(
+                slot=slot,
+                students=[self.string(string_id) for string_id in student_ids[offsets[i]:offsets[i + 1]]],
+                status=STATUS_BY_CODE[status_code]
+            ))
+        return classes
+    
+    def _students(self, indices: range) -> List[Student]:
+        arrays = self._arrays
+        start, stop = indices.start, indices.stop
+        range_offsets = arrays["range_offsets"][start:stop + 1].tolist()
+        first_range, last_range = range_offsets[0], range_offsets[-1]
+        range_days = arrays["range_days"][first_range:last_range].tolist()
+        range_bounds = arrays["range_bounds"][2 * first_range:2 * last_range].tolist()
+        width = self.mask_width
+        shift = 8 * self.mask_base
+        masks = arrays["masks"][start * width:stop * width].tobytes()
+        
+        # Students with the same ranges share one tuple (rosters repeat a few patterns)
+        ranges_by_key: Dict[Tuple[int, ...], Tuple[TimeRange, ...]] = {}
+        string = self.string
+        
+        students = []
+        for k, (name_id, sessions, linked_id, notes_id) in enumerate(zip(
+            arrays["name_ids"][start:stop].tolist(), arrays["sessions"][start:stop].tolist(),
+            arrays["linked_ids"][start:stop].tolist(), arrays["notes_ids"][start:stop].tolist()
+        )):
+            low, high = range_offsets[k] - first_range, range_offsets[k + 1] - first_range
+            key = (*range_days[low:high], *range_bounds[2 * low:2 * high])
+            ranges = ranges_by_key.get(key)
+            if ranges is None:
+                ranges = ranges_by_key[key] = tuple(
+                    TimeRange.of(string(range_days[r]), range_bounds[2 * r], range_bounds[2 * r + 1])
+                    for r in range(low, high)
+                )
+            students.append(Student.from_ranges(
+                string(name_id),
+                sessions,
+                ranges,
+                string(linked_id) if linked_id >= 0 else None,
+                string(notes_id),
+                availability_mask=int.from_bytes(masks[k * width:(k + 1) * width], "little") << shift
+            ))
+        return students
+    
+    # ------------------------------------------------------------------------
+    # Lifetime
+    # ------------------------------------------------------------------------
+    
+    def close(self) -> None:
+        """Unmap the file (raw section views must no longer be used)."""
+        self._arrays.clear()
+        if isinstance(self._buffer, mmap.mmap) and not self._buffer.closed:
+            try:
+                self._buffer.close()
+            except BufferError:
+                pass  # A section view is still referenced: unmapped when it is released
+    
+    def __enter__(self) -> 'RosterSnapshot':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def _minutes_to_time(minutes: int) -> time:
+    return time(hour=minutes // 60, minute=minutes % 60)
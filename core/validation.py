@@ -0,0 +1,277 @@
+"""
+Validation of test case folders (disponibilites.csv + recurring-slots.csv).
+
+This module is responsible for:
+- Validating a test case with the parser's own checks (validate_roster,
+  validate_recurring_slots), so a case that passes here loads in the app
+- Template layout checks the parsers are lenient on (exact header order,
+  field count per line, availability CSV without data rows)
+- Validating many test cases across a process pool (validate_cases)
+- Machine-readable reports (CaseReport.to_dict)
+
+scripts/validate_test_csv.py is a command line front end for this module.
+"""
+
+import csv
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from .parser import (
+    validate_roster, validate_recurring_slots, RosterErrorCode, RosterIssue,
+    AVAILABILITY_REQUIRED_COLUMNS, RECURRING_REQUIRED_COLUMNS, CSV_ENGINES, DEFAULT_ENGINE
+)
+
+
+ROSTER_FILE = "disponibilites.csv"
+RECURRING_FILE = "recurring-slots.csv"  # Optional
+
+# Warning code (warnings are not RosterErrorCode errors)
+MISSING_OPTIONAL_FILE = "missing_optional_file"
+
+# Roster errors that leave no students to check recurring slots against
+_UNREADABLE_ROSTER = frozenset({
+    RosterErrorCode.FILE_NOT_FOUND, RosterErrorCode.MALFORMED_CSV, RosterErrorCode.MISSING_COLUMN
+})
+
+
+@dataclass
+class CaseIssue:
+    """One error or warning of a test case."""
+    file: str  # ROSTER_FILE or RECURRING_FILE
+    code: str  # RosterErrorCode value, or MISSING_OPTIONAL_FILE
+    message: str
+    line: Optional[int] = None  # CSV line number (header = 1), None for file-level issues
+    student: Optional[str] = None
+    column: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "file": self.file,
+            "code": self.code,
+            "message": self.message,
+            "line": self.line,
+            "student": self.student,
+            "column": self.column
+        }
+
+
+@dataclass
+class CaseReport:
+    """Validation outcome of one test case folder.
+    
+    Holds issues and counts only (no Student objects), so reports are
+    cheap to send back from worker processes.
+    """
+    path: str
+    errors: List[CaseIssue] = field(default_factory=list)
+    warnings: List[CaseIssue] = field(default_factory=list)
+    student_count: int = 0  # Availability rows without errors
+    class_count: int = 0  # Recurring classes without errors
+    
+    @property
+    def is_valid(self) -> bool:
+        return not self.errors
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form of the report."""
+        return {
+            "path": self.path,
+            "valid": self.is_valid,
+            "students": self.student_count,
+            "recurring_classes": self.class_count,
+            "errors": [issue.to_dict() for issue in self.errors],
+            "warnings": [issue.to_dict() for issue in self.warnings]
+        }
+
+
+def find_cases(path) -> List[Path]:
+    """Test case folders at path.
+    
+    Args:
+        path: A test case folder (holding ROSTER_FILE), or a folder whose
+            subfolders are test cases
+    
+    Returns:
+        [path] for a single test case, else the test case subfolders sorted
+        by name (empty if there are none)
+    """
+    path = Path(path)
+    if (path / ROSTER_FILE).is_file():
+        return [path]
+    with os.scandir(path) as entries:
+        cases = [
+            Path(entry.path) for entry in entries
+            if entry.is_dir() and os.path.isfile(os.path.join(entry.path, ROSTER_FILE))
+        ]
+    return sorted(cases)
+
+
+def validate_case(case_dir, engine: str = DEFAULT_ENGINE) -> CaseReport:
+    """Validate one test case folder.
+    
+    The availability CSV is checked by validate_roster and the recurring
+    slots CSV by validate_recurring_slots against its valid students, so
+    every parse error the app would hit is reported, all at once. Each file
+    is read once; the template layout checks run on the same text.
+    
+    Args:
+        case_dir: Folder holding ROSTER_FILE and optionally RECURRING_FILE
+        engine: CSV reader, one of CSV_ENGINES (see core.parser._read_tables)
+    
+    Returns:
+        CaseReport (a missing RECURRING_FILE is a warning)
+    
+    Raises:
+        ValueError: If engine is unknown
+    """
+    case_dir = Path(case_dir)
+    report = CaseReport(path=str(case_dir))
+    
+    # Availability CSV
+    roster_path = case_dir / ROSTER_FILE
+    text = _read_text(roster_path)
+    layout = []
+    if text is None:
+        roster = validate_roster(roster_path, engine)  # Reports FILE_NOT_FOUND or MALFORMED_CSV
+    else:
+        layout = _check_layout(text, AVAILABILITY_REQUIRED_COLUMNS, ROSTER_FILE)
+        roster = validate_roster(io.StringIO(text), engine)
+        if roster.is_valid and roster.row_count == 0:
+            layout.append(CaseIssue(
+                file=ROSTER_FILE, code=RosterErrorCode.EMPTY_FILE.value, message="No data rows", line=1
+            ))
+    report.errors.extend(_merge_issues(ROSTER_FILE, layout, roster.issues))
+    report.student_count = len(roster.students)
+    
+    # Recurring slots CSV
+    recurring_path = case_dir / RECURRING_FILE
+    if not recurring_path.is_file():
+        report.warnings.append(CaseIssue(
+            file=RECURRING_FILE, code=MISSING_OPTIONAL_FILE, message="File not found (optional)"
+        ))
+        return report
+    
+    text = _read_text(recurring_path)
+    layout = [] if text is None else _check_layout(text, RECURRING_REQUIRED_COLUMNS, RECURRING_FILE)
+    if any(issue.code in _UNREADABLE_ROSTER for issue in roster.issues):
+        report.errors.extend(layout)
+        return report  # Every row would be reported as not found
+    
+    # Rows of rejected availability rows are not reported again
+    valid_names = {student.name for student in roster.students}
+    rejected_names = {issue.student for issue in roster.issues if issue.student} - valid_names
+    source = recurring_path if text is None else io.StringIO(text)  # Not UTF-8: reported by the parser
+    recurring = validate_recurring_slots(source, roster.students, engine, rejected_names)
+    report.errors.extend(_merge_issues(RECURRING_FILE, layout, recurring.issues))
+    report.class_count = len(recurring.classes)
+    return report
+
+
+def validate_cases(
+    case_dirs: Sequence[Any],
+    workers: Optional[int] = None,
+    engine: str = DEFAULT_ENGINE
+) -> List[CaseReport]:
+    """Validate many test case folders in parallel, one folder per task.
+    
+    Args:
+        case_dirs: Test case folders (see find_cases)
+        workers: Worker processes (default: os.cpu_count()); 1 validates in
+            the calling process
+        engine: CSV reader, one of CSV_ENGINES (see core.parser._read_tables)
+    
+    Returns:
+        One CaseReport per folder, in input order
+    
+    Raises:
+        ValueError: If engine is unknown
+    """
+    if engine not in CSV_ENGINES:
+        raise ValueError(f"Unknown CSV engine '{engine}'. Expected one of: {', '.join(CSV_ENGINES)}")
+    
+    jobs = [os.fspath(case_dir) for case_dir in case_dirs]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(jobs))
+    
+    if workers <= 1:
+        return [validate_case(job, engine) for job in jobs]
+    
+    # Test cases are small: batch several per task to amortize inter-process round trips
+    chunksize = max(1, len(jobs) // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(validate_case, jobs, [engine] * len(jobs), chunksize=chunksize))
+
+
+def _read_text(path: Path) -> Optional[str]:
+    """File content (BOM stripped), None if the file does not exist or is not UTF-8.
+    
+    Either way the caller validates the path instead, and the parser
+    reports FILE_NOT_FOUND or MALFORMED_CSV for that file only.
+    """
+    try:
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            return f.read()
+    except (FileNotFoundError, UnicodeDecodeError):
+        return None
+
+
+def _check_layout(text: str, expected_columns: List[str], file_name: str) -> List[CaseIssue]:
+    """Template checks the parsers don't make.
+    
+    Reports a header that has every required column but not exactly the
+    template (order, extra columns), and every line whose field count
+    differs from the header's (the parsers reject extra fields but pad
+    missing ones, which shifts nothing but hides forgotten commas).
+    Missing columns and unreadable files are left to the parser report.
+    """
+    issues = []
+    reader = csv.reader(io.StringIO(text))
+    header = next((row for row in reader if row), None)
+    if header is None:
+        return issues
+    
+    if header != expected_columns and set(expected_columns) <= set(header):
+        issues.append(CaseIssue(
+            file=file_name,
+            code=RosterErrorCode.HEADER_MISMATCH.value,
+            message=f"Header does not match the template. Expected: {','.join(expected_columns)}",
+            line=reader.line_num
+        ))
+    
+    width = len(header)
+    for row in reader:
+        if row and len(row) != width:
+            issues.append(CaseIssue(
+                file=file_name,
+                code=RosterErrorCode.FIELD_COUNT.value,
+                message=f"Expected {width} fields, saw {len(row)}. Check for missing or extra commas",
+                line=reader.line_num
+            ))
+    return issues
+
+
+def _merge_issues(file_name: str, layout: List[CaseIssue], issues: List[RosterIssue]) -> List[CaseIssue]:
+    """Layout issues and parser issues of one file, sorted by line (file-level first).
+    
+    The parser's malformed CSV error is dropped when the layout check
+    already reported the offending lines.
+    """
+    has_field_counts = any(issue.code == RosterErrorCode.FIELD_COUNT.value for issue in layout)
+    merged = layout + [
+        CaseIssue(
+            file=file_name,
+            code=issue.code.value,
+            message=issue.message,
+            line=issue.row,
+            student=issue.student,
+            column=issue.column
+        )
+        for issue in issues
+        if not (has_field_counts and issue.code == RosterErrorCode.MALFORMED_CSV)
+    ]
+    return sorted(merged, key=lambda issue: issue.line or 0)
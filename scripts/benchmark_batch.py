@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Batch parsing benchmark: serial parse_csv vs parse_many across workers.
+
+Generates a corpus of synthetic rosters (synthetic_roster.py), parses it
+serially, then with parse_many for 1, 2, 4... workers up to the CPU
+count, and checks every run gives the same students. Rosters parsed by
+workers are decoded lazily: that cost is shown separately.
+
+Usage:
+    python scripts/benchmark_batch.py            # 32 rosters × 5 000 rows
+    python scripts/benchmark_batch.py 64 2000
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.batch import parse_many
+from core.parser import parse_csv
+from synthetic_roster import write_roster_csv
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    num_files = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    num_rows = int(sys.argv[2]) if len(sys.argv) > 2 else 5_000
+    cpu_count = os.cpu_count() or 1
+    worker_counts = [1]
+    while worker_counts[-1] * 2 <= cpu_count:
+        worker_counts.append(worker_counts[-1] * 2)
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = []
+        for k in range(num_files):
+            path = str(Path(tmp_dir) / f"roster-{k}.csv")
+            write_roster_csv(path, num_rows, seed=k)
+            paths.append(path)
+        
+        reference, serial_time = timed(lambda: [parse_csv(path) for path in paths])
+        
+        print(f"📊 parse_many ({num_files} rosters × {num_rows} rows, {cpu_count} CPU)")
+        print(f"  Serial parse_csv : {serial_time:6.2f}s")
+        for workers in worker_counts:
+            results, batch_time = timed(parse_many, paths, workers=workers)
+            students, decode_time = timed(lambda: [r.students for r in results])
+            identical = students == reference
+            print(
+                f"  {workers:2d} worker(s)     : {batch_time:6.2f}s  "
+                f"x{serial_time / max(batch_time, 1e-9):.1f}  "
+                f"(+{decode_time:.2f}s to build every Student)  {'✅' if identical else '❌'}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Memory and IPC benchmark: ScheduleResult vs ColumnarScheduleResult.
+
+Builds synthetic results (one per coach, ~40 classes of 2-3 students each)
+and compares tracemalloc bytes and pickle size per result, plus the pickle
+round-trip time that batch workers pay to return a result.
+
+Usage:
+    python scripts/benchmark_columnar.py            # 500 coaches
+    python scripts/benchmark_columnar.py 2000
+"""
+
+import pickle
+import random
+import sys
+import time as clock
+import tracemalloc
+from pathlib import Path
+from typing import List
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.columnar import ColumnarScheduleResult
+from core.models import ScheduleResult, ScheduledClass, Slot, SlotStatus, WEEK_DAYS, HALF_HOURS_PER_DAY
+
+
+def build_results(num_coaches: int, classes_per_coach: int = 40, seed: int = 0) -> List[ScheduleResult]:
+    rng = random.Random(seed)
+    # 1h slots starting 08:00-19:30
+    working_ids = [
+        day * HALF_HOURS_PER_DAY + half_hour
+        for day in range(len(WEEK_DAYS))
+        for half_hour in range(16, 40)
+    ]
+    results = []
+    for coach in range(num_coaches):
+        roster = [f"Coach{coach:04d}-Eleve{i:03d}" for i in range(60)]
+        slot_ids = rng.sample(working_ids, classes_per_coach)
+        schedule = [
+            ScheduledClass(
+                slot=Slot.from_id(slot_id),
+                students=rng.sample(roster, rng.choice((2, 3))),
+                status=rng.choice((SlotStatus.LOCKED, SlotStatus.PROPOSED))
+            )
+            for slot_id in sorted(slot_ids)
+        ]
+        results.append(ScheduleResult(schedule=schedule, metadata={"solver_status": "OPTIMAL"}))
+    return results
+
+
+def measure(builder) -> int:
+    """Return bytes allocated (and still alive) by builder()."""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    built = builder()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del built
+    return after - before
+
+
+def pickle_cost(results) -> tuple:
+    start = clock.perf_counter()
+    payloads = [pickle.dumps(r, protocol=pickle.HIGHEST_PROTOCOL) for r in results]
+    for payload in payloads:
+        pickle.loads(payload)
+    elapsed = clock.perf_counter() - start
+    return sum(len(p) for p in payloads), elapsed
+
+
+def main():
+    num_coaches = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    # Names are built up front so both layouts are charged only for their own storage
+    results = build_results(num_coaches)
+    
+    object_bytes = measure(lambda: [
+        ScheduleResult(
+            schedule=[ScheduledClass(c.slot, list(c.students), c.status) for c in r.schedule],
+            metadata=dict(r.metadata)
+        )
+        for r in results
+    ])
+    columnar_bytes = measure(lambda: [ColumnarScheduleResult.from_result(r) for r in results])
+    columnar = [ColumnarScheduleResult.from_result(r) for r in results]
+    
+    object_pickle, object_time = pickle_cost(results)
+    columnar_pickle, columnar_time = pickle_cost(columnar)
+    
+    print(f"📊 Schedule result layout ({num_coaches} results, ~40 classes each)")
+    print(f"  Memory  object   : {object_bytes / num_coaches:8.0f} B/result")
+    print(f"  Memory  columnar : {columnar_bytes / num_coaches:8.0f} B/result")
+    print(f"  Pickle  object   : {object_pickle / num_coaches:8.0f} B/result, {object_time * 1000:7.1f} ms round-trip")
+    print(f"  Pickle  columnar : {columnar_pickle / num_coaches:8.0f} B/result, {columnar_time * 1000:7.1f} ms round-trip")
+
+
+if __name__ == "__main__":
+    main()
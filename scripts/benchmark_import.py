@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark: import time of core.scheduler.
+
+Each measurement runs a fresh interpreter, so nothing is cached in
+sys.modules. Reports the median import time of core.scheduler, whether
+pandas / OR-Tools were loaded by it, and for reference the cost of
+importing pandas and of the first solve (which imports OR-Tools).
+
+Usage:
+    python scripts/benchmark_import.py          # 7 runs per measurement
+    python scripts/benchmark_import.py 15
+"""
+
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+IMPORT_SCHEDULER = """
+import sys, time
+start = time.perf_counter()
+import core.scheduler
+print(time.perf_counter() - start, 'pandas' in sys.modules, 'ortools' in sys.modules)
+"""
+
+IMPORT_PANDAS = """
+import time
+start = time.perf_counter()
+import pandas
+print(time.perf_counter() - start)
+"""
+
+FIRST_SOLVE_IMPORT = """
+import time
+import core.scheduler
+start = time.perf_counter()
+core.scheduler._import_cp_model()
+print(time.perf_counter() - start)
+"""
+
+
+def run(code: str) -> list:
+    """Run code in a fresh interpreter and return its printed fields."""
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout
+    return output.split()
+
+
+def median_seconds(code: str, runs: int) -> float:
+    return statistics.median(float(run(code)[0]) for _ in range(runs))
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+    
+    scheduler_time = median_seconds(IMPORT_SCHEDULER, runs)
+    _, pandas_loaded, ortools_loaded = run(IMPORT_SCHEDULER)
+    pandas_time = median_seconds(IMPORT_PANDAS, runs)
+    solve_import_time = median_seconds(FIRST_SOLVE_IMPORT, runs)
+    
+    print(f"📊 Cold start (median of {runs} fresh interpreters)")
+    print(f"  import core.scheduler       : {scheduler_time * 1000:7.1f} ms")
+    print(f"  pandas loaded               : {'❌ yes' if pandas_loaded == 'True' else '✅ no'}")
+    print(f"  OR-Tools loaded             : {'❌ yes' if ortools_loaded == 'True' else '✅ no'}")
+    print(f"  import pandas (reference)   : {pandas_time * 1000:7.1f} ms")
+    print(f"  OR-Tools import (1st solve) : {solve_import_time * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark for the data model (tracemalloc).
+
+Compares bytes per student between the legacy layout (plain dataclasses
+with __dict__, a fresh Slot per hour per student) and the current layout
+(frozen __slots__ models, interned slots shared across students).
+
+Usage:
+    python scripts/benchmark_memory.py            # 10 000 students
+    python scripts/benchmark_memory.py 50000
+"""
+
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import time
+from pathlib import Path
+from typing import List, Optional
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.models import Student
+from core.parser import parse_time, expand_time_range_to_slots, VALID_DAYS
+from synthetic_roster import generate_roster_rows
+
+
+# Legacy layout, as it was before the slotted/interned models
+@dataclass
+class LegacySlot:
+    day: str
+    start_time: time
+    end_time: time
+    is_recurring: bool = False
+
+
+@dataclass
+class LegacyStudent:
+    name: str
+    sessions_per_week: int
+    available_slots: List[LegacySlot] = field(default_factory=list)
+    linked_group: Optional[str] = None
+    notes: str = ""
+
+
+def build_legacy(rows) -> List[LegacyStudent]:
+    students = []
+    for row in rows:
+        slots = []
+        for day in VALID_DAYS:
+            if not row[f"{day}_debut"]:
+                continue
+            start = parse_time(row[f"{day}_debut"])
+            end = parse_time(row[f"{day}_fin"])
+            current = start
+            while current.hour + 1 <= 23:
+                next_time = time(current.hour + 1, current.minute)
+                if next_time > end:
+                    break
+                slots.append(LegacySlot(day, current, next_time))
+                current = next_time
+        students.append(LegacyStudent(
+            name=row["nom"],
+            sessions_per_week=int(row["sessions_par_semaine"]),
+            available_slots=slots,
+            linked_group=row["groupe_lie"] or None,
+            notes=row["notes"]
+        ))
+    return students
+
+
+def build_current(rows) -> List[Student]:
+    students = []
+    for row in rows:
+        slots = []
+        for day in VALID_DAYS:
+            if not row[f"{day}_debut"]:
+                continue
+            slots.extend(expand_time_range_to_slots(
+                day, parse_time(row[f"{day}_debut"]), parse_time(row[f"{day}_fin"])
+            ))
+        students.append(Student(
+            name=row["nom"],
+            sessions_per_week=int(row["sessions_par_semaine"]),
+            available_slots=slots,
+            linked_group=row["groupe_lie"] or None,
+            notes=row["notes"]
+        ))
+    return students
+
+
+def measure(builder, rows) -> int:
+    """Return bytes allocated (and still alive) by builder(rows)."""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    students = builder(rows)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del students
+    return after - before
+
+
+def main():
+    num_students = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    rows = generate_roster_rows(num_students)
+    
+    legacy_bytes = measure(build_legacy, rows)
+    current_bytes = measure(build_current, rows)
+    
+    print(f"📊 Memory per student ({num_students} students, tracemalloc)")
+    print(f"  Legacy  (dict dataclasses, fresh slots) : {legacy_bytes / num_students:8.0f} B/student")
+    print(f"  Current (slotted, interned slots)       : {current_bytes / num_students:8.0f} B/student")
+    print(f"  Gain : x{legacy_bytes / max(current_bytes, 1):.1f}")
+
+
+if __name__ == "__main__":
+    main()
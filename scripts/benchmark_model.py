@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+CP-SAT model benchmark: build time, model size and solve time.
+
+Compares the models of _build_cp_model, filled in bulk by
+core.model_builder:
+- "cliques": one occupancy literal per slot, one AddAtMostOne per time
+  point over the slots covering it
+- "cliques+presolve": "cliques" on the problem reduced by core.presolve
+  (build time includes presolve), as optimize_variations solves it
+
+with the same models built through the Python modelling API (NewBoolVar,
+Add(sum(...)), OnlyEnforceIf), kept here as a reference: "api-cliques",
+"api-pairwise", the previous no-overlap encoding (two fresh indicator
+literals and four reified sums per overlapping slot pair), "api-intervals",
+one optional fixed-size interval per slot and AddNoOverlap per day (the
+slots' own start and length: it opens the same classes as "cliques"), and
+"api-products", the previous linked group encoding (one
+AddMultiplicationEquality per common slot instead of implications).
+Bulk and API protos are checked to be the same model (canonical_model:
+names, term order and objective literal signs aside).
+
+Runs on docs/examples/test-cases/05-extreme (with its recurring slots), on
+synthetic rosters (synthetic_roster.py, no skeleton) and on link-heavy
+synthetic rosters (80% of students in linked pairs, then groups of 3,
+reduced by presolve as the scheduler solves them). Each model is
+built and solved as in phase 2a, with a 10 s time limit; solve time is the
+median over SOLVER_SEEDS. Synthetic rosters of a few hundred students need
+more sessions than a week can hold: the solver then proves infeasibility,
+which is timed too.
+
+Link-heavy rosters are the first four generator seeds that give a
+feasible roster (80 students in pairs, 90 in groups of 3): an
+infeasibility proof or a time-out says little about the linked group
+encoding. Their total solve time per formulation is printed last.
+
+Usage:
+    python scripts/benchmark_model.py            # synthetic rosters of 100, 500 and 1000 students
+    python scripts/benchmark_model.py 2000 5000
+"""
+
+import io
+import statistics
+import sys
+import time as clock
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core import scheduler
+from core.model_builder import constraint_kind
+from core.models import slots_to_mask, conflicting_slot_ids
+from core.parser import parse_csv, parse_recurring_slots_csv
+from core.presolve import presolve
+from core.problem import ProblemMatrix
+from synthetic_roster import roster_csv_text
+
+EXTREME_CASE = Path(__file__).parent.parent / "docs" / "examples" / "test-cases" / "05-extreme"
+LINK_HEAVY_RATIO = 0.8
+# (students, group size, generator seed) of feasible link-heavy rosters,
+# around the size a week can hold (checked with OR-Tools 9.8.3296)
+LINK_HEAVY_ROSTERS = (
+    (80, 2, 5), (80, 2, 7), (80, 2, 10), (80, 2, 11),
+    (90, 3, 0), (90, 3, 1), (90, 3, 2), (90, 3, 7),
+)
+SOLVE_TIME_LIMIT = 10.0  # Seconds
+SOLVER_SEEDS = (0, 1, 2)  # CpSolver random_seed of each timed solve
+
+
+def api_model(problem: ProblemMatrix, intervals: bool = False, pairwise: bool = False, products: bool = False):
+    """Phase 2a model built through the Python modelling API (reference only).
+    
+    Same variables and constraints, in the same order, as
+    core.model_builder.build_model. With intervals=True, classes are opened
+    and kept apart by optional fixed-size intervals and AddNoOverlap per
+    day instead; with pairwise=True, by the previous pairwise encoding.
+    With products=True, linked groups use the previous encoding: together
+    literals defined as products (AddMultiplicationEquality) instead of
+    implying each assignment.
+    """
+    model = scheduler.cp_model.CpModel()
+    pair_rows, pair_columns = problem.candidate_pairs()
+    assignments = {}
+    for i, j in zip(pair_rows.tolist(), pair_columns.tolist()):
+        assignments[(i, j)] = model.NewBoolVar(f"assign_s{i}_slot{j}")
+    
+    # Constraint 1: sessions
+    student_vars = {int(i): [] for i in problem.remaining_student_indices()}
+    for (i, j), var in assignments.items():
+        student_vars[i].append(var)
+    for i, vars_list in student_vars.items():
+        model.Add(sum(vars_list) == int(problem.remaining_sessions[i]))
+    
+    slot_students = {}
+    for (i, j), var in assignments.items():
+        slot_students.setdefault(j, []).append(var)
+    
+    # Constraints 2 and 3: capacity, one class at a time
+    slot_used = {}
+    if intervals:
+        intervals_by_day = {}
+        for j, vars_list in slot_students.items():
+            present = slot_used[j] = model.NewBoolVar(f"slot{j}_used")
+            interval = model.NewOptionalFixedSizeIntervalVar(
+                int(problem.slot_start_minutes[j]),
+                int(problem.slot_end_minutes[j] - problem.slot_start_minutes[j]),
+                present,
+                f"class_slot{j}"
+            )
+            intervals_by_day.setdefault(problem.slots[j].day, []).append(interval)
+            model.Add(sum(vars_list) >= 2 * present)
+            model.Add(sum(vars_list) <= 3 * present)
+        for day_intervals in intervals_by_day.values():
+            if len(day_intervals) > 1:
+                model.AddNoOverlap(day_intervals)
+    else:
+        for j, vars_list in slot_students.items():
+            total_students = sum(vars_list)
+            used = slot_used[j] = model.NewBoolVar(f"slot{j}_used")
+            model.Add(total_students >= 1).OnlyEnforceIf(used)
+            model.Add(total_students == 0).OnlyEnforceIf(used.Not())
+            model.Add(total_students >= 2).OnlyEnforceIf(used)
+            model.Add(total_students <= 3).OnlyEnforceIf(used)
+        if pairwise:
+            add_pairwise_overlaps(model, problem, slot_students)
+        else:
+            open_columns = np.array(sorted(slot_used), dtype=np.int64)
+            for clique in problem.overlap_cliques(open_columns):
+                model.AddAtMostOne(slot_used[j] for j in clique.tolist())
+    
+    # Constraint 4: linked groups
+    for group in problem.linked_groups:
+        members = [i for i in group if problem.remaining_sessions[i] > 0]
+        if len(members) < 2:
+            continue
+        min_together = int(problem.remaining_sessions[members].min())
+        together_vars = []
+        common_columns = np.flatnonzero(problem.availability[members].all(axis=0) & problem.is_candidate)
+        for j in common_columns.tolist():
+            together = model.NewBoolVar(f"together_{'_'.join(f's{i}' for i in members)}_slot{j}")
+            literals = [assignments[(i, j)] for i in members]
+            if products:
+                model.AddMultiplicationEquality(together, literals)
+            else:
+                model.AddBoolAnd(literals).OnlyEnforceIf(together)
+                model.AddBoolOr([literal.Not() for literal in literals] + [together])
+            together_vars.append(together)
+        if together_vars:
+            model.Add(sum(together_vars) >= min_together)
+    
+    # Soft 3 objective
+    objective_terms = [-3 * sum(vars_list) for vars_list in slot_students.values()]
+    if objective_terms:
+        model.Maximize(sum(objective_terms))
+    return model
+
+
+def add_pairwise_overlaps(model, problem, slot_students):
+    """Previous encoding of "UN SEUL COURS À LA FOIS" (reference only)."""
+    candidate_columns = problem.candidate_slot_indices().tolist()
+    candidates_mask = slots_to_mask(problem.slots[j] for j in candidate_columns)
+    for j1 in candidate_columns:
+        overlapping_indices = sorted(
+            problem.slot_index[slot_id]
+            for slot_id in conflicting_slot_ids(problem.slots[j1].id, candidates_mask)
+            if problem.slot_index[slot_id] > j1
+        )
+        for j2 in overlapping_indices:
+            if j1 in slot_students and j2 in slot_students:
+                slot1_used = model.NewBoolVar(f"overlap_s{j1}_used")
+                slot2_used = model.NewBoolVar(f"overlap_s{j2}_used")
+                model.Add(sum(slot_students[j1]) >= 1).OnlyEnforceIf(slot1_used)
+                model.Add(sum(slot_students[j1]) == 0).OnlyEnforceIf(slot1_used.Not())
+                model.Add(sum(slot_students[j2]) >= 1).OnlyEnforceIf(slot2_used)
+                model.Add(sum(slot_students[j2]) == 0).OnlyEnforceIf(slot2_used.Not())
+                model.Add(slot1_used + slot2_used <= 1)
+
+
+FORMULATIONS = {
+    "cliques": lambda problem: scheduler._build_cp_model(problem)[0],
+    "cliques+presolve": lambda problem: scheduler._build_cp_model(presolve(problem).problem)[0],
+    "api-cliques": lambda problem: api_model(problem),
+    "api-intervals": lambda problem: api_model(problem, intervals=True),
+    "api-pairwise": lambda problem: api_model(problem, pairwise=True),
+    "api-products": lambda problem: api_model(problem, products=True),
+}
+
+# Bulk formulation → API formulation it must match
+EQUIVALENT = {"cliques": "api-cliques"}
+
+
+def model_terms(proto) -> int:
+    """Variable references across all constraints (a size measure independent of names)."""
+    terms = 0
+    for constraint in proto.constraints:
+        terms += len(constraint.enforcement_literal)
+        kind = constraint_kind(constraint)
+        if kind == "linear":
+            terms += len(constraint.linear.vars)
+        elif kind in ("at_most_one", "bool_or", "bool_and"):
+            terms += len(getattr(constraint, kind).literals)
+        elif kind == "int_prod":
+            terms += 1 + len(constraint.int_prod.exprs)
+        elif kind == "no_overlap":
+            terms += len(constraint.no_overlap.intervals)
+        elif kind == "interval":
+            terms += 1
+    return terms
+
+
+def canonical_model(model):
+    """A model's proto in a form two builds of the same model share.
+    
+    Names are dropped, linear terms sorted by variable and objective terms
+    put on positive literals (constant offset dropped): the modelling API
+    orders terms, and negates objective literals, differently across
+    OR-Tools versions.
+    """
+    proto = model.Proto()
+    constraints = []
+    for constraint in proto.constraints:
+        kind = constraint_kind(constraint)
+        if kind == "linear":
+            body = (sorted(zip(constraint.linear.vars, constraint.linear.coeffs)), list(constraint.linear.domain))
+        else:
+            body = str(getattr(constraint, kind)) if kind else ""
+        constraints.append((list(constraint.enforcement_literal), kind, body))
+    
+    # Objective as scaling_factor × sum(coeff · literal), a negated literal
+    # -k-1 being 1 - x_k
+    objective = proto.objective
+    sign = -1 if objective.scaling_factor < 0 else 1
+    terms = {}
+    for ref, coeff in zip(objective.vars, objective.coeffs):
+        var, coeff = (ref, coeff) if ref >= 0 else (-ref - 1, -coeff)
+        terms[var] = terms.get(var, 0) + sign * coeff
+    return (
+        [list(variable.domain) for variable in proto.variables],
+        constraints,
+        sorted((var, coeff) for var, coeff in terms.items() if coeff)
+    )
+
+
+def build(problem: ProblemMatrix, formulation: str, runs: int = 3):
+    """Median build time (seconds) and the last built model."""
+    times = []
+    for _ in range(runs):
+        start = clock.perf_counter()
+        model = FORMULATIONS[formulation](problem)
+        times.append(clock.perf_counter() - start)
+    return statistics.median(times), model
+
+
+def solve(model):
+    """Median wall time (seconds) over SOLVER_SEEDS and the status names seen."""
+    times = []
+    statuses = set()
+    for seed in SOLVER_SEEDS:
+        solver = scheduler.cp_model.CpSolver()
+        solver.parameters.max_time_in_seconds = SOLVE_TIME_LIMIT
+        solver.parameters.random_seed = seed
+        start = clock.perf_counter()
+        status = solver.Solve(model)
+        times.append(clock.perf_counter() - start)
+        statuses.add(solver.StatusName(status))
+    return statistics.median(times), "/".join(sorted(statuses))
+
+
+def report(label: str, problem: ProblemMatrix) -> dict:
+    """Print build, size and solve figures per formulation; return formulation → (solve time, status)."""
+    rows, _ = problem.candidate_pairs()
+    print(f"📊 {label}: {problem.num_students} students, "
+          f"{problem.candidate_slot_indices().size} candidate slots, {rows.size} assignment variables, "
+          f"{len(problem.linked_groups)} linked groups")
+    models = {}
+    solves = {}
+    for formulation in FORMULATIONS:
+        elapsed, model = build(problem, formulation)
+        proto = model.Proto()
+        solve_time, status = solves[formulation] = solve(model)
+        models[formulation] = model
+        print(f"  {formulation:16s}: build {elapsed * 1000:8.1f} ms, "
+              f"{len(proto.variables):7d} variables, {len(proto.constraints):7d} constraints, "
+              f"{model_terms(proto):8d} terms, solve {solve_time:6.2f} s ({status})")
+    for bulk, api in EQUIVALENT.items():
+        same = canonical_model(models[bulk]) == canonical_model(models[api])
+        print(f"  {bulk} vs {api}: {'identical models' if same else 'MODELS DIFFER'}")
+    print()
+    return solves
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100, 500, 1000]
+    scheduler._import_cp_model()
+    
+    students = parse_csv(str(EXTREME_CASE / "disponibilites.csv"))
+    skeleton = scheduler.place_recurring_slots(
+        parse_recurring_slots_csv(str(EXTREME_CASE / "recurring-slots.csv"), students)
+    )
+    report("05-extreme", ProblemMatrix.build(students, skeleton, []))
+    
+    for num_students in sizes:
+        students = parse_csv(io.StringIO(roster_csv_text(num_students)))
+        report(f"Synthetic roster ({num_students})", ProblemMatrix.build(students, {}, []))
+    
+    totals = dict.fromkeys(FORMULATIONS, 0.0)
+    unsolved = dict.fromkeys(FORMULATIONS, 0)
+    for num_students, group_size, seed in LINK_HEAVY_ROSTERS:
+        students = parse_csv(io.StringIO(
+            roster_csv_text(num_students, seed, LINK_HEAVY_RATIO, group_size)
+        ))
+        problem = presolve(ProblemMatrix.build(students, {}, [])).problem
+        solves = report(f"Link-heavy roster ({num_students}, groups of {group_size}, seed {seed})", problem)
+        for formulation, (solve_time, status) in solves.items():
+            totals[formulation] += solve_time
+            unsolved[formulation] += status not in ("OPTIMAL", "FEASIBLE")
+    
+    print(f"📊 Link-heavy rosters ({len(LINK_HEAVY_ROSTERS)}): total median solve time")
+    for formulation, total in totals.items():
+        note = f" ({unsolved[formulation]} not solved)" if unsolved[formulation] else ""
+        print(f"  {formulation:16s}: {total:6.2f} s{note}")
+
+
+if __name__ == "__main__":
+    main()
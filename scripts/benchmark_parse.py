@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Parsing benchmark: column-wise parse_csv vs the row-by-row (iterrows) path.
+
+Generates a synthetic roster (synthetic_roster.py), parses it both ways
+and checks both give the same students. Also compares the csv and pandas
+ingestion engines, and peak memory of parse_csv vs consuming
+iter_students chunk by chunk.
+
+Usage:
+    python scripts/benchmark_parse.py            # 50 000 rows
+    python scripts/benchmark_parse.py 10000
+"""
+
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from pathlib import Path
+
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.parser import parse_csv, iter_students, validate_linked_groups, _parse_student_row
+from synthetic_roster import write_roster_csv
+
+
+def parse_row_by_row(file_path: str):
+    """Reference path: pandas iterrows + per-cell parse_time/expansion."""
+    df = pd.read_csv(file_path)
+    students = [_parse_student_row(idx, row) for idx, row in df.iterrows()]
+    validate_linked_groups(students)
+    return students
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def peak_memory(func, *args) -> int:
+    """Peak bytes traced while running func(*args)."""
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def consume_stream(csv_path: str, chunk_size: int) -> int:
+    """Count students without keeping them (what a streaming consumer does)."""
+    return sum(1 for _ in iter_students(csv_path, chunk_size=chunk_size))
+
+
+def main():
+    num_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    # Mostly-empty groupe_lie column triggers pandas' mixed-type warning on big files
+    warnings.simplefilter("ignore", pd.errors.DtypeWarning)
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = str(Path(tmp_dir) / "roster.csv")
+        write_roster_csv(csv_path, num_rows)
+        
+        reference, reference_time = timed(parse_row_by_row, csv_path)
+        students, vectorized_time = timed(parse_csv, csv_path)
+        pandas_students, pandas_time = timed(parse_csv, csv_path, "pandas")
+        full_peak = peak_memory(parse_csv, csv_path)
+        stream_peak = peak_memory(consume_stream, csv_path, 2_000)
+    
+    identical = all(
+        (a.name, a.sessions_per_week, a.available_slots, a.linked_group, a.notes)
+        == (b.name, b.sessions_per_week, b.available_slots, b.linked_group, b.notes)
+        for a, b in zip(students, reference)
+    ) and len(students) == len(reference) and students == pandas_students
+    
+    print(f"📊 parse_csv ({num_rows} rows)")
+    print(f"  Row by row (iterrows) : {reference_time:6.2f}s")
+    print(f"  Column-wise (csv)     : {vectorized_time:6.2f}s")
+    print(f"  Column-wise (pandas)  : {pandas_time:6.2f}s")
+    print(f"  Gain : x{reference_time / max(vectorized_time, 1e-9):.1f}")
+    print(f"  Same students : {'✅' if identical else '❌'}")
+    print(f"  Peak memory parse_csv            : {full_peak / 1e6:7.1f} MB")
+    print(f"  Peak memory iter_students (2000) : {stream_peak / 1e6:7.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
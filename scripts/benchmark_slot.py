@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Slot micro-benchmark: cached start/end minutes vs converting time objects.
+
+Times the methods that read Slot.start_minutes / end_minutes
+(duration_hours, is_valid, the by_day sort key) against the previous
+implementations, which recomputed minutes from the time fields on every
+call. overlaps() goes through the precomputed overlap index either way and
+is timed for reference.
+
+Usage:
+    python scripts/benchmark_slot.py            # 20 copies of every 3rd 1h slot
+    python scripts/benchmark_slot.py 200
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.models import Slot, GRID_SIZE
+
+
+def legacy_duration_hours(slot: Slot) -> float:
+    start_minutes = slot.start_time.hour * 60 + slot.start_time.minute
+    end_minutes = slot.end_time.hour * 60 + slot.end_time.minute
+    return (end_minutes - start_minutes) / 60.0
+
+
+def legacy_is_valid(slot: Slot) -> bool:
+    if abs(legacy_duration_hours(slot) - 1.0) > 0.01:
+        return False
+    if slot.start_time.minute not in [0, 30]:
+        return False
+    if slot.end_time.minute not in [0, 30]:
+        return False
+    return slot.start_time < slot.end_time
+
+
+def best_ms(statement, number: int = 20, repeat: int = 5) -> float:
+    return min(timeit.repeat(statement, number=number, repeat=repeat)) / number * 1000
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    slots = [Slot.from_id(slot_id) for slot_id in range(0, GRID_SIZE, 3)] * copies
+    pairs = list(zip(slots, slots[1:]))
+    
+    print(f"📊 {len(slots)} slots")
+    measurements = [
+        (
+            "duration_hours",
+            lambda: [legacy_duration_hours(s) for s in slots],
+            lambda: [s.duration_hours() for s in slots],
+        ),
+        (
+            "is_valid",
+            lambda: [legacy_is_valid(s) for s in slots],
+            lambda: [s.is_valid() for s in slots],
+        ),
+        (
+            "by_day sort key",
+            lambda: sorted(slots, key=lambda s: (s.start_time, s.id)),
+            lambda: sorted(slots, key=lambda s: (s.start_minutes, s.id)),
+        ),
+    ]
+    for name, legacy, cached in measurements:
+        legacy_ms, cached_ms = best_ms(legacy), best_ms(cached)
+        print(f"  {name:<16}: time objects {legacy_ms:7.3f} ms, cached minutes {cached_ms:7.3f} ms "
+              f"({legacy_ms / cached_ms:.1f}x)")
+    print(f"  {'overlaps':<16}: {best_ms(lambda: [a.overlaps(b) for a, b in pairs]):7.3f} ms (overlap index)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Snapshot benchmark: .planz load vs parse_csv vs ParseCache hit.
+
+Generates a synthetic roster (synthetic_roster.py), then measures parsing
+it, reading it back from a warm ParseCache, and saving / memory-mapping it
+as a .planz snapshot. Checks every path gives the same students.
+
+Usage:
+    python scripts/benchmark_snapshot.py            # 50 000 rows
+    python scripts/benchmark_snapshot.py 10000
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.cache import ParseCache
+from core.parser import parse_csv
+from core.snapshot import save_snapshot, load_snapshot
+from synthetic_roster import write_roster_csv
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    num_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = str(Path(tmp_dir) / "roster.csv")
+        snapshot_path = str(Path(tmp_dir) / "roster.planz")
+        write_roster_csv(csv_path, num_rows)
+        
+        students, parse_time = timed(parse_csv, csv_path)
+        
+        cache = ParseCache(Path(tmp_dir) / "cache")
+        cache.parse_csv(csv_path)
+        cached, cache_time = timed(cache.parse_csv, csv_path)
+        
+        _, save_time = timed(save_snapshot, snapshot_path, students)
+        snapshot, map_time = timed(load_snapshot, snapshot_path)
+        loaded, build_time = timed(snapshot.students)
+        snapshot.close()
+        
+        csv_size = os.path.getsize(csv_path)
+        snapshot_size = os.path.getsize(snapshot_path)
+    
+    identical = loaded == students == cached
+    
+    print(f"📊 Roster snapshot ({num_rows} rows)")
+    print(f"  parse_csv                   : {parse_time * 1000:8.1f} ms")
+    print(f"  ParseCache hit              : {cache_time * 1000:8.1f} ms")
+    print(f"  save_snapshot               : {save_time * 1000:8.1f} ms")
+    print(f"  load_snapshot (mmap)        : {map_time * 1000:8.3f} ms")
+    print(f"  snapshot.students()         : {build_time * 1000:8.1f} ms")
+    print(f"  Size CSV / .planz           : {csv_size / 1e6:.1f} MB / {snapshot_size / 1e6:.1f} MB")
+    print(f"  Same students : {'✅' if identical else '❌'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,7 +19,7 @@ echo "Installing dependencies..."
 echo "This may take a few minutes..."
 echo ""
 
-pip3 install pandas==2.1.4 ortools==9.8.3296 streamlit==1.31.1 pytest==7.4.4 pytest-cov==4.1.0
+pip3 install pandas==2.1.4 numpy==1.26.3 ortools==9.8.3296 streamlit==1.31.1 pytest==7.4.4 pytest-cov==4.1.0
 
 echo ""
 echo "=========================================="
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Synthetic roster generator for benchmarks.
+
+Builds availability rows in the disponibilites.csv format, with the
+standard ranges coaches see in real rosters (08:00-13:00, 14:00-19:00...)
+and a share of reciprocal linked groups (pairs by default).
+
+Usage:
+    python scripts/synthetic_roster.py 2000 /tmp/roster-2000.csv
+"""
+
+import csv
+import io
+import random
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.parser import AVAILABILITY_REQUIRED_COLUMNS, VALID_DAYS
+
+STANDARD_RANGES = [
+    ("08:00", "13:00"),
+    ("14:00", "19:00"),
+    ("09:00", "12:00"),
+    ("17:00", "20:00"),
+    ("08:30", "12:30"),
+    ("12:00", "14:00"),
+]
+
+
+def generate_roster_rows(
+    num_students: int,
+    seed: int = 0,
+    linked_ratio: float = 0.1,
+    group_size: int = 2
+) -> List[Dict[str, str]]:
+    """Generate availability rows (one dict per student, CSV column → value).
+    
+    Args:
+        num_students: Number of students to generate
+        seed: Random seed (same seed → same roster)
+        linked_ratio: Share of students that belong to a linked group
+        group_size: Students per linked group (2 or 3)
+    
+    Returns:
+        List of row dictionaries keyed by AVAILABILITY_REQUIRED_COLUMNS
+    """
+    rng = random.Random(seed)
+    rows = []
+    
+    for i in range(num_students):
+        row = {column: "" for column in AVAILABILITY_REQUIRED_COLUMNS}
+        row["nom"] = f"Eleve{i:05d}"
+        
+        available_days = [day for day in VALID_DAYS if rng.random() < 0.5] or [rng.choice(VALID_DAYS)]
+        for day in available_days:
+            debut, fin = rng.choice(STANDARD_RANGES)
+            row[f"{day}_debut"] = debut
+            row[f"{day}_fin"] = fin
+        
+        row["sessions_par_semaine"] = str(rng.randint(1, min(3, len(available_days) * 2)))
+        rows.append(row)
+    
+    # Link consecutive students by group, sharing the first student's availability
+    # (and session count, so the others still have enough slots)
+    num_linked = int(num_students * linked_ratio) // group_size * group_size
+    for i in range(0, num_linked, group_size):
+        group = rows[i:i + group_size]
+        for other in group[1:]:
+            for day in VALID_DAYS:
+                other[f"{day}_debut"] = group[0][f"{day}_debut"]
+                other[f"{day}_fin"] = group[0][f"{day}_fin"]
+            other["sessions_par_semaine"] = group[0]["sessions_par_semaine"]
+        for row in group:
+            row["groupe_lie"] = ";".join(other["nom"] for other in group if other is not row)
+    
+    return rows
+
+
+def roster_csv_text(num_students: int, seed: int = 0, linked_ratio: float = 0.1, group_size: int = 2) -> str:
+    """Generate a synthetic roster as CSV text."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=AVAILABILITY_REQUIRED_COLUMNS, lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(generate_roster_rows(num_students, seed, linked_ratio, group_size))
+    return buffer.getvalue()
+
+
+def write_roster_csv(path: str, num_students: int, seed: int = 0, linked_ratio: float = 0.1) -> None:
+    """Write a synthetic roster CSV to path."""
+    Path(path).write_text(roster_csv_text(num_students, seed, linked_ratio), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python scripts/synthetic_roster.py <num_students> <output.csv>")
+        sys.exit(1)
+    write_roster_csv(sys.argv[2], int(sys.argv[1]))
+    print(f"✅ {sys.argv[1]} students written to {sys.argv[2]}")
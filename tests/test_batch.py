@@ -0,0 +1,73 @@
+"""Tests for parallel batch parsing."""
+
+import pytest
+
+from core.batch import parse_many
+from core.parser import parse_csv, RosterErrorCode
+
+
+HEADER = "nom,sessions_par_semaine,lundi_debut,lundi_fin,mardi_debut,mardi_fin,mercredi_debut,mercredi_fin,jeudi_debut,jeudi_fin,vendredi_debut,vendredi_fin,samedi_debut,samedi_fin,groupe_lie,notes\n"
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """Three valid rosters, one invalid roster, one recurring slots file."""
+    paths = []
+    for k in range(3):
+        path = tmp_path / f"roster{k}.csv"
+        path.write_text(HEADER + f"Alice{k},1,08:00,10:00,,,,,,,,,,,,\nBob{k},2,08:00,10:00,,,,,,,,,,,,note\n")
+        paths.append(str(path))
+    invalid = tmp_path / "invalid.csv"
+    invalid.write_text(HEADER + "Alice,9,08:00,10:00,,,,,,,,,,,,\n")
+    recurring = tmp_path / "recurring.csv"
+    recurring.write_text("nom,jour,heure_debut,heure_fin\nAlice0,lundi,08:00,09:00\n")
+    return paths, str(invalid), str(recurring)
+
+
+class TestParseMany:
+    """Tests for parse_many."""
+    
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_results_in_input_order(self, corpus, workers):
+        """Test results follow input order and match parse_csv."""
+        paths, _, _ = corpus
+        
+        results = parse_many(paths[::-1], workers=workers)
+        
+        assert [r.roster_path for r in results] == paths[::-1]
+        assert [r.students for r in results] == [parse_csv(path) for path in paths[::-1]]
+    
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_errors_are_isolated(self, corpus, tmp_path, workers):
+        """Test invalid and missing files fail alone, with their error codes."""
+        paths, invalid, _ = corpus
+        missing = str(tmp_path / "missing.csv")
+        
+        results = parse_many([paths[0], invalid, missing, paths[1]], workers=workers)
+        
+        assert [r.ok for r in results] == [True, False, False, True]
+        assert results[1].error_code == RosterErrorCode.INVALID_SESSIONS
+        assert results[1].error.startswith("Row 2 (Alice): sessions_par_semaine must be 1-7")
+        assert results[2].error_code == RosterErrorCode.FILE_NOT_FOUND
+        assert results[1].students == []
+        assert results[3].student_count == 2
+    
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_recurring_slots_and_warnings(self, corpus, workers):
+        """Test (roster, recurring) pairs give the skeleton and its warnings."""
+        paths, _, recurring = corpus
+        
+        result, plain = parse_many([(paths[0], recurring), (paths[1], None)], workers=workers)
+        
+        assert [c.students for c in result.skeleton] == [("Alice0",)]
+        assert result.skeleton[0].slot.is_recurring
+        assert [w["type"] for w in result.warnings] == ["single_student_recurring"]
+        assert plain.recurring_path is None
+        assert plain.skeleton == []
+    
+    def test_unknown_engine(self, corpus):
+        """Test an unknown engine is rejected before any worker starts."""
+        paths, _, _ = corpus
+        
+        with pytest.raises(ValueError, match="Unknown CSV engine"):
+            parse_many(paths, engine="xlsx")
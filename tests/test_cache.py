@@ -0,0 +1,165 @@
+"""Tests for the on-disk parse cache."""
+
+import io
+import os
+
+import pytest
+
+from core import cache as cache_module
+from core.cache import ParseCache
+from core.parser import parse_csv, parse_recurring_slots_csv, ParseError
+
+
+HEADER = "nom,sessions_par_semaine,lundi_debut,lundi_fin,mardi_debut,mardi_fin,mercredi_debut,mercredi_fin,jeudi_debut,jeudi_fin,vendredi_debut,vendredi_fin,samedi_debut,samedi_fin,groupe_lie,notes\n"
+
+
+ROSTER = HEADER + (
+    "Alice,2,08:00,10:00,,,,,,,,,,,Bob,\n"
+    "Bob,2,08:00,10:00,,,,,,,,,,,Alice,Toujours avec Alice\n"
+    "Chloe,1,,,17:00,18:30,,,,,,,,,,\n"
+)
+RECURRING = "nom,jour,heure_debut,heure_fin\nAlice,lundi,08:00,09:00\nBob,lundi,08:00,09:00\nChloe,mardi,17:00,18:00\n"
+
+
+@pytest.fixture
+def roster(tmp_path):
+    csv_file = tmp_path / "roster.csv"
+    csv_file.write_text(ROSTER)
+    return str(csv_file)
+
+
+def _as_tuples(students):
+    return [
+        (s.name, s.sessions_per_week, s.availability_mask, s.linked_group, s.notes)
+        for s in students
+    ]
+
+
+class TestParseCache:
+    """Tests for ParseCache hits, misses and invalidation."""
+    
+    def test_hit_returns_same_students(self, tmp_path, roster):
+        """Test a second parse of the same file is served from the cache."""
+        cache = ParseCache(tmp_path / "cache")
+        
+        first = cache.parse_csv(roster)
+        second = cache.parse_csv(roster)
+        
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert _as_tuples(second) == _as_tuples(first) == _as_tuples(parse_csv(roster))
+        assert second[0].available_slots == first[0].available_slots
+        assert second == first
+    
+    def test_changed_content_is_a_miss(self, tmp_path):
+        """Test the key follows the file bytes, not its path."""
+        cache = ParseCache(tmp_path / "cache")
+        csv_file = tmp_path / "roster.csv"
+        csv_file.write_text(HEADER + "Alice,1,08:00,09:00,,,,,,,,,,,,\n")
+        cache.parse_csv(str(csv_file))
+        
+        csv_file.write_text(HEADER + "Alice,1,10:00,11:00,,,,,,,,,,,,\n")
+        students = cache.parse_csv(str(csv_file))
+        
+        assert cache.hits == 0
+        assert [slot.start_time.hour for slot in students[0].available_slots] == [10]
+    
+    @pytest.mark.parametrize("buffer", [io.StringIO, lambda text: io.BytesIO(text.encode())])
+    def test_buffer_is_keyed_by_content(self, tmp_path, roster, buffer):
+        """Test an uploaded buffer parses like parse_csv and shares the file's entry."""
+        cache = ParseCache(tmp_path / "cache")
+        
+        from_buffer = cache.parse_csv(buffer(ROSTER))
+        from_file = cache.parse_csv(roster)
+        
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert _as_tuples(from_buffer) == _as_tuples(from_file) == _as_tuples(parse_csv(buffer(ROSTER)))
+    
+    def test_fingerprint_change_invalidates(self, tmp_path, roster, monkeypatch):
+        """Test a format version bump makes previous entries unreachable."""
+        cache = ParseCache(tmp_path / "cache")
+        cache.parse_csv(roster)
+        
+        monkeypatch.setattr(cache_module, "CACHE_FORMAT_VERSION", cache_module.CACHE_FORMAT_VERSION + 1)
+        cache_module._schema_fingerprint.cache_clear()
+        try:
+            cache.parse_csv(roster)
+        finally:
+            cache_module._schema_fingerprint.cache_clear()
+        
+        assert (cache.hits, cache.misses) == (0, 2)
+    
+    def test_recurring_slots_round_trip(self, tmp_path, roster):
+        """Test cached recurring classes keep slot, students and status."""
+        cache = ParseCache(tmp_path / "cache")
+        students = parse_csv(roster)
+        recurring_file = tmp_path / "recurring.csv"
+        recurring_file.write_text(RECURRING)
+        recurring = str(recurring_file)
+        
+        expected = parse_recurring_slots_csv(recurring, students)
+        cache.parse_recurring_slots_csv(recurring, students)
+        cached = cache.parse_recurring_slots_csv(recurring, students)
+        
+        assert cache.hits == 1
+        assert [(c.slot, c.students, c.status) for c in cached] == [
+            (c.slot, c.students, c.status) for c in expected
+        ]
+        assert all(c.slot.is_recurring for c in cached)
+        assert [c.slot for c in cache.parse_recurring_slots_csv(io.StringIO(RECURRING), students)] == [
+            c.slot for c in expected
+        ]
+        assert cache.hits == 2
+    
+    def test_parse_errors_are_not_cached(self, tmp_path):
+        """Test an invalid file raises on every call."""
+        cache = ParseCache(tmp_path / "cache")
+        csv_file = tmp_path / "roster.csv"
+        csv_file.write_text(HEADER + "Alice,1,10:00,09:00,,,,,,,,,,,,\n")
+        
+        for _ in range(2):
+            with pytest.raises(ParseError):
+                cache.parse_csv(str(csv_file))
+        
+        assert cache.size_bytes() == 0
+    
+    def test_corrupted_entry_is_dropped(self, tmp_path, roster):
+        """Test an unreadable entry is treated as a miss and rewritten."""
+        cache = ParseCache(tmp_path / "cache")
+        cache.parse_csv(roster)
+        for entry in (tmp_path / "cache").iterdir():
+            entry.write_bytes(b"\xff")
+        
+        students = cache.parse_csv(roster)
+        
+        assert cache.hits == 0
+        assert _as_tuples(students) == _as_tuples(parse_csv(roster))
+        cache.parse_csv(roster)
+        assert cache.hits == 1
+    
+    def test_lru_eviction(self, tmp_path):
+        """Test the least recently used entry is evicted past max_bytes."""
+        cache = ParseCache(tmp_path / "cache")
+        paths = []
+        for i in range(3):
+            csv_file = tmp_path / f"roster{i}.csv"
+            csv_file.write_text(HEADER + f"Student{i},1,08:00,09:00,,,,,,,,,,,,\n")
+            paths.append(str(csv_file))
+        
+        cache.parse_csv(paths[0])
+        entry_size = cache.size_bytes()
+        cache.max_bytes = 2 * entry_size
+        cache.parse_csv(paths[1])
+        
+        # Spread mtimes so eviction order does not depend on clock resolution
+        entries = sorted((tmp_path / "cache").iterdir(), key=lambda e: e.stat().st_mtime_ns)
+        for age, entry in enumerate(entries):
+            os.utime(entry, ns=(age * 10**9, age * 10**9))
+        cache.parse_csv(paths[0])  # Hit: roster0 becomes the most recent
+        cache.parse_csv(paths[2])  # Miss: evicts roster1
+        
+        assert cache.size_bytes() <= cache.max_bytes
+        hits = cache.hits
+        cache.parse_csv(paths[0])
+        assert cache.hits == hits + 1
+        cache.parse_csv(paths[1])
+        assert cache.hits == hits + 1
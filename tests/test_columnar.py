@@ -0,0 +1,91 @@
+"""Tests for the columnar schedule result."""
+
+import pickle
+from datetime import time
+
+import numpy as np
+
+from core.columnar import ColumnarScheduleResult
+from core.formatter import to_json, to_markdown
+from core.models import ScheduleResult, ScheduledClass, UnplacedStudent, Slot, SlotStatus
+
+
+def _result():
+    return ScheduleResult(
+        schedule=[
+            ScheduledClass(
+                slot=Slot("mardi", time(10, 0), time(11, 0), is_recurring=True),
+                students=["Alice", "Bob"],
+                status=SlotStatus.LOCKED
+            ),
+            ScheduledClass(slot=Slot("lundi", time(14, 0), time(15, 0)), students=["Alice"]),
+            ScheduledClass(slot=Slot("lundi", time(9, 15), time(10, 15)), students=["Charlie", "Bob", "Diane"])
+        ],
+        unplaced=[UnplacedStudent(student="Emma", reason="No slot", conflicts=["x"], suggestions=["y"])],
+        warnings=[{
+            "type": "single_student_recurring",
+            "slot": "lundi 14:00",
+            "student": "Alice",
+            "message": "1 élève seul"
+        }],
+        metadata={"solver_status": "OPTIMAL"}
+    )
+
+
+class TestColumnarScheduleResult:
+    """Tests for ColumnarScheduleResult."""
+    
+    def test_layout(self):
+        """Test arrays and interned name table."""
+        columnar = ColumnarScheduleResult.from_result(_result())
+        
+        assert columnar.names == ("Alice", "Bob", "Charlie", "Diane")
+        assert columnar.student_offsets.tolist() == [0, 2, 3, 6]
+        assert columnar.student_ids.tolist() == [0, 1, 0, 2, 1, 3]
+        assert columnar.slot_ids.dtype == np.int32
+        assert len(columnar.off_grid_slots) == 1  # 09:15 is off-grid
+    
+    def test_round_trip_is_lossless(self):
+        """Test conversion back gives an equal ScheduleResult."""
+        result = _result()
+        restored = ColumnarScheduleResult.from_result(result).to_result()
+        
+        assert restored == result
+        assert [c.slot.is_recurring for c in restored.schedule] == [True, False, False]
+        assert restored.schedule[2].slot.start_time == time(9, 15)
+    
+    def test_pickle_round_trip(self):
+        """Test the columnar result survives pickling."""
+        columnar = pickle.loads(pickle.dumps(ColumnarScheduleResult.from_result(_result())))
+        
+        assert columnar.to_result() == _result()
+    
+    def test_counters_match(self):
+        """Test summary counters match the object result."""
+        result = _result()
+        columnar = ColumnarScheduleResult.from_result(result)
+        
+        assert columnar.total_classes == result.total_classes
+        assert columnar.placed_count == result.placed_count
+        assert columnar.placement_rate() == result.placement_rate()
+        assert columnar.is_complete() is False
+    
+    def test_formatter_renders_directly(self):
+        """Test JSON and Markdown output are identical for both layouts."""
+        result = _result()
+        columnar = ColumnarScheduleResult.from_result(result)
+        
+        assert to_json(columnar) == to_json(result)
+        assert _strip_date(to_markdown(columnar)) == _strip_date(to_markdown(result))
+    
+    def test_empty_result(self):
+        """Test an empty schedule converts and renders."""
+        columnar = ColumnarScheduleResult.from_result(ScheduleResult(schedule=[]))
+        
+        assert len(columnar) == 0
+        assert to_json(columnar)["schedule"] == []
+        assert columnar.to_result() == ScheduleResult(schedule=[])
+
+
+def _strip_date(markdown: str) -> str:
+    return "\n".join(line for line in markdown.splitlines() if "Date de génération" not in line)
@@ -0,0 +1,167 @@
+"""Tests for bulk CP-SAT model construction."""
+
+import pytest
+
+from core import scheduler
+from core.model_builder import build_model, constraint_kind, INT64_MAX
+from core.models import Student, TimeRange
+from core.problem import ProblemMatrix
+
+
+def _problem(coach_reserved_slots=()):
+    # Ana and Ben are linked; Cal is only free on mardi
+    lundi = [TimeRange.of("lundi", 480, 600)]
+    students = [
+        Student.from_ranges("Ana", 2, lundi, linked_group="Ben"),
+        Student.from_ranges("Ben", 1, lundi, linked_group="Ana"),
+        Student.from_ranges("Cal", 1, [TimeRange.of("mardi", 480, 540)]),
+    ]
+    return ProblemMatrix.build(students, skeleton={}, coach_reserved_slots=list(coach_reserved_slots))
+
+
+class TestBuildModel:
+    """Tests for build_model and ModelLayout."""
+    
+    @pytest.fixture(autouse=True)
+    def cp_model(self):
+        pytest.importorskip("ortools")
+        return scheduler._import_cp_model()
+    
+    def test_assignments_come_first_in_candidate_pair_order(self, cp_model):
+        """Test proto variable k is candidate pair k, followed by one occupancy literal per slot."""
+        problem = _problem()
+        model = cp_model.CpModel()
+        
+        layout = build_model(model, problem)
+        
+        rows, columns = problem.candidate_pairs()
+        assert layout.pair_rows.tolist() == rows.tolist()
+        assert layout.pair_columns.tolist() == columns.tolist()
+        assert sorted(layout.slot_columns.tolist()) == sorted(set(columns.tolist()))
+        assert layout.slot_used.tolist() == list(range(rows.size, rows.size + layout.slot_columns.size))
+        assert all(list(var.domain) == [0, 1] for var in model.Proto().variables)
+    
+    def test_sessions_constraint_per_student(self, cp_model):
+        """Test each student's assignments sum to their remaining sessions."""
+        problem = _problem()
+        model = cp_model.CpModel()
+        
+        layout = build_model(model, problem)
+        
+        constraints = model.Proto().constraints
+        for i, constraint in zip(range(problem.num_students), constraints):
+            expected = [k for k in range(layout.num_pairs) if layout.pair_rows[k] == i]
+            assert list(constraint.linear.vars) == expected
+            assert list(constraint.linear.domain) == [problem.remaining_sessions[i]] * 2
+    
+    def test_student_without_candidate_slot_makes_model_infeasible(self, cp_model):
+        """Test a student whose slots are all reserved gets an empty (false) clause."""
+        problem = _problem()
+        reserved = [problem.slots[j] for j in problem.student_slot_indices(problem.student_index["Cal"])]
+        problem = _problem(coach_reserved_slots=reserved)
+        model = cp_model.CpModel()
+        
+        build_model(model, problem)
+        
+        clause = model.Proto().constraints[2]
+        assert constraint_kind(clause) == "bool_or" and len(clause.bool_or.literals) == 0
+        assert cp_model.CpSolver().Solve(model) == cp_model.INFEASIBLE
+    
+    def test_linked_pair_together_literals(self, cp_model):
+        """Test one together literal per common slot, equal to both assignments, and a minimum count."""
+        problem = _problem()
+        model = cp_model.CpModel()
+        
+        layout = build_model(model, problem)
+        
+        proto = model.Proto()
+        assert not any(constraint_kind(c) == "int_prod" for c in proto.constraints)
+        implications = [c for c in proto.constraints if constraint_kind(c) == "bool_and"]
+        converses = [c for c in proto.constraints if constraint_kind(c) == "bool_or"]
+        ana, ben = problem.student_index["Ana"], problem.student_index["Ben"]
+        common = sorted(set(problem.student_slot_indices(ana).tolist()) & set(problem.student_slot_indices(ben).tolist()))
+        assert len(implications) == len(converses) == len(common)
+        together = [c.enforcement_literal[0] for c in implications]
+        assert together == list(range(layout.num_pairs + layout.slot_used.size, len(proto.variables)))
+        for c, converse, t, j in zip(implications, converses, together, common):
+            assigned = [k for k in range(layout.num_pairs) if layout.pair_columns[k] == j]
+            assert sorted(c.bool_and.literals) == assigned
+            # Both assigned ⇒ together
+            assert sorted(converse.bool_or.literals) == sorted([-k - 1 for k in assigned] + [t])
+        at_least = proto.constraints[len(proto.constraints) - 1].linear
+        assert list(at_least.vars) == together
+        assert list(at_least.domain) == [1, INT64_MAX]
+    
+    def test_linked_group_of_three_share_classes(self, cp_model):
+        """Test a three-student group takes min(sessions) classes all together."""
+        ranges = [TimeRange.of("lundi", 480, 720)]
+        students = [
+            Student.from_ranges("Ana", 2, ranges, linked_group="Ben;Cal"),
+            Student.from_ranges("Ben", 2, ranges, linked_group="Ana;Cal"),
+            Student.from_ranges("Cal", 3, ranges, linked_group="Ana;Ben"),
+            Student.from_ranges("Dan", 1, ranges),
+            Student.from_ranges("Eve", 2, ranges),
+        ]
+        problem = ProblemMatrix.build(students, skeleton={}, coach_reserved_slots=[])
+        model = cp_model.CpModel()
+        layout = build_model(model, problem, include_soft_constraints=False)
+        solver = cp_model.CpSolver()
+        
+        assert solver.Solve(model) == cp_model.OPTIMAL
+        rows, columns = layout.assigned_pairs(solver.ResponseProto().solution)
+        
+        classes = {}
+        for i, j in zip(rows.tolist(), columns.tolist()):
+            classes.setdefault(j, set()).add(i)
+        assert sum(1 for members in classes.values() if {0, 1, 2} <= members) == 2
+    
+    def test_class_size_bounds(self, cp_model):
+        """Test classes hold min_students_per_class to max_students_per_class students."""
+        ranges = [TimeRange.of("lundi", 480, 600)]
+        students = [Student.from_ranges(name, 1, ranges) for name in ("Ana", "Ben", "Cal", "Dan")]
+        problem = ProblemMatrix.build(students, skeleton={}, coach_reserved_slots=[])
+        model = cp_model.CpModel()
+        layout = build_model(
+            model, problem, include_soft_constraints=False, min_students_per_class=4, max_students_per_class=4
+        )
+        solver = cp_model.CpSolver()
+        
+        assert solver.Solve(model) == cp_model.OPTIMAL
+        rows, columns = layout.assigned_pairs(solver.ResponseProto().solution)
+        
+        # One class of four, beyond the default 2-3
+        assert sorted(rows.tolist()) == [0, 1, 2, 3]
+        assert len(set(columns.tolist())) == 1
+    
+    def test_objective(self, cp_model):
+        """Test phase objectives: fill classes (weight 3), placements, or none."""
+        problem = _problem()
+        
+        soft = cp_model.CpModel()
+        build_model(soft, problem)
+        placements = cp_model.CpModel()
+        layout = build_model(placements, problem, include_soft_constraints=False, maximize_placements=True)
+        hard = cp_model.CpModel()
+        build_model(hard, problem, include_soft_constraints=False)
+        
+        assert list(soft.Proto().objective.coeffs) == [3] * layout.num_pairs
+        assert list(placements.Proto().objective.coeffs) == [-1] * layout.num_pairs
+        assert placements.Proto().objective.scaling_factor == -1
+        assert not hard.HasObjective()
+    
+    def test_assigned_pairs_reads_solution(self, cp_model):
+        """Test solved assignments are read back as (rows, columns) arrays."""
+        ranges = [TimeRange.of("lundi", 480, 600)]
+        students = [Student.from_ranges(name, 1, ranges) for name in ("Ana", "Ben", "Cal", "Dan")]
+        problem = ProblemMatrix.build(students, skeleton={}, coach_reserved_slots=[])
+        model = cp_model.CpModel()
+        layout = build_model(model, problem, include_soft_constraints=False)
+        solver = cp_model.CpSolver()
+        
+        assert solver.Solve(model) == cp_model.OPTIMAL
+        rows, columns = layout.assigned_pairs(solver.ResponseProto().solution)
+        
+        # Every student placed once, in classes that never overlap
+        assert sorted(rows.tolist()) == [0, 1, 2, 3]
+        classes = [problem.slots[j] for j in set(columns.tolist())]
+        assert not any(a.overlaps(b) for i, a in enumerate(classes) for b in classes[i + 1:])
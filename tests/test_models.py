@@ -0,0 +1,518 @@
+"""Tests for data models."""
+
+import pickle
+
+import pytest
+from dataclasses import FrozenInstanceError
+from datetime import time
+
+from core.models import (
+    Slot, SlotSet, Student, TimeRange, ScheduledClass, UnplacedStudent, ScheduleResult, compute_slot_id, decode_slot_id, iter_slot_ids,
+    slots_to_mask, overlap_mask, slots_overlap, conflict_mask, conflicting_slot_ids,
+    GRID_SIZE, SLOT_ID_COUNT, MASK_TEMPLATE_CACHE_SIZE, _mask_template
+)
+
+
+class TestSlotIds:
+    """Tests for the integer slot table."""
+    
+    def test_standard_slots_use_grid_positions(self):
+        """Test 1h slots get IDs 0..287 in chronological order."""
+        assert compute_slot_id("lundi", time(0, 0), time(1, 0)) == 0
+        assert compute_slot_id("lundi", time(8, 30), time(9, 30)) == 17
+        assert compute_slot_id("mardi", time(8, 0), time(9, 0)) == 48 + 16
+        assert compute_slot_id("samedi", time(22, 30), time(23, 30)) < GRID_SIZE
+    
+    def test_non_standard_duration_outside_standard_range(self):
+        """Test 2h slots get their own IDs above the 1h range."""
+        two_hours = compute_slot_id("lundi", time(8, 0), time(10, 0))
+        assert GRID_SIZE <= two_hours < SLOT_ID_COUNT
+        assert two_hours != compute_slot_id("lundi", time(8, 0), time(9, 0))
+    
+    def test_decode_round_trip(self):
+        """Test decode_slot_id is the inverse of compute_slot_id."""
+        for day, start, end in [
+            ("lundi", time(8, 0), time(9, 0)),
+            ("vendredi", time(17, 30), time(18, 30)),
+            ("samedi", time(9, 0), time(9, 30)),
+            ("jeudi", time(0, 0), time(23, 30)),
+        ]:
+            assert decode_slot_id(compute_slot_id(day, start, end)) == (day, start, end)
+    
+    def test_off_grid_slots_get_stable_ids(self):
+        """Test slots outside the grid still get stable, distinct IDs."""
+        off_grid = Slot("lundi", time(8, 15), time(9, 15))
+        assert off_grid.id >= SLOT_ID_COUNT
+        assert Slot("lundi", time(8, 15), time(9, 15)).id == off_grid.id
+        assert Slot("dimanche", time(8, 0), time(9, 0)).id >= SLOT_ID_COUNT
+        assert Slot.from_id(off_grid.id) == off_grid
+    
+    def test_invalid_id_rejected(self):
+        """Test IDs that don't map to a slot raise ValueError."""
+        with pytest.raises(ValueError):
+            decode_slot_id(-1)
+        with pytest.raises(ValueError):
+            decode_slot_id(47)  # lundi 23:30-00:30 crosses midnight
+
+
+class TestSlotInterning:
+    """Tests for interned Slot instances and int-based comparisons."""
+    
+    def test_from_id_returns_shared_instance(self):
+        """Test from_id returns the same object for the same ID."""
+        slot = Slot("mardi", time(17, 0), time(18, 0))
+        assert Slot.from_id(slot.id) is Slot.from_id(slot.id)
+        assert Slot.intern("mardi", time(17, 0), time(18, 0)) is Slot.from_id(slot.id)
+        assert Slot.from_id(slot.id) == slot
+    
+    def test_recurring_flag_interned_separately(self):
+        """Test recurring and non-recurring slots are distinct instances but equal."""
+        plain = Slot.from_id(10)
+        recurring = Slot.from_id(10, is_recurring=True)
+        assert plain is not recurring
+        assert recurring.is_recurring is True
+        assert plain.is_recurring is False
+        assert plain == recurring
+    
+    def test_hash_and_equality_use_id(self):
+        """Test hashing and equality are based on the slot ID."""
+        slot1 = Slot("lundi", time(8, 0), time(9, 0))
+        slot2 = Slot("lundi", time(8, 0), time(9, 0), is_recurring=True)
+        assert hash(slot1) == slot1.id
+        assert slot1 == slot2
+        assert len({slot1, slot2}) == 1
+        assert slot1 != Slot("lundi", time(8, 30), time(9, 30))
+    
+    def test_ordering_is_chronological_for_standard_slots(self):
+        """Test sorting 1h slots orders them by day then time."""
+        slots = [
+            Slot("mardi", time(8, 0), time(9, 0)),
+            Slot("lundi", time(18, 0), time(19, 0)),
+            Slot("lundi", time(8, 30), time(9, 30)),
+        ]
+        assert [(s.day, s.start_time) for s in sorted(slots)] == [
+            ("lundi", time(8, 30)),
+            ("lundi", time(18, 0)),
+            ("mardi", time(8, 0)),
+        ]
+
+
+class TestStudentAvailabilityMask:
+    """Tests for the packed availability mask on Student."""
+    
+    def test_mask_built_from_slots(self):
+        """Test mask has one bit per distinct available slot."""
+        slots = [
+            Slot("lundi", time(8, 0), time(9, 0)),
+            Slot("lundi", time(9, 0), time(10, 0)),
+            Slot("lundi", time(8, 0), time(9, 0)),  # Duplicate
+        ]
+        student = Student(name="Alice", sessions_per_week=1, available_slots=slots)
+        
+        assert student.availability_mask == (1 << slots[0].id) | (1 << slots[1].id)
+        assert student.availability_count() == 2
+        assert student.is_available_for(Slot("lundi", time(9, 0), time(10, 0)))
+        assert not student.is_available_for(Slot("lundi", time(8, 30), time(9, 30)))
+    
+    def test_overlap_and_intersection(self):
+        """Test overlap queries use the mask intersection."""
+        alice = Student(
+            name="Alice",
+            sessions_per_week=1,
+            available_slots=[
+                Slot("mardi", time(17, 0), time(18, 0)),
+                Slot("lundi", time(8, 0), time(9, 0)),
+            ]
+        )
+        bob = Student(
+            name="Bob",
+            sessions_per_week=1,
+            available_slots=[
+                Slot("lundi", time(8, 0), time(9, 0)),
+                Slot("mardi", time(17, 0), time(18, 0)),
+                Slot("jeudi", time(8, 0), time(9, 0)),
+            ]
+        )
+        charlie = Student(
+            name="Charlie",
+            sessions_per_week=1,
+            available_slots=[Slot("lundi", time(8, 30), time(9, 30))]
+        )
+        
+        assert alice.has_overlapping_availability(bob)
+        assert not alice.has_overlapping_availability(charlie)
+        assert alice.get_overlapping_slots(bob) == [
+            Slot("lundi", time(8, 0), time(9, 0)),
+            Slot("mardi", time(17, 0), time(18, 0)),
+        ]
+        assert alice.get_overlapping_slots(charlie) == []
+    
+    def test_iter_slot_ids(self):
+        """Test iter_slot_ids yields set bits in increasing order."""
+        assert list(iter_slot_ids(0)) == []
+        assert list(iter_slot_ids(0b1011)) == [0, 1, 3]
+        assert list(iter_slot_ids(1 << 300)) == [300]
+
+
+class TestMaskTemplates:
+    """Tests for the shared slot tuples behind Student.from_mask."""
+    
+    def test_same_mask_shares_slots(self):
+        """Test students with the same mask share one interned slot tuple."""
+        mask = slots_to_mask([Slot("lundi", time(8, 0), time(9, 0)), Slot("jeudi", time(17, 30), time(18, 30))])
+        
+        alice = Student.from_mask("Alice", 1, mask)
+        bob = Student.from_mask("Bob", 2, mask, linked_group="Alice", notes="x")
+        
+        assert alice.available_slots is bob.available_slots
+        assert bob.availability_mask == mask
+        assert (bob.linked_group, bob.notes) == ("Alice", "x")
+    
+    def test_matches_slot_by_slot_expansion(self):
+        """Test templates built from day blocks keep ID order, other durations included."""
+        slots = [
+            Slot("lundi", time(8, 0), time(9, 0)),
+            Slot("lundi", time(22, 30), time(23, 30)),
+            Slot("mardi", time(8, 0), time(9, 0)),
+            Slot("samedi", time(12, 0), time(13, 0)),
+            Slot("mercredi", time(8, 0), time(9, 30)),  # 1h30: another block
+        ]
+        mask = slots_to_mask(slots)
+        
+        student = Student.from_mask("Alice", 1, mask)
+        
+        assert student.available_slots == tuple(Slot.from_id(slot_id) for slot_id in iter_slot_ids(mask))
+        assert student == Student(name="Alice", sessions_per_week=1, available_slots=student.available_slots)
+    
+    def test_cache_is_bounded(self):
+        """Test the template cache is an LRU of MASK_TEMPLATE_CACHE_SIZE entries."""
+        assert _mask_template.cache_info().maxsize == MASK_TEMPLATE_CACHE_SIZE
+
+
+class TestTimeRanges:
+    """Tests for range-based availability storage."""
+    
+    def test_ranges_are_interned(self):
+        """Test equal ranges are one shared object."""
+        assert TimeRange.of("lundi", 480, 780) is TimeRange.from_times("lundi", time(8, 0), time(13, 0))
+        assert str(TimeRange.of("lundi", 510, 660)) == "lundi 08:30-11:00"
+    
+    def test_expansion_steps_one_hour(self):
+        """Test a range expands to 1h slots every hour from its start."""
+        time_range = TimeRange.of("lundi", 510, 660)
+        
+        assert time_range.slots() == (
+            Slot("lundi", time(8, 30), time(9, 30)),
+            Slot("lundi", time(9, 30), time(10, 30)),
+        )
+        assert time_range.slots() is time_range.slots()
+        assert time_range.mask == slots_to_mask(time_range.slots())
+    
+    def test_covers_uses_range_bounds(self):
+        """Test containment is judged on the range, not on the expanded slots."""
+        time_range = TimeRange.of("lundi", 480, 780)
+        
+        assert time_range.covers(Slot("lundi", time(8, 30), time(9, 30)))
+        assert time_range.covers(Slot("lundi", time(12, 0), time(13, 0)))
+        assert not time_range.covers(Slot("lundi", time(12, 30), time(13, 30)))
+        assert not time_range.covers(Slot("mardi", time(8, 0), time(9, 0)))
+    
+    def test_student_with_several_ranges_per_day(self):
+        """Test two ranges on one day: mask, lazy slots and the gap between them."""
+        morning = TimeRange.of("lundi", 480, 600)
+        evening = TimeRange.of("lundi", 1020, 1140)
+        student = Student.from_ranges("Alice", 1, [TimeRange.of("mardi", 480, 540), evening, morning])
+        
+        assert student.availability_ranges == (morning, evening, TimeRange.of("mardi", 480, 540))
+        assert student.ranges_on("lundi") == (morning, evening)
+        assert student.availability_mask == morning.mask | evening.mask | TimeRange.of("mardi", 480, 540).mask
+        assert student.available_slots == tuple(Slot.from_id(i) for i in iter_slot_ids(student.availability_mask))
+        assert student.covers(Slot("lundi", time(17, 30), time(18, 30)))
+        assert not student.covers(Slot("lundi", time(12, 0), time(13, 0)))
+    
+    def test_ranges_derived_from_slots(self):
+        """Test slot-built students keep their slots and merge touching ones into ranges."""
+        slots = [
+            Slot("lundi", time(9, 0), time(10, 0)),
+            Slot("lundi", time(8, 0), time(9, 0)),
+            Slot("lundi", time(14, 0), time(15, 0)),
+        ]
+        student = Student(name="Alice", sessions_per_week=1, available_slots=slots)
+        
+        assert student.available_slots == tuple(slots)
+        assert student.availability_ranges == (TimeRange.of("lundi", 480, 600), TimeRange.of("lundi", 840, 900))
+        assert Student.from_mask("Alice", 1, student.availability_mask).availability_ranges == student.availability_ranges
+    
+    def test_pickle_round_trip(self):
+        """Test students with ranges survive pickling."""
+        student = Student.from_ranges("Alice", 2, [TimeRange.of("lundi", 480, 600)], linked_group="Bob")
+        
+        restored = pickle.loads(pickle.dumps(student))
+        
+        assert restored == student
+        assert restored.available_slots == student.available_slots
+
+
+class TestSlotMinutes:
+    """Tests for the minutes cached on Slot at construction."""
+    
+    def test_cached_minutes_and_half_hour_index(self):
+        """Test start/end minutes and weekly half-hour index."""
+        slot = Slot("mardi", time(9, 30), time(10, 30))
+        
+        assert slot.start_minutes == 570
+        assert slot.end_minutes == 630
+        assert slot.half_hour_index == 48 + 19
+        assert Slot("lundi", time(9, 15), time(10, 15)).half_hour_index == -1
+        assert Slot("dimanche", time(9, 0), time(10, 0)).half_hour_index == -1
+    
+    def test_duration_and_validity_use_cached_minutes(self):
+        """Test duration_hours and is_valid on aligned and misaligned slots."""
+        assert Slot("lundi", time(8, 0), time(9, 30)).duration_hours() == 1.5
+        assert Slot("lundi", time(8, 30), time(9, 30)).is_valid()
+        assert not Slot("lundi", time(8, 15), time(9, 15)).is_valid()
+        assert not Slot("lundi", time(8, 0), time(10, 0)).is_valid()
+    
+    def test_cached_minutes_agree_with_times(self):
+        """Test ordering, overlaps, validity and duration read from cached minutes match the time fields."""
+        def minutes(t):
+            return t.hour * 60 + t.minute
+        
+        slots = [
+            Slot(day, time(start // 60, start % 60), time((start + length) // 60, (start + length) % 60))
+            for day in ("lundi", "mardi")
+            for start in range(7 * 60, 10 * 60, 15)
+            for length in (30, 60, 90)
+        ]
+        
+        for slot in slots:
+            start, end = minutes(slot.start_time), minutes(slot.end_time)
+            assert (slot.start_minutes, slot.end_minutes) == (start, end)
+            assert slot.duration_hours() == (end - start) / 60
+            assert slot.is_valid() == (end - start == 60 and start % 30 == 0)
+        for a in slots:
+            for b in slots:
+                assert a.overlaps(b) == (
+                    a.day == b.day
+                    and minutes(a.start_time) < minutes(b.end_time)
+                    and minutes(b.start_time) < minutes(a.end_time)
+                )
+        assert sorted(slots, key=lambda s: (s.day, s.start_minutes, s.id)) == sorted(
+            slots, key=lambda s: (s.day, s.start_time, s.id)
+        )
+
+
+class TestSlotSet:
+    """Tests for the bitmap-backed SlotSet."""
+    
+    def test_set_operations(self):
+        """Test union, intersection, difference and membership."""
+        a = SlotSet.from_slots([Slot("lundi", time(8, 0), time(9, 0)), Slot("lundi", time(9, 0), time(10, 0))])
+        b = SlotSet.from_slots([Slot("lundi", time(9, 0), time(10, 0)), Slot("mardi", time(8, 0), time(9, 0))])
+        
+        assert len(a | b) == 3
+        assert list(a & b) == [Slot("lundi", time(9, 0), time(10, 0))]
+        assert list(a - b) == [Slot("lundi", time(8, 0), time(9, 0))]
+        assert Slot("mardi", time(8, 0), time(9, 0)) in b
+        assert not (a - a)
+        assert SlotSet.union_of([a, b]) == a | b
+    
+    def test_expand_overlapping_on_grid(self):
+        """Test expansion adds half-hour offset neighbours."""
+        expanded = SlotSet.from_slots([Slot("lundi", time(9, 0), time(10, 0))]).expand_overlapping()
+        
+        assert Slot("lundi", time(8, 30), time(9, 30)) in expanded
+        assert Slot("lundi", time(9, 30), time(10, 30)) in expanded
+        assert Slot("lundi", time(10, 0), time(11, 0)) not in expanded
+    
+    def test_without_overlapping_handles_partial_and_off_grid(self):
+        """Test a reserved 09:00-10:00 removes 09:30-10:30 and an off-grid 09:15 slot."""
+        candidates = SlotSet.from_slots([
+            Slot("lundi", time(8, 0), time(9, 0)),
+            Slot("lundi", time(9, 30), time(10, 30)),
+            Slot("lundi", time(9, 15), time(10, 15)),
+            Slot("lundi", time(10, 0), time(11, 0)),
+        ])
+        reserved = SlotSet.from_slots([Slot("lundi", time(9, 0), time(10, 0))])
+        
+        remaining = candidates.without_overlapping(reserved)
+        
+        assert [s.start_time for s in remaining] == [time(8, 0), time(10, 0)]
+
+
+class TestOverlapIndex:
+    """Tests for the precomputed slot overlap index."""
+    
+    def test_overlap_mask_standard_slot(self):
+        """Test 1h slot overlaps itself and the 1h slots starting 30 min around it."""
+        slot = Slot("lundi", time(9, 0), time(10, 0))
+        standard_neighbours = overlap_mask(slot.id) & ((1 << GRID_SIZE) - 1)
+        
+        assert list(iter_slot_ids(standard_neighbours)) == [
+            Slot("lundi", time(8, 30), time(9, 30)).id,
+            slot.id,
+            Slot("lundi", time(9, 30), time(10, 30)).id,
+        ]
+    
+    def test_slots_overlap_matches_interval_logic(self):
+        """Test index lookups agree with half-open interval semantics."""
+        slot = Slot("mardi", time(8, 0), time(9, 0))
+        assert slots_overlap(slot.id, Slot("mardi", time(8, 30), time(9, 30)).id)
+        assert slots_overlap(slot.id, Slot("mardi", time(7, 0), time(10, 0)).id)
+        assert not slots_overlap(slot.id, Slot("mardi", time(9, 0), time(10, 0)).id)
+        assert not slots_overlap(slot.id, Slot("mercredi", time(8, 0), time(9, 0)).id)
+    
+    def test_off_grid_slots(self):
+        """Test off-grid slots fall back to interval comparison."""
+        off_grid = Slot("lundi", time(8, 15), time(9, 15))
+        assert off_grid.overlaps(Slot("lundi", time(9, 0), time(10, 0)))
+        assert not off_grid.overlaps(Slot("lundi", time(9, 30), time(10, 30)))
+        assert off_grid.overlaps(Slot("lundi", time(8, 45), time(9, 45)))
+    
+    def test_conflicting_slot_ids(self):
+        """Test conflicting_slot_ids filters candidates and excludes the slot itself."""
+        slot = Slot("jeudi", time(10, 0), time(11, 0))
+        candidates = [
+            slot,
+            Slot("jeudi", time(10, 30), time(11, 30)),
+            Slot("jeudi", time(11, 0), time(12, 0)),
+            Slot("jeudi", time(9, 30), time(10, 30)),
+        ]
+        candidates_mask = slots_to_mask(candidates)
+        
+        assert list(conflicting_slot_ids(slot.id, candidates_mask)) == [
+            candidates[3].id,
+            candidates[1].id,
+        ]
+        assert conflict_mask(slot.id, candidates_mask) >> slot.id & 1
+
+
+class TestCompactModels:
+    """Tests for frozen, slotted models sharing interned slots."""
+    
+    def test_models_have_no_instance_dict(self):
+        """Test models use __slots__ instead of a per-instance __dict__."""
+        slot = Slot("lundi", time(8, 0), time(9, 0))
+        student = Student(name="Alice", sessions_per_week=1, available_slots=[slot])
+        scheduled_class = ScheduledClass(slot=slot, students=["Alice", "Bob"])
+        unplaced = UnplacedStudent(student="Charlie", reason="No slot")
+        
+        for instance in (slot, student, scheduled_class, unplaced):
+            assert not hasattr(instance, "__dict__")
+    
+    def test_models_are_frozen(self):
+        """Test models cannot be mutated after construction."""
+        slot = Slot("lundi", time(8, 0), time(9, 0))
+        student = Student(name="Alice", sessions_per_week=1, available_slots=[slot])
+        
+        with pytest.raises(FrozenInstanceError):
+            slot.day = "mardi"
+        with pytest.raises(FrozenInstanceError):
+            student.sessions_per_week = 2
+    
+    def test_scheduled_class_students_are_a_tuple(self):
+        """Test class students are stored as a tuple, so the class is hashable."""
+        slot = Slot("lundi", time(8, 0), time(9, 0))
+        names = ["Alice", "Bob"]
+        scheduled_class = ScheduledClass(slot=slot, students=names)
+        names.append("Charlie")
+        
+        assert scheduled_class.students == ("Alice", "Bob")
+        assert hash(scheduled_class) == hash(ScheduledClass(slot=slot, students=("Alice", "Bob")))
+    
+    def test_student_shares_interned_slots(self):
+        """Test students keep interned slots, not their own copies."""
+        alice = Student(
+            name="Alice",
+            sessions_per_week=1,
+            available_slots=[Slot("lundi", time(8, 0), time(9, 0))]
+        )
+        bob = Student(
+            name="Bob",
+            sessions_per_week=1,
+            available_slots=[Slot("lundi", time(8, 0), time(9, 0))]
+        )
+        
+        assert isinstance(alice.available_slots, tuple)
+        assert alice.available_slots[0] is bob.available_slots[0]
+
+
+class TestScheduleResultIndexes:
+    """Tests for the cached views on ScheduleResult."""
+    
+    def _result(self):
+        return ScheduleResult(schedule=[
+            ScheduledClass(slot=Slot("mardi", time(10, 0), time(11, 0)), students=["Alice", "Bob"]),
+            ScheduledClass(slot=Slot("lundi", time(14, 0), time(15, 0)), students=["Alice"]),
+            ScheduledClass(slot=Slot("lundi", time(9, 0), time(10, 0)), students=["Charlie"])
+        ])
+    
+    def test_by_day_groups_and_sorts(self):
+        """Test classes are grouped by day and sorted by start time."""
+        result = self._result()
+        
+        assert list(result.by_day) == ["lundi", "mardi", "mercredi", "jeudi", "vendredi", "samedi"]
+        assert [c.slot.start_time for c in result.by_day["lundi"]] == [time(9, 0), time(14, 0)]
+        assert result.by_day["mercredi"] == []
+    
+    def test_student_and_slot_indexes(self):
+        """Test by_student, sessions_per_student and by_slot."""
+        result = self._result()
+        
+        assert len(result.by_student["Alice"]) == 2
+        assert result.sessions_per_student == {"Alice": 2, "Bob": 1, "Charlie": 1}
+        assert result.by_slot[Slot("mardi", time(10, 0), time(11, 0))] == ["Alice", "Bob"]
+    
+    def test_views_are_cached(self):
+        """Test repeated access returns the same cached object."""
+        result = self._result()
+        
+        assert result.by_day is result.by_day
+        assert result.by_slot is result.by_slot
+    
+    def test_in_place_mutation_invalidates_cache(self):
+        """Test appending to schedule or unplaced refreshes views and counters."""
+        result = self._result()
+        assert result.placed_count == 4
+        assert result.placement_rate() == 100.0
+        
+        result.schedule.append(
+            ScheduledClass(slot=Slot("lundi", time(8, 0), time(9, 0)), students=["Bob"])
+        )
+        result.unplaced.append(UnplacedStudent(student="Diane", reason="No slot"))
+        
+        assert result.placed_count == 5
+        assert result.sessions_per_student["Bob"] == 2
+        assert result.by_day["lundi"][0].slot.start_time == time(8, 0)
+        assert result.placement_rate() == pytest.approx(5 / 6 * 100)
+    
+    def test_assigned_list_is_copied(self):
+        """Test the result keeps its own copy of the list it was given."""
+        schedule = [ScheduledClass(slot=Slot("lundi", time(8, 0), time(9, 0)), students=["Alice", "Bob"])]
+        result = ScheduleResult(schedule=schedule)
+        
+        schedule.append(ScheduledClass(slot=Slot("mardi", time(8, 0), time(9, 0)), students=["Charlie"]))
+        
+        assert result.schedule is not schedule
+        assert result.total_classes == 1
+    
+    def test_reassignment_invalidates_cache(self):
+        """Test replacing the schedule list refreshes views."""
+        result = self._result()
+        assert result.total_classes == 3
+        _ = result.by_student
+        
+        result.schedule = []
+        
+        assert result.total_classes == 0
+        assert result.by_student == {}
+        assert result.placement_rate() == 0.0
+    
+    def test_pickle_round_trip_keeps_tracking(self):
+        """Test an unpickled result still invalidates its cache on mutation."""
+        result = pickle.loads(pickle.dumps(self._result()))
+        assert result.placed_count == 4
+        
+        result.schedule.pop()
+        
+        assert result.placed_count == 3
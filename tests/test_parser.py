@@ -1,5 +1,12 @@
 """Tests for CSV parser module."""
 
+import io
+import pickle
+import subprocess
+import sys
+import time as clock
+
+import pandas as pd
 import pytest
 from datetime import time
 from pathlib import Path
@@ -9,13 +16,20 @@ import os
 from core.parser import (
     parse_time,
     expand_time_range_to_slots,
+    expand_time_range_to_mask,
     parse_csv,
+    iter_students,
     validate_linked_groups,
     parse_recurring_slots_csv,
     parse_recurring_slots_csv_with_warnings,
-    ParseError
+    validate_roster,
+    validate_recurring_slots,
+    diff_rosters,
+    _parse_student_row,
+    ParseError,
+    RosterErrorCode
 )
-from core.models import Student, Slot, SlotStatus
+from core.models import Student, Slot, SlotStatus, ScheduledClass, TimeRange, slots_to_mask
 
 
 class TestParseTime:
@@ -96,7 +110,19 @@ class TestExpandTimeRange:
         
         with pytest.raises(ParseError, match="start .* must be before end"):
             expand_time_range_to_slots("vendredi", time(18, 0), time(18, 0))
-
+    
+    def test_expansion_is_memoized(self):
+        """Test repeated expansions share one tuple of interned slots and its mask."""
+        slots = expand_time_range_to_slots("samedi", time(8, 0), time(13, 0))
+        
+        assert expand_time_range_to_slots("samedi", time(8, 0), time(13, 0)) is slots
+        assert isinstance(slots, tuple)
+        assert expand_time_range_to_mask("samedi", time(8, 0), time(13, 0)) == slots_to_mask(slots)
+        
+        # Errors are raised on every call, not cached
+        for _ in range(2):
+            with pytest.raises(ParseError, match="start .* must be before end"):
+                expand_time_range_to_mask("samedi", time(13, 0), time(8, 0))
 
 class TestParseCSV:
     """Tests for parse_csv function."""
@@ -175,6 +201,401 @@ Vincent,5,08:00,09:00,,,,,,,,,,,,
             parse_csv(str(csv_file))
 
 
+class TestVectorizedParseCSV:
+    """Tests for the column-wise parse_csv path against the row-by-row path."""
+    
+    HEADER = "nom,sessions_par_semaine,lundi_debut,lundi_fin,mardi_debut,mardi_fin,mercredi_debut,mercredi_fin,jeudi_debut,jeudi_fin,vendredi_debut,vendredi_fin,samedi_debut,samedi_fin,groupe_lie,notes\n"
+    
+    def _row_by_row(self, csv_file):
+        df = pd.read_csv(csv_file)
+        return [_parse_student_row(idx, row) for idx, row in df.iterrows()]
+    
+    def test_matches_row_by_row_path(self, tmp_path):
+        """Test both paths build identical students, including off-fast-path cells."""
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text(self.HEADER + (
+            "Alice,2,08:00,13:00,,,08:30,10:30,,,,,22:00,23:30,,  note \n"
+            "Bob,1, 9:00,10:00,,,,,,,,,,,,\n"
+            "Chloe,3,,,14:00,19:30,,,,,12:00,14:00,,,,\n"
+        ))
+        
+        vectorized = parse_csv(str(csv_file))
+        reference = self._row_by_row(str(csv_file))
+        
+        for student, expected in zip(vectorized, reference):
+            assert student == expected
+            assert student.available_slots == expected.available_slots
+            assert student.notes == expected.notes
+        assert vectorized[0].available_slots[-1] == Slot("samedi", time(22, 0), time(23, 0))
+    
+    def test_first_bad_row_is_reported(self, tmp_path):
+        """Test the error names the earliest invalid row, with the precise message."""
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text(self.HEADER + (
+            "Alice,1,08:00,09:00,,,,,,,,,,,,\n"
+            "Bob,1,08:15,09:00,,,,,,,,,,,,\n"
+            "Chloe,9,08:00,09:00,,,,,,,,,,,,\n"
+        ))
+        
+        with pytest.raises(ParseError, match=r"^Row 3 \(Bob\): Invalid time granularity: '08:15'"):
+            parse_csv(str(csv_file))
+    
+    def test_inverted_range_message(self, tmp_path):
+        """Test start >= end keeps the expand_time_range_to_slots message."""
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text(self.HEADER + "Alice,1,10:00,09:00,,,,,,,,,,,,\n")
+        
+        with pytest.raises(ParseError, match=r"Row 2 \(Alice\): Invalid time range for lundi"):
+            parse_csv(str(csv_file))
+
+
+class TestIterStudents:
+    """Tests for the chunked iter_students generator."""
+    
+    HEADER = TestVectorizedParseCSV.HEADER
+    
+    def test_matches_parse_csv(self, tmp_path):
+        """Test chunked streaming yields the same students as parse_csv."""
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text(self.HEADER + (
+            "Alice,2,08:00,13:00,,,,,,,,,,,Bob,\n"
+            "Bob,1,08:00,10:00,,,,,,,,,,,Alice,\n"
+            "Chloe,1,,,14:00,19:30,,,,,,,,,,\n"
+            "Dan,1, 9:00,10:00,,,,,,,,,,,,\n"
+            "Emma,2,,,,,,,,,12:00,14:00,,,,\n"
+        ))
+        
+        streamed = list(iter_students(str(csv_file), chunk_size=2))
+        
+        assert streamed == parse_csv(str(csv_file))
+        assert [s.availability_mask for s in streamed] == [s.availability_mask for s in parse_csv(str(csv_file))]
+    
+    def test_yields_before_later_row_error(self, tmp_path):
+        """Test students of earlier chunks are yielded before a later error, with a global row number."""
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text(self.HEADER + (
+            "Alice,1,08:00,09:00,,,,,,,,,,,,\n"
+            "Bob,1,08:00,09:00,,,,,,,,,,,,\n"
+            "Chloe,1,08:00,09:00,,,,,,,,,,,,\n"
+            "Dan,0,08:00,09:00,,,,,,,,,,,,\n"
+        ))
+        
+        stream = iter_students(str(csv_file), chunk_size=2)
+        assert [next(stream).name, next(stream).name] == ["Alice", "Bob"]
+        assert next(stream).name == "Chloe"
+        with pytest.raises(ParseError, match=r"^Row 5 \(Dan\): sessions_par_semaine must be 1-7"):
+            next(stream)
+    
+    def test_linked_groups_checked_at_end(self, tmp_path):
+        """Test a non-reciprocal link is reported once every row was read."""
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text(self.HEADER + (
+            "Alice,1,08:00,09:00,,,,,,,,,,,Bob,\n"
+            "Bob,1,08:00,09:00,,,,,,,,,,,,\n"
+        ))
+        
+        stream = iter_students(str(csv_file), chunk_size=1)
+        assert [next(stream).name, next(stream).name] == ["Alice", "Bob"]
+        with pytest.raises(ParseError, match="not reciprocal"):
+            next(stream)
+    
+    def test_accepts_buffer(self):
+        """Test a file-like object can be streamed."""
+        buffer = io.StringIO(self.HEADER + "Alice,1,08:00,09:00,,,,,,,,,,,,\n")
+        
+        assert [s.name for s in iter_students(buffer)] == ["Alice"]
+
+
+class TestCsvEngines:
+    """Tests for the stdlib csv engine against the pandas engine."""
+    
+    HEADER = TestVectorizedParseCSV.HEADER
+    
+    ROSTER = HEADER + (
+        "Alice,2,08:00,13:00,,,,,,,,,,,Bob,  note \n"
+        "Bob,2.0,08:00,10:00,,,,,,,,,,,Alice,N/A\n"
+        "\n"
+        "\"Chloe, jr\",1,,,14:00,19:30,,,,,,,,,,\n"
+        "Dan,1, 9:00,10:00\n"
+    )
+    
+    def _fields(self, students):
+        return [
+            (s.name, s.sessions_per_week, s.available_slots, s.linked_group, s.notes)
+            for s in students
+        ]
+    
+    def test_engines_agree(self, tmp_path):
+        """Test both engines parse quoting, blank lines, short rows and NA cells alike."""
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text(self.ROSTER)
+        
+        students = parse_csv(str(csv_file), engine="csv")
+        
+        assert self._fields(students) == self._fields(parse_csv(str(csv_file), engine="pandas"))
+        assert [s.name for s in students] == ["Alice", "Bob", "Chloe, jr", "Dan"]
+        assert students[1].notes == ""
+    
+    def test_row_numbers_skip_blank_lines(self, tmp_path):
+        """Test error row numbers match pandas when blank lines are skipped."""
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text(self.HEADER + "\nAlice,1,08:00,09:00,,,,,,,,,,,,\n\nBob,0,08:00,09:00,,,,,,,,,,,,\n")
+        
+        for engine in ("csv", "pandas"):
+            with pytest.raises(ParseError, match=r"^Row 3 \(Bob\): sessions_par_semaine must be 1-7"):
+                parse_csv(str(csv_file), engine=engine)
+    
+    def test_bytes_buffer_with_bom(self):
+        """Test a binary buffer with a UTF-8 BOM is decoded and left open."""
+        buffer = io.BytesIO(("\ufeff" + self.HEADER + "Élodie,1,08:00,09:00,,,,,,,,,,,,\n").encode("utf-8"))
+        
+        assert [s.name for s in iter_students(buffer)] == ["Élodie"]
+        assert not buffer.closed
+    
+    def test_malformed_files(self, tmp_path):
+        """Test extra fields and empty files raise ParseError."""
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text(self.HEADER + "Alice,1,08:00,09:00,,,,,,,,,,,,,extra\n")
+        with pytest.raises(ParseError, match=r"Failed to parse CSV: Expected 16 fields in line 2, saw 17"):
+            parse_csv(str(csv_file))
+        
+        csv_file.write_text("")
+        with pytest.raises(ParseError, match="No columns to parse"):
+            parse_csv(str(csv_file))
+    
+    def test_unknown_engine(self, tmp_path):
+        """Test an unknown engine name is rejected."""
+        with pytest.raises(ValueError, match="Unknown CSV engine 'polars'"):
+            parse_csv(str(tmp_path / "test.csv"), engine="polars")
+    
+    def test_recurring_slots_engines_agree(self, tmp_path):
+        """Test recurring slots parse identically with both engines."""
+        roster_file = tmp_path / "roster.csv"
+        roster_file.write_text(self.ROSTER)
+        recurring_file = tmp_path / "recurring.csv"
+        recurring_file.write_text("nom,jour,heure_debut,heure_fin\nAlice,lundi,08:00,09:00\nBob,lundi,08:00,09:00\n")
+        students = parse_csv(str(roster_file))
+        
+        by_engine = [
+            [(c.slot, c.students, c.status) for c in parse_recurring_slots_csv(str(recurring_file), students, engine)]
+            for engine in ("csv", "pandas")
+        ]
+        
+        assert by_engine[0] == by_engine[1]
+        assert by_engine[0][0][2] == SlotStatus.LOCKED
+    
+    def test_scheduler_import_does_not_load_pandas(self):
+        """Test importing core.scheduler loads neither pandas nor OR-Tools."""
+        code = "import sys, core.scheduler; print('pandas' in sys.modules, 'ortools' in sys.modules)"
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).parent.parent,
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout
+        
+        assert output.split() == ["False", "False"]
+
+
+class TestMultiRangeAvailability:
+    """Tests for several availability ranges on one day ("08:00;17:00" / "10:00;19:00")."""
+    
+    HEADER = TestVectorizedParseCSV.HEADER
+    
+    @pytest.mark.parametrize("engine", ["csv", "pandas"])
+    def test_two_ranges_on_one_day(self, tmp_path, engine):
+        """Test paired start/end lists give one range each, with a gap between them."""
+        csv_file = tmp_path / "roster.csv"
+        csv_file.write_text(self.HEADER + (
+            "Alice,2,08:00;17:00,10:00;19:00,,,,,,,,,,,,\n"
+            "Bob,1,08:00,10:00,09:00,10:00,,,,,,,,,,\n"
+        ))
+        
+        alice, bob = parse_csv(str(csv_file), engine=engine)
+        
+        assert alice.availability_ranges == (TimeRange.of("lundi", 480, 600), TimeRange.of("lundi", 1020, 1140))
+        assert len(alice.available_slots) == 4
+        assert not alice.covers(Slot("lundi", time(12, 0), time(13, 0)))
+        assert bob.ranges_on("mardi") == (TimeRange.of("mardi", 540, 600),)
+    
+    def test_vectorized_matches_row_path(self, tmp_path):
+        """Test rows with several ranges give the same students on both paths."""
+        csv_file = tmp_path / "roster.csv"
+        csv_file.write_text(self.HEADER + (
+            "Alice,2,08:00;17:00,10:00;19:00,,,,,,,,,,,,\n"
+            "Bob,1,17:00;08:00,19:00;10:00,,,,,,,,,,,,\n"
+        ))
+        
+        students = parse_csv(str(csv_file))
+        
+        reference = [_parse_student_row(idx, row) for idx, row in pd.read_csv(csv_file).iterrows()]
+        assert students == reference
+        assert students[1].availability_ranges == students[0].availability_ranges
+    
+    @pytest.mark.parametrize("engine", ["csv", "pandas"])
+    def test_mismatched_counts(self, tmp_path, engine):
+        """Test a different number of start and end times is rejected."""
+        csv_file = tmp_path / "roster.csv"
+        csv_file.write_text(self.HEADER + "Alice,1,08:00;17:00,10:00,,,,,,,,,,,,\n")
+        
+        with pytest.raises(ParseError, match=r"Row 2 \(Alice\): lundi has 2 start time\(s\) but 1 end time\(s\)"):
+            parse_csv(str(csv_file), engine=engine)
+    
+    def test_overlapping_ranges(self, tmp_path):
+        """Test overlapping ranges on one day are rejected."""
+        csv_file = tmp_path / "roster.csv"
+        csv_file.write_text(self.HEADER + "Alice,1,08:00;09:00,10:00;11:00,,,,,,,,,,,,\n")
+        
+        with pytest.raises(ParseError, match="lundi ranges overlap"):
+            parse_csv(str(csv_file))
+    
+    def test_recurring_slot_in_gap(self, tmp_path):
+        """Test a recurring slot between two ranges is rejected, listing the ranges."""
+        students = [Student.from_ranges(
+            "Alice", 2, [TimeRange.of("lundi", 480, 600), TimeRange.of("lundi", 1020, 1140)]
+        )]
+        csv_file = tmp_path / "recurring.csv"
+        csv_file.write_text("nom,jour,heure_debut,heure_fin\nAlice,lundi,12:00,13:00\n")
+        
+        with pytest.raises(ParseError, match="lundi 08:00-10:00, lundi 17:00-19:00"):
+            parse_recurring_slots_csv(str(csv_file), students)
+    
+    def test_recurring_slot_within_range(self, tmp_path):
+        """Test a recurring slot inside a range is accepted even off the 1h expansion."""
+        students = [Student.from_ranges("Alice", 2, [TimeRange.of("lundi", 480, 600)])]
+        csv_file = tmp_path / "recurring.csv"
+        csv_file.write_text("nom,jour,heure_debut,heure_fin\nAlice,lundi,08:30,09:30\n")
+        
+        classes = parse_recurring_slots_csv(str(csv_file), students)
+        
+        assert classes[0].slot == Slot("lundi", time(8, 30), time(9, 30))
+
+
+class TestValidateRoster:
+    """Tests for the one-pass validation report."""
+    
+    HEADER = TestVectorizedParseCSV.HEADER
+    
+    MESSY = HEADER + (
+        "Alice,1,08:00,09:00,,,,,,,,,,,Bob,\n"
+        ",0,08:15,09:00,10:00,,,,,,,,,,,\n"
+        "Bob,9,08:00,09:00,,,,,,,,,,,Alice,\n"
+        "Chloe,1,08:00,09:00,,,,,,,,,,,Zed,\n"
+        "Eve,1,10:00,11:00,,,,,,,,,,,Fay,\n"
+        "Fay,1,12:00,13:00,,,,,,,,,,,Eve,\n"
+        "Gus,2,08:00;17:00,10:00,09:00,08:00,,,,,,,,,,\n"
+    )
+    
+    def test_valid_file(self, tmp_path):
+        """Test a valid file gives an empty report with the parse_csv students."""
+        csv_file = tmp_path / "roster.csv"
+        csv_file.write_text(self.HEADER + (
+            "Alice,1,08:00,09:00,,,,,,,,,,,Bob,\n"
+            "Bob,2,08:00,12:00,,,,,,,,,,,Alice,\n"
+        ))
+        
+        report = validate_roster(str(csv_file))
+        
+        assert report.is_valid
+        assert report.row_count == 2
+        assert report.students == parse_csv(str(csv_file))
+    
+    @pytest.mark.parametrize("engine", ["csv", "pandas"])
+    def test_collects_every_error(self, tmp_path, engine):
+        """Test row errors (several per row) and linked group errors come in one report."""
+        csv_file = tmp_path / "roster.csv"
+        csv_file.write_text(self.MESSY)
+        
+        report = validate_roster(str(csv_file), engine=engine)
+        
+        assert [(issue.row, issue.code) for issue in report.issues] == [
+            (3, RosterErrorCode.NAME_REQUIRED),
+            (3, RosterErrorCode.INVALID_SESSIONS),
+            (3, RosterErrorCode.INVALID_TIME),
+            (3, RosterErrorCode.INCOMPLETE_RANGE),
+            (4, RosterErrorCode.INVALID_SESSIONS),
+            (8, RosterErrorCode.RANGE_COUNT_MISMATCH),
+            (8, RosterErrorCode.INVALID_RANGE),
+            (5, RosterErrorCode.LINKED_STUDENT_MISSING),
+            (6, RosterErrorCode.LINKED_NO_OVERLAP),
+        ]
+        assert report.issues[0].student is None
+        assert [s.name for s in report.students] == ["Alice", "Chloe", "Eve", "Fay"]
+    
+    def test_messages_match_parse_csv(self, tmp_path):
+        """Test a row's first issue carries the message parse_csv raises for it."""
+        csv_file = tmp_path / "roster.csv"
+        csv_file.write_text(self.HEADER + "Alice,1,08:00,09:00,,,,,,,,,,,,\n,0,08:15,09:00,,,,,,,,,,,,\n")
+        
+        with pytest.raises(ParseError) as raised:
+            parse_csv(str(csv_file))
+        report = validate_roster(str(csv_file))
+        
+        assert report.issues[0].message == str(raised.value)
+        assert report.issues[0].code == raised.value.code
+        assert report.issues[1].message.startswith("Row 3: sessions_par_semaine must be 1-7")
+    
+    def test_link_to_rejected_row_not_reported(self, tmp_path):
+        """Test a link to a row with its own errors is not reported as missing."""
+        csv_file = tmp_path / "roster.csv"
+        csv_file.write_text(self.HEADER + (
+            "Alice,1,08:00,09:00,,,,,,,,,,,Bob,\n"
+            "Bob,9,08:00,09:00,,,,,,,,,,,Alice,\n"
+        ))
+        
+        report = validate_roster(str(csv_file))
+        
+        assert [issue.code for issue in report.issues] == [RosterErrorCode.INVALID_SESSIONS]
+    
+    def test_missing_columns(self, tmp_path):
+        """Test each missing column is its own issue."""
+        csv_file = tmp_path / "roster.csv"
+        csv_file.write_text(self.HEADER.replace(",groupe_lie,notes", "") + "Alice,1,08:00,09:00,,,,,,,,,,\n")
+        
+        report = validate_roster(str(csv_file))
+        
+        assert [(issue.code, issue.column) for issue in report.issues] == [
+            (RosterErrorCode.MISSING_COLUMN, "groupe_lie"),
+            (RosterErrorCode.MISSING_COLUMN, "notes"),
+        ]
+    
+    def test_file_not_found(self, tmp_path):
+        """Test file errors are reported, not raised."""
+        report = validate_roster(str(tmp_path / "missing.csv"))
+        
+        assert report.to_dict()["issues"][0]["code"] == "file_not_found"
+        assert not report.to_dict()["valid"]
+    
+    @pytest.mark.parametrize("engine", ["csv", "pandas"])
+    def test_non_utf8_file(self, tmp_path, engine):
+        """Test a Latin-1 export is reported as a malformed file, not raised."""
+        csv_file = tmp_path / "roster.csv"
+        csv_file.write_bytes((self.HEADER + "Hélène,1,08:00,09:00,,,,,,,,,,,,\n").encode("latin-1"))
+        
+        report = validate_roster(str(csv_file), engine=engine)
+        
+        assert [issue.code for issue in report.issues] == [RosterErrorCode.MALFORMED_CSV]
+        assert "not UTF-8 encoded" in report.issues[0].message
+        with pytest.raises(ParseError, match="not UTF-8 encoded"):
+            parse_csv(str(csv_file), engine=engine)
+    
+    def test_csv_module_error(self, tmp_path):
+        """Test csv module errors (here a field over the size limit) are reported as a malformed file."""
+        csv_file = tmp_path / "roster.csv"
+        csv_file.write_text(self.HEADER + "Alice,1,08:00,09:00,,,,,,,,,,,," + "x" * 200_000 + "\n")
+        
+        report = validate_roster(str(csv_file), engine="csv")
+        
+        assert [issue.code for issue in report.issues] == [RosterErrorCode.MALFORMED_CSV]
+    
+    def test_parse_error_code_survives_pickling(self):
+        """Test ParseError keeps its code across processes."""
+        error = pickle.loads(pickle.dumps(ParseError("boom", RosterErrorCode.INVALID_TIME)))
+        
+        assert (str(error), error.code) == ("boom", RosterErrorCode.INVALID_TIME)
+
+
 class TestValidateLinkedGroups:
     """Tests for validate_linked_groups function."""
     
@@ -262,6 +683,136 @@ class TestValidateLinkedGroups:
         
         with pytest.raises(ParseError, match="doesn't exist"):
             validate_linked_groups([student1])
+    
+    def test_group_of_three(self):
+        """Test a group lists its other members ';'-separated and is returned once."""
+        lundi = [TimeRange.of("lundi", 480, 600)]
+        students = [
+            Student.from_ranges("Ana", 1, lundi, linked_group="Ben;Cal"),
+            Student.from_ranges("Ben", 1, lundi, linked_group="Cal; Ana"),
+            Student.from_ranges("Cal", 2, lundi + [TimeRange.of("mardi", 480, 540)], linked_group="Ana;Ben"),
+        ]
+        
+        groups = validate_linked_groups(students)
+        
+        assert groups == [("Ana", "Ben", "Cal")]
+        assert students[1].linked_names == ("Cal", "Ana")
+    
+    def test_group_member_missing_a_link(self):
+        """Test every member of a group must link to all the others."""
+        lundi = [TimeRange.of("lundi", 480, 600)]
+        students = [
+            Student.from_ranges("Ana", 1, lundi, linked_group="Ben;Cal"),
+            Student.from_ranges("Ben", 1, lundi, linked_group="Ana;Cal"),
+            Student.from_ranges("Cal", 1, lundi, linked_group="Ana"),
+        ]
+        
+        with pytest.raises(ParseError, match="but Cal links to 'Ana' \\(not reciprocal\\)") as excinfo:
+            validate_linked_groups(students)
+        assert excinfo.value.code == RosterErrorCode.LINKED_NOT_RECIPROCAL
+    
+    def test_group_needs_common_slot(self):
+        """Test a group needs a slot common to all its members, not just pairwise."""
+        students = [
+            Student.from_ranges("Ana", 1, [TimeRange.of("lundi", 480, 600)], linked_group="Ben;Cal"),
+            Student.from_ranges("Ben", 1, [TimeRange.of("lundi", 540, 660)], linked_group="Ana;Cal"),
+            Student.from_ranges("Cal", 1, [TimeRange.of("lundi", 600, 720)], linked_group="Ana;Ben"),
+        ]
+        
+        with pytest.raises(ParseError, match="Ana, Ben and Cal have NO overlapping availability"):
+            validate_linked_groups(students)
+    
+    def test_group_larger_than_a_class(self):
+        """Test a group of more than 3 students is rejected."""
+        lundi = [TimeRange.of("lundi", 480, 600)]
+        names = ["Ana", "Ben", "Cal", "Dan"]
+        students = [
+            Student.from_ranges(name, 1, lundi, linked_group=";".join(n for n in names if n != name))
+            for name in names
+        ]
+        
+        with pytest.raises(ParseError, match="Maximum 3 students per class") as excinfo:
+            validate_linked_groups(students)
+        assert excinfo.value.code == RosterErrorCode.LINKED_GROUP_TOO_LARGE
+
+
+class TestDiffRosters:
+    """Tests for week-over-week roster diffs."""
+    
+    MORNING = TimeRange.of("lundi", 480, 600)
+    EVENING = TimeRange.of("mardi", 1020, 1140)
+    
+    def _roster(self):
+        return [
+            Student.from_ranges("Alice", 1, [self.MORNING], linked_group="Bob"),
+            Student.from_ranges("Bob", 1, [self.MORNING], linked_group="Alice"),
+            Student.from_ranges("Chloe", 2, [self.MORNING, self.EVENING]),
+            Student.from_ranges("David", 1, [self.EVENING]),
+            Student.from_ranges("Eve", 1, [self.EVENING]),
+        ]
+    
+    def test_identical_rosters(self):
+        """Test a roster compared with itself has no changes."""
+        diff = diff_rosters(self._roster(), self._roster())
+        
+        assert diff.is_empty
+        assert diff.unchanged_count == 5
+        assert diff.affected == []
+        assert not diff.changed_slots
+    
+    def test_classifies_changes(self):
+        """Test added, removed, availability, sessions and link changes."""
+        old = self._roster()
+        new = [
+            Student.from_ranges("Alice", 1, [self.MORNING, self.EVENING], linked_group="Bob"),
+            Student.from_ranges("Bob", 1, [self.MORNING], linked_group="Alice"),
+            Student.from_ranges("Chloe", 1, [self.MORNING, self.EVENING]),
+            Student.from_ranges("David", 1, [self.EVENING], linked_group="Eve"),
+            Student.from_ranges("Fay", 1, [self.MORNING]),
+        ]
+        
+        diff = diff_rosters(old, new)
+        
+        assert diff.added == ["Fay"]
+        assert diff.removed == ["Eve"]
+        assert diff.availability_changed == ["Alice"]
+        assert diff.sessions_changed == ["Chloe"]
+        assert diff.link_changed == ["David"]
+        assert diff.unchanged_count == 1
+        assert diff.affected == ["Alice", "Bob", "Chloe", "David", "Fay"]
+        assert diff.changed_slots.mask == self.MORNING.mask | self.EVENING.mask
+    
+    def test_notes_only_change_is_ignored(self):
+        """Test notes never make a student changed."""
+        old = [Student.from_ranges("Alice", 1, [self.MORNING], notes="a")]
+        new = [Student.from_ranges("Alice", 1, [self.MORNING], notes="b")]
+        
+        assert diff_rosters(old, new).is_empty
+    
+    def test_stale_classes(self):
+        """Test classes with affected students or touched slots are stale."""
+        old = self._roster()
+        new = old[:4] + [Student.from_ranges("Eve", 2, [self.EVENING])]
+        morning_class = ScheduledClass(slot=self.MORNING.slots()[0], students=["Alice", "Bob"], status=SlotStatus.PROPOSED)
+        evening_class = ScheduledClass(slot=self.EVENING.slots()[0], students=["David", "Eve"], status=SlotStatus.PROPOSED)
+        
+        diff = diff_rosters(old, new)
+        
+        assert diff.sessions_changed == ["Eve"]
+        assert diff.stale_classes([morning_class, evening_class]) == [evening_class]
+    
+    def test_two_thousand_students_is_fast(self):
+        """Test a 2,000-student diff takes a few milliseconds."""
+        old = [Student.from_ranges(f"E{i}", 1 + i % 3, [self.MORNING, self.EVENING]) for i in range(2000)]
+        new = list(old)
+        new[7] = Student.from_ranges("E7", 2, [self.MORNING])
+        
+        start = clock.perf_counter()
+        diff = diff_rosters(old, new)
+        elapsed = clock.perf_counter() - start
+        
+        assert diff.availability_changed == ["E7"]
+        assert elapsed < 0.05
 
 
 class TestParseRecurringSlots:
@@ -436,3 +987,80 @@ Vincent,mardi,17:00,18:00
         assert len(warnings) == 1
         suggestions_text = " ".join(warnings[0]["suggestions"])
         assert "Aucun autre étudiant disponible" in suggestions_text
+
+
+class TestValidateRecurringSlots:
+    """Tests for the one-pass recurring slots validation report."""
+    
+    STUDENTS = [
+        Student(name=name, sessions_per_week=1, available_slots=[Slot("mardi", time(17, 0), time(18, 0))])
+        for name in ("Ana", "Ben", "Cal", "Dan")
+    ]
+    
+    MESSY = (
+        "nom,jour,heure_debut,heure_fin\n"
+        "Ana,mardi,17:00,18:00\n"
+        "Zed,mardi,17:00,18:00\n"
+        "Ben,dimanche,17:00,18:00\n"
+        "Ben,mardi,17:15,18:15\n"
+        "Cal,lundi,08:00,09:00\n"
+        "Dan,mardi,17:00,18:00\n"
+    )
+    
+    def test_collects_every_error(self, tmp_path):
+        """Test every row error comes in one report, with codes and line numbers."""
+        csv_file = tmp_path / "recurring.csv"
+        csv_file.write_text(self.MESSY)
+        
+        report = validate_recurring_slots(str(csv_file), self.STUDENTS)
+        
+        assert [(issue.row, issue.student, issue.code) for issue in report.issues] == [
+            (3, "Zed", RosterErrorCode.STUDENT_NOT_FOUND),
+            (4, "Ben", RosterErrorCode.INVALID_DAY),
+            (5, "Ben", RosterErrorCode.INVALID_TIME),
+            (6, "Cal", RosterErrorCode.SLOT_NOT_AVAILABLE),
+        ]
+        assert report.row_count == 6
+        assert [c.students for c in report.classes] == [("Ana", "Dan")]
+    
+    def test_first_issue_is_what_parse_raises(self, tmp_path):
+        """Test parse_recurring_slots_csv raises the first reported error, with its code."""
+        csv_file = tmp_path / "recurring.csv"
+        csv_file.write_text(self.MESSY)
+        
+        report = validate_recurring_slots(str(csv_file), self.STUDENTS)
+        with pytest.raises(ParseError) as excinfo:
+            parse_recurring_slots_csv(str(csv_file), self.STUDENTS)
+        
+        assert str(excinfo.value) == report.issues[0].message
+        assert excinfo.value.code == RosterErrorCode.STUDENT_NOT_FOUND
+    
+    def test_over_capacity(self, tmp_path):
+        """Test a slot with 4 students is reported and left out of the classes."""
+        csv_file = tmp_path / "recurring.csv"
+        csv_file.write_text("nom,jour,heure_debut,heure_fin\n" + "".join(
+            f"{s.name},mardi,17:00,18:00\n" for s in self.STUDENTS
+        ))
+        
+        report = validate_recurring_slots(str(csv_file), self.STUDENTS)
+        
+        assert [(issue.row, issue.code) for issue in report.issues] == [(None, RosterErrorCode.CLASS_OVER_CAPACITY)]
+        assert report.classes == []
+    
+    def test_rejected_names_are_skipped(self, tmp_path):
+        """Test rows of students rejected in the availability CSV are not reported as not found."""
+        csv_file = tmp_path / "recurring.csv"
+        csv_file.write_text(self.MESSY)
+        
+        report = validate_recurring_slots(str(csv_file), self.STUDENTS, rejected_names={"Zed"})
+        
+        assert RosterErrorCode.STUDENT_NOT_FOUND not in report.issues_by_code()
+    
+    def test_missing_columns(self):
+        """Test each missing column is one issue."""
+        report = validate_recurring_slots(io.StringIO("nom,jour\nAna,mardi\n"), self.STUDENTS)
+        
+        assert [(issue.code, issue.column) for issue in report.issues] == [
+            (RosterErrorCode.MISSING_COLUMN, "heure_debut"),
+            (RosterErrorCode.MISSING_COLUMN, "heure_fin"),
+        ]
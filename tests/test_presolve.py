@@ -0,0 +1,131 @@
+"""Tests for presolve pruning."""
+
+import numpy as np
+
+from core.models import Student, TimeRange, ScheduledClass, SlotStatus
+from core.presolve import (
+    presolve, _max_disjoint_slots, SLOT_OVERLAPS_SKELETON, SLOT_TOO_FEW_STUDENTS, STUDENT_TOO_FEW_SLOTS
+)
+from core.problem import ProblemMatrix
+
+
+def _column(problem, day, start_minutes):
+    return next(
+        j for j, slot in enumerate(problem.slots)
+        if slot.day == day and slot.start_minutes == start_minutes
+    )
+
+
+class TestPresolve:
+    """Tests for presolve and PresolveResult."""
+    
+    def test_nothing_to_prune(self):
+        """Test a problem where every slot and student can be used is left as is."""
+        ranges = [TimeRange.of("lundi", 480, 600)]
+        students = [Student.from_ranges(name, 1, ranges) for name in ("Ana", "Ben", "Cal")]
+        problem = ProblemMatrix.build(students, skeleton={}, coach_reserved_slots=[])
+        
+        result = presolve(problem)
+        
+        assert result.rounds == 0
+        assert result.removed_slots == {} and result.removed_students == {}
+        assert result.pairs_after == result.pairs_before == 6
+    
+    def test_slot_with_too_few_students(self):
+        """Test a slot only one student can attend is no longer a candidate."""
+        lundi = TimeRange.of("lundi", 480, 600)
+        students = [
+            Student.from_ranges("Ana", 1, [lundi, TimeRange.of("mardi", 480, 540)]),
+            Student.from_ranges("Ben", 1, [lundi]),
+            Student.from_ranges("Cal", 1, [lundi]),
+        ]
+        problem = ProblemMatrix.build(students, skeleton={}, coach_reserved_slots=[])
+        mardi = _column(problem, "mardi", 480)
+        
+        result = presolve(problem)
+        
+        assert result.removed_slots == {mardi: SLOT_TOO_FEW_STUDENTS}
+        assert result.removed_students == {}
+        assert not result.problem.is_candidate[mardi]
+        assert problem.is_candidate[mardi]  # Input problem untouched
+    
+    def test_student_with_too_few_slots(self):
+        """Test a student with fewer usable slots than sessions is pruned."""
+        students = [
+            Student.from_ranges("Ana", 2, [TimeRange.of("lundi", 480, 540)]),
+            Student.from_ranges("Ben", 1, [TimeRange.of("lundi", 480, 600)]),
+            Student.from_ranges("Cal", 1, [TimeRange.of("lundi", 480, 600)]),
+        ]
+        problem = ProblemMatrix.build(students, skeleton={}, coach_reserved_slots=[])
+        
+        result = presolve(problem)
+        
+        ana = problem.student_index["Ana"]
+        assert result.removed_students == {ana: STUDENT_TOO_FEW_SLOTS}
+        assert result.reachable_slots[ana] == 1
+        assert result.problem.remaining_sessions[ana] == 0
+        assert problem.remaining_sessions[ana] == 2
+    
+    def test_removals_cascade(self):
+        """Test removing a student can starve a slot, which can starve another student."""
+        students = [
+            Student.from_ranges("Dan", 2, [TimeRange.of("mardi", 480, 540)]),
+            Student.from_ranges("Eve", 1, [TimeRange.of("mardi", 480, 540)]),
+        ]
+        problem = ProblemMatrix.build(students, skeleton={}, coach_reserved_slots=[])
+        
+        result = presolve(problem)
+        
+        assert result.rounds == 3
+        assert set(result.removed_students) == {0, 1}
+        assert set(result.removed_slots.values()) == {SLOT_TOO_FEW_STUDENTS}
+        assert not result.problem.is_candidate.any()
+        assert result.pairs_after == 0
+    
+    def test_overlapping_slots_count_once(self):
+        """Test reachable slots are the most pairwise non-overlapping ones."""
+        students = [
+            Student.from_ranges("Ana", 1, [TimeRange.of("lundi", 480, 660)]),
+            Student.from_ranges("Ben", 1, [TimeRange.of("lundi", 510, 630)]),
+        ]
+        problem = ProblemMatrix.build(students, skeleton={}, coach_reserved_slots=[])
+        # 08:00, 09:00, 10:00 and 08:30, 09:30: all five for one student
+        reach = np.zeros(problem.availability.shape, dtype=bool)
+        reach[0] = True
+        
+        assert problem.num_slots == 5
+        assert _max_disjoint_slots(problem, reach).tolist() == [3, 0]
+    
+    def test_skeleton_overlaps_counted(self):
+        """Test slots excluded for overlapping the skeleton are reported with their reason."""
+        ranges = [TimeRange.of("lundi", 480, 660)]
+        students = [Student.from_ranges(name, 2, ranges) for name in ("Ana", "Ben", "Cal")]
+        problem = ProblemMatrix.build(students, skeleton={}, coach_reserved_slots=[])
+        skeleton_slot = problem.slots[_column(problem, "lundi", 480)]
+        skeleton = {skeleton_slot: ScheduledClass(slot=skeleton_slot, students=["Ana", "Ben"],
+                                                  status=SlotStatus.LOCKED)}
+        problem = ProblemMatrix.build(students, skeleton=skeleton, coach_reserved_slots=[])
+        
+        result = presolve(problem)
+        
+        excluded = [j for j, reason in result.removed_slots.items() if reason == SLOT_OVERLAPS_SKELETON]
+        assert sorted(excluded) == sorted(j for j in range(problem.num_slots) if problem.overlaps_skeleton[j])
+        assert result.stats()["removed_slots"][SLOT_OVERLAPS_SKELETON] == len(excluded)
+    
+    def test_stats(self):
+        """Test the metadata summary counts removals by reason."""
+        students = [
+            Student.from_ranges("Ana", 2, [TimeRange.of("lundi", 480, 540)]),
+            Student.from_ranges("Ben", 1, [TimeRange.of("lundi", 480, 600)]),
+            Student.from_ranges("Cal", 1, [TimeRange.of("lundi", 480, 600)]),
+        ]
+        problem = ProblemMatrix.build(students, skeleton={}, coach_reserved_slots=[])
+        
+        stats = presolve(problem).stats()
+        
+        assert stats["rounds"] == 1
+        assert stats["students_to_place"] == 2
+        assert stats["candidate_slots"] == 2
+        assert stats["removed_students"] == {STUDENT_TOO_FEW_SLOTS: 1}
+        assert stats["removed_slots"] == {}
+        assert stats["pairs_before"] == 5 and stats["pairs_after"] == 4
@@ -0,0 +1,131 @@
+"""Tests for the shared problem matrix."""
+
+from datetime import time
+from itertools import combinations
+
+from core.problem import ProblemMatrix
+from core.scheduler import generate_optimization_suggestions
+from core.models import Student, Slot, ScheduledClass, SlotStatus
+
+
+def _students():
+    return [
+        Student(
+            name="Alice",
+            sessions_per_week=2,
+            available_slots=[
+                Slot("lundi", time(8, 0), time(9, 0)),
+                Slot("lundi", time(9, 0), time(10, 0)),
+            ],
+            linked_group="Bob"
+        ),
+        Student(
+            name="Bob",
+            sessions_per_week=1,
+            available_slots=[Slot("lundi", time(9, 0), time(10, 0))],
+            linked_group="Alice"
+        ),
+        Student(
+            name="Charlie",
+            sessions_per_week=1,
+            available_slots=[Slot("mardi", time(8, 30), time(9, 30))]
+        ),
+    ]
+
+
+class TestProblemMatrix:
+    """Tests for ProblemMatrix construction and queries."""
+    
+    def test_availability_matrix(self):
+        """Test rows are students and columns every available slot, sorted by ID."""
+        problem = ProblemMatrix.build(_students(), skeleton={}, coach_reserved_slots=[])
+        
+        assert [s.start_time for s in problem.slots] == [time(8, 0), time(9, 0), time(8, 30)]
+        assert problem.availability.tolist() == [
+            [True, True, False],
+            [False, True, False],
+            [False, False, True],
+        ]
+        assert problem.linked_pairs.tolist() == [[0, 1]]
+    
+    def test_linked_group_of_three(self):
+        """Test a ';'-separated group gives one sorted row tuple and every pair within it."""
+        lundi = [Slot("lundi", time(8, 0), time(9, 0))]
+        students = [
+            Student("Ana", 1, lundi, linked_group="Cal;Ben"),
+            Student("Ben", 1, lundi, linked_group="Ana;Cal"),
+            Student("Dan", 1, lundi),
+            Student("Cal", 1, lundi, linked_group="Ana;Ben"),
+        ]
+        
+        problem = ProblemMatrix.build(students, skeleton={}, coach_reserved_slots=[])
+        
+        assert problem.linked_groups == [(0, 1, 3)]
+        assert problem.linked_pairs.tolist() == [[0, 1], [0, 3], [1, 3]]
+    
+    def test_skeleton_and_reserved_slots(self):
+        """Test remaining sessions and candidate/overlap flags."""
+        students = _students()
+        lundi_8h = Slot("lundi", time(8, 0), time(9, 0), is_recurring=True)
+        skeleton = {
+            lundi_8h: ScheduledClass(slot=lundi_8h, students=["Alice"], status=SlotStatus.NEEDS_VALIDATION)
+        }
+        reserved = [Slot("mardi", time(8, 30), time(9, 30))]
+        
+        problem = ProblemMatrix.build(students, skeleton, reserved)
+        
+        assert problem.remaining_sessions.tolist() == [1, 1, 1]
+        assert problem.is_candidate.tolist() == [False, True, False]
+        assert problem.overlaps_skeleton.tolist() == [True, False, False]
+    
+    def test_partial_overlap_removes_candidate(self):
+        """Test a reserved 08:00-09:00 also removes the 08:30-09:30 candidate."""
+        reserved = [Slot("mardi", time(8, 0), time(9, 0))]
+        
+        problem = ProblemMatrix.build(_students(), skeleton={}, coach_reserved_slots=reserved)
+        
+        assert problem.is_candidate.tolist() == [True, True, False]
+    
+    def test_candidate_pairs_vectorized(self):
+        """Test candidate pairs skip non-candidate slots and placed students."""
+        students = _students()
+        reserved = [Slot("lundi", time(8, 0), time(9, 0))]
+        
+        problem = ProblemMatrix.build(students, skeleton={}, coach_reserved_slots=reserved)
+        rows, columns = problem.candidate_pairs()
+        
+        assert list(zip(rows.tolist(), columns.tolist())) == [(0, 1), (1, 1), (2, 2)]
+    
+    def test_suggestions_read_slot_column(self):
+        """Test optimization suggestions use the slot's availability column."""
+        students = _students()
+        problem = ProblemMatrix.build(students, skeleton={}, coach_reserved_slots=[])
+        slot = Slot("lundi", time(9, 0), time(10, 0))
+        
+        assert problem.available_student_indices(slot).tolist() == [0, 1]
+        assert generate_optimization_suggestions(slot, "Alice", students, problem) == \
+            generate_optimization_suggestions(slot, "Alice", students)
+        assert problem.available_student_indices(Slot("samedi", time(8, 0), time(9, 0))).size == 0
+    
+    def test_overlap_cliques(self):
+        """Test cliques only group overlapping slots and cover every overlapping pair."""
+        slots = [
+            Slot("lundi", time(8, 0), time(9, 0)),
+            Slot("lundi", time(8, 30), time(9, 30)),
+            Slot("lundi", time(9, 0), time(10, 0)),
+            Slot("lundi", time(9, 0), time(11, 0)),  # 2h, off the 1h run
+            Slot("lundi", time(11, 0), time(12, 0)),
+            Slot("mardi", time(8, 30), time(9, 30)),
+        ]
+        students = [Student(name="Alice", sessions_per_week=1, available_slots=slots)]
+        problem = ProblemMatrix.build(students, skeleton={}, coach_reserved_slots=[])
+        
+        cliques = [clique.tolist() for clique in problem.overlap_cliques(problem.candidate_slot_indices())]
+        
+        for clique in cliques:
+            assert all(problem.slots[a].overlaps(problem.slots[b]) for a, b in combinations(clique, 2))
+        for a, b in combinations(range(problem.num_slots), 2):
+            if problem.slots[a].overlaps(problem.slots[b]):
+                assert any(a in clique and b in clique for clique in cliques)
+        # 08:30 {8:00, 8:30}, 09:00 {8:30, 9:00, 9:00-11:00}; lone slots give no clique
+        assert len(cliques) == 2
@@ -3,12 +3,15 @@
 import pytest
 from datetime import time
 
+from core import scheduler
 from core.scheduler import (
     validate_skeleton,
     place_recurring_slots,
     get_placed_students_from_skeleton
 )
-from core.models import Student, Slot, ScheduledClass, SlotStatus
+from core.model_builder import constraint_kind
+from core.models import Student, Slot, TimeRange, ScheduledClass, SlotStatus, SchedulingConstraints
+from core.problem import ProblemMatrix
 
 
 class TestSkeletonValidation:
@@ -74,3 +77,128 @@ class TestSkeletonValidation:
         
         assert not validation.is_valid
         assert len(validation.errors) > 0
+    
+    def test_coach_reserved_partial_overlap_detected(self):
+        """Test a half-hour offset coach reserved slot is reported as overlapping."""
+        students = [
+            Student(
+                name="Alice",
+                sessions_per_week=1,
+                available_slots=[Slot("lundi", time(8, 0), time(9, 0))]
+            ),
+            Student(
+                name="Bob",
+                sessions_per_week=1,
+                available_slots=[Slot("lundi", time(8, 0), time(9, 0))]
+            )
+        ]
+        
+        skeleton = [
+            ScheduledClass(
+                slot=Slot("lundi", time(8, 0), time(9, 0)),
+                students=["Alice", "Bob"],
+                status=SlotStatus.LOCKED
+            )
+        ]
+        coach_reserved = [
+            Slot("lundi", time(9, 0), time(10, 0)),  # Back-to-back, no overlap
+            Slot("lundi", time(8, 30), time(9, 30))
+        ]
+        
+        validation = validate_skeleton(skeleton, students, coach_reserved=coach_reserved)
+        
+        assert not validation.is_valid
+        assert len(validation.errors) == 1
+        assert "coach reserved slot lundi 08:30:00-09:30:00" in validation.errors[0]
+    
+    def test_slot_in_gap_between_ranges(self):
+        """Test a skeleton slot between two ranges of the same day is reported."""
+        ranges = [TimeRange.of("lundi", 480, 600), TimeRange.of("lundi", 1020, 1140)]
+        students = [
+            Student.from_ranges("Alice", 1, ranges),
+            Student.from_ranges("Bob", 1, ranges)
+        ]
+        
+        skeleton = [
+            ScheduledClass(
+                slot=Slot("lundi", time(12, 0), time(13, 0)),
+                students=["Alice", "Bob"],
+                status=SlotStatus.LOCKED
+            )
+        ]
+        
+        validation = validate_skeleton(skeleton, students, coach_reserved=[])
+        
+        assert not validation.is_valid
+        assert any("Alice" in error and "not in their availability" in error for error in validation.errors)
+
+
+class TestCpModel:
+    """Tests for the CP-SAT model built by the solver phases."""
+    
+    @pytest.fixture(autouse=True)
+    def cp_model(self):
+        pytest.importorskip("ortools")
+        return scheduler._import_cp_model()
+    
+    def _problem(self):
+        # Ana and Ben are free 08:00-09:00 and 10:00-11:00, Cal and Dan
+        # 08:30-09:30. The 08:00 and 08:30 slots overlap, so the only
+        # schedule is Cal and Dan at 08:30, Ana and Ben at 10:00
+        early = [TimeRange.of("lundi", 480, 540), TimeRange.of("lundi", 600, 660)]
+        late = [TimeRange.of("lundi", 510, 570)]
+        students = [Student.from_ranges(name, 1, early) for name in ("Ana", "Ben")]
+        students += [Student.from_ranges(name, 1, late) for name in ("Cal", "Dan")]
+        return ProblemMatrix.build(students, skeleton={}, coach_reserved_slots=[])
+    
+    def _opened_starts(self, problem, layout, solution):
+        return sorted(
+            problem.slots[j].start_time.strftime("%H:%M")
+            for j, used in zip(layout.slot_columns.tolist(), layout.slot_used.tolist()) if solution[used]
+        )
+    
+    def test_one_occupancy_literal_per_slot(self):
+        """Test overlaps use AddAtMostOne over per-slot literals, not pairwise indicators."""
+        problem = self._problem()
+        
+        model, layout = scheduler._build_cp_model(problem)
+        proto = model.Proto()
+        
+        at_most_one = [
+            set(c.at_most_one.literals) for c in proto.constraints
+            if constraint_kind(c) == "at_most_one"
+        ]
+        used_by_column = dict(zip(layout.slot_columns.tolist(), layout.slot_used.tolist()))
+        cliques = problem.overlap_cliques(problem.candidate_slot_indices())
+        assert len(proto.variables) == layout.num_pairs + layout.slot_used.size
+        assert cliques and len(at_most_one) == len(cliques)
+        assert all({used_by_column[j] for j in clique.tolist()} in at_most_one for clique in cliques)
+    
+    def test_solution_has_no_overlapping_classes(self, cp_model):
+        """Test opened classes never overlap."""
+        problem = self._problem()
+        model, layout = scheduler._build_cp_model(problem, include_soft_constraints=False)
+        solver = cp_model.CpSolver()
+        
+        assert solver.Solve(model) in (cp_model.OPTIMAL, cp_model.FEASIBLE)
+        solution = solver.ResponseProto().solution
+        # Ana and Ben at 08:00 would be feasible without the overlap constraint
+        assert self._opened_starts(problem, layout, solution) == ["08:30", "10:00"]
+    
+    def test_presolve_pruned_student_does_not_block_others(self):
+        """Test a student who cannot fit their sessions is explained while the others are placed."""
+        ranges = [TimeRange.of("lundi", 480, 600)]
+        students = [
+            Student.from_ranges("Ana", 1, ranges),
+            Student.from_ranges("Ben", 1, ranges),
+            Student.from_ranges("Cal", 3, ranges),  # Two slots for three sessions
+        ]
+        
+        result = scheduler.optimize_variations(students, {}, SchedulingConstraints([], []))
+        
+        assert result.metadata["phase"] == "2a_all_constraints"
+        assert result.metadata["presolve"]["removed_students"] == {"too_few_slots": 1}
+        assert [u.student for u in result.unplaced] == ["Cal"]
+        assert result.unplaced[0].reason == "Pas assez de créneaux possibles pour ses séances"
+        assert "Réduire à 2 séance(s) par semaine" in result.unplaced[0].suggestions
+        assert sorted(name for cls in result.schedule for name in cls.students) == ["Ana", "Ben"]
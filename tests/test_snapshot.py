@@ -0,0 +1,120 @@
+"""Tests for .planz roster snapshots."""
+
+import pickle
+from datetime import time
+
+import pytest
+
+from core.models import Student, Slot, TimeRange, ScheduledClass, SlotStatus
+from core.parser import parse_csv, parse_recurring_slots_csv
+from core.snapshot import save_snapshot, load_snapshot, SnapshotError, SNAPSHOT_MAGIC
+
+
+HEADER = "nom,sessions_par_semaine,lundi_debut,lundi_fin,mardi_debut,mardi_fin,mercredi_debut,mercredi_fin,jeudi_debut,jeudi_fin,vendredi_debut,vendredi_fin,samedi_debut,samedi_fin,groupe_lie,notes\n"
+
+
+ROSTER = HEADER + (
+    "Alice,2,08:00;17:00,10:00;19:00,,,,,,,,,,,Bob,\n"
+    "Bob,2,08:00,10:00,,,,,,,,,,,Alice,Toujours avec Alice\n"
+    "Élodie,1,,,17:00,18:30,,,,,,,22:00,23:30,,note\n"
+)
+RECURRING = "nom,jour,heure_debut,heure_fin\nAlice,lundi,08:00,09:00\nBob,lundi,08:00,09:00\n"
+
+
+@pytest.fixture
+def parsed(tmp_path):
+    roster_file = tmp_path / "roster.csv"
+    roster_file.write_text(ROSTER)
+    recurring_file = tmp_path / "recurring.csv"
+    recurring_file.write_text(RECURRING)
+    students = parse_csv(str(roster_file))
+    return students, parse_recurring_slots_csv(str(recurring_file), students)
+
+
+class TestSnapshotRoundTrip:
+    """Tests for save_snapshot / load_snapshot."""
+    
+    def test_round_trips_parse_csv_output(self, tmp_path, parsed):
+        """Test students and skeleton come back equal, ranges and slots included."""
+        students, skeleton = parsed
+        path = tmp_path / "roster.planz"
+        
+        save_snapshot(path, students, skeleton)
+        with load_snapshot(path) as snapshot:
+            loaded = snapshot.students()
+            loaded_skeleton = snapshot.skeleton()
+            
+            assert len(snapshot) == 3
+            assert snapshot.names == ["Alice", "Bob", "Élodie"]
+            assert snapshot.student(2) == students[2]
+            assert snapshot.linked_pairs.tolist() == [[0, 1]]
+            assert snapshot.sessions.tolist() == [2, 2, 1]
+        
+        assert loaded == students
+        assert [s.availability_ranges for s in loaded] == [s.availability_ranges for s in students]
+        assert [s.available_slots for s in loaded] == [s.available_slots for s in students]
+        assert loaded_skeleton == skeleton
+        assert loaded_skeleton[0].slot.is_recurring
+    
+    def test_off_grid_skeleton_slot(self, tmp_path):
+        """Test a skeleton slot outside the slot grid keeps its day and times."""
+        student = Student.from_ranges("Alice", 1, [TimeRange.of("lundi", 480, 600)], notes="")
+        off_grid = Slot("dimanche", time(8, 0), time(9, 0), is_recurring=True)
+        skeleton = [ScheduledClass(slot=off_grid, students=["Alice"], status=SlotStatus.NEEDS_VALIDATION)]
+        path = tmp_path / "roster.planz"
+        
+        save_snapshot(path, [student], skeleton)
+        with load_snapshot(path) as snapshot:
+            assert snapshot.skeleton() == skeleton
+    
+    def test_empty_roster(self, tmp_path):
+        """Test an empty roster round-trips."""
+        path = tmp_path / "empty.planz"
+        
+        save_snapshot(path, [])
+        with load_snapshot(path) as snapshot:
+            assert snapshot.students() == []
+            assert snapshot.skeleton() == []
+    
+    def test_loaded_students_pickle(self, tmp_path, parsed):
+        """Test loaded students hold no reference to the mapping."""
+        students, _ = parsed
+        path = tmp_path / "roster.planz"
+        save_snapshot(path, students)
+        
+        with load_snapshot(path) as snapshot:
+            loaded = snapshot.students()
+        
+        assert pickle.loads(pickle.dumps(loaded)) == students
+
+
+class TestSnapshotValidation:
+    """Tests for rejected files."""
+    
+    def test_bad_magic(self, tmp_path):
+        """Test a file that is not a snapshot is rejected."""
+        path = tmp_path / "roster.planz"
+        path.write_bytes(b"nom,sessions_par_semaine\n" * 10)
+        
+        with pytest.raises(SnapshotError, match="bad magic"):
+            load_snapshot(path)
+    
+    def test_empty_file(self, tmp_path):
+        """Test an empty file is rejected."""
+        path = tmp_path / "roster.planz"
+        path.write_bytes(b"")
+        
+        with pytest.raises(SnapshotError):
+            load_snapshot(path)
+    
+    def test_truncated_file(self, tmp_path, parsed):
+        """Test a truncated snapshot is rejected."""
+        students, _ = parsed
+        path = tmp_path / "roster.planz"
+        save_snapshot(path, students)
+        data = path.read_bytes()
+        path.write_bytes(data[:len(data) // 2])
+        
+        assert data.startswith(SNAPSHOT_MAGIC)
+        with pytest.raises(SnapshotError, match="Corrupted"):
+            load_snapshot(path)
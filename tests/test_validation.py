@@ -0,0 +1,172 @@
+"""Tests for test case folder validation."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from core.parser import RosterErrorCode
+from core.validation import (
+    find_cases, validate_case, validate_cases, MISSING_OPTIONAL_FILE, ROSTER_FILE, RECURRING_FILE
+)
+
+
+HEADER = "nom,sessions_par_semaine,lundi_debut,lundi_fin,mardi_debut,mardi_fin,mercredi_debut,mercredi_fin,jeudi_debut,jeudi_fin,vendredi_debut,vendredi_fin,samedi_debut,samedi_fin,groupe_lie,notes\n"
+
+EXAMPLES = Path(__file__).parent.parent / "docs" / "examples" / "test-cases"
+
+
+def write_case(root, name, roster, recurring=None):
+    case_dir = root / name
+    case_dir.mkdir()
+    (case_dir / ROSTER_FILE).write_text(roster)
+    if recurring is not None:
+        (case_dir / RECURRING_FILE).write_text(recurring)
+    return case_dir
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """A valid case, a case with errors in both files, a case without recurring slots."""
+    write_case(
+        tmp_path, "a-valid",
+        HEADER + "Alice,1,08:00,10:00,,,,,,,,,,,,\nBob,1,08:00,10:00,,,,,,,,,,,,\n",
+        "nom,jour,heure_debut,heure_fin\nAlice,lundi,08:00,09:00\nBob,lundi,08:00,09:00\n"
+    )
+    write_case(
+        tmp_path, "b-invalid",
+        HEADER + "Alice,9,08:00,10:00,,,,,,,,,,,,\nBob,1,08:00,10:00,,,,,,,,,,\nCarl,1,08:00,10:00,,,,,,,,,,,,\n",
+        "nom,jour,heure_debut,heure_fin\nAlice,lundi,08:00,09:00\nCarl,dimanche,08:00,09:00\nZed,lundi,08:00,09:00\n"
+    )
+    write_case(tmp_path, "c-no-recurring", HEADER + "Alice,1,08:00,10:00,,,,,,,,,,,,\n")
+    (tmp_path / "not-a-case").mkdir()
+    return tmp_path
+
+
+class TestFindCases:
+    """Tests for find_cases."""
+    
+    def test_parent_folder(self, corpus):
+        """Test subfolders holding an availability CSV are found, sorted."""
+        assert [case.name for case in find_cases(corpus)] == ["a-valid", "b-invalid", "c-no-recurring"]
+    
+    def test_single_case(self, corpus):
+        """Test a test case folder is its own single case."""
+        assert find_cases(corpus / "a-valid") == [corpus / "a-valid"]
+
+
+class TestValidateCase:
+    """Tests for validate_case."""
+    
+    def test_valid_case(self, corpus):
+        """Test a valid case has no issues and counts students and classes."""
+        report = validate_case(corpus / "a-valid")
+        
+        assert report.is_valid and not report.warnings
+        assert (report.student_count, report.class_count) == (2, 1)
+    
+    def test_collects_parser_and_layout_errors(self, corpus):
+        """Test both files are checked with the parser's rules plus the template layout."""
+        report = validate_case(corpus / "b-invalid")
+        
+        assert [(issue.file, issue.line, issue.code) for issue in report.errors] == [
+            (ROSTER_FILE, 2, RosterErrorCode.INVALID_SESSIONS.value),
+            (ROSTER_FILE, 3, RosterErrorCode.FIELD_COUNT.value),
+            (RECURRING_FILE, 3, RosterErrorCode.INVALID_DAY.value),
+            (RECURRING_FILE, 4, RosterErrorCode.STUDENT_NOT_FOUND.value),
+        ]
+    
+    def test_missing_recurring_file_is_a_warning(self, corpus):
+        """Test the optional recurring slots file only warns when missing."""
+        report = validate_case(corpus / "c-no-recurring")
+        
+        assert report.is_valid
+        assert [issue.code for issue in report.warnings] == [MISSING_OPTIONAL_FILE]
+    
+    def test_header_order(self, tmp_path):
+        """Test a header with every column but not in the template order is an error."""
+        columns = HEADER.strip().split(",")
+        roster = ",".join([columns[1], columns[0]] + columns[2:]) + "\n1,Alice,08:00,10:00,,,,,,,,,,,,\n"
+        
+        report = validate_case(write_case(tmp_path, "case", roster))
+        
+        assert [issue.code for issue in report.errors] == [RosterErrorCode.HEADER_MISMATCH.value]
+    
+    def test_no_data_rows(self, tmp_path):
+        """Test an availability CSV with only a header is an error."""
+        report = validate_case(write_case(tmp_path, "case", HEADER))
+        
+        assert [issue.code for issue in report.errors] == [RosterErrorCode.EMPTY_FILE.value]
+    
+    def test_unreadable_roster_skips_recurring_rows(self, tmp_path):
+        """Test recurring rows are not all reported as not found when the roster can't be read."""
+        case_dir = write_case(tmp_path, "case", "nom\nAlice\n", "nom,jour,heure_debut,heure_fin\nAlice,lundi,08:00,09:00\n")
+        
+        report = validate_case(case_dir)
+        
+        assert {issue.file for issue in report.errors} == {ROSTER_FILE}
+    
+    @pytest.mark.parametrize("file", [ROSTER_FILE, RECURRING_FILE])
+    def test_non_utf8_file(self, corpus, file):
+        """Test a file saved in Latin-1 is a malformed CSV error for that file only."""
+        case_dir = corpus / "a-valid"
+        text = (case_dir / file).read_text().replace("Alice", "Hélène")
+        (case_dir / file).write_bytes(text.encode("latin-1"))
+        
+        reports = validate_cases(find_cases(corpus), workers=1)
+        
+        assert [(issue.file, issue.code) for issue in reports[0].errors] == [
+            (file, RosterErrorCode.MALFORMED_CSV.value)
+        ]
+        assert "not UTF-8" in reports[0].errors[0].message
+        assert reports[2].is_valid
+    
+    def test_examples_are_valid(self):
+        """Test the shipped test cases pass."""
+        reports = validate_cases(find_cases(EXAMPLES), workers=1)
+        
+        assert reports and all(report.is_valid for report in reports)
+
+
+class TestValidateCases:
+    """Tests for validate_cases."""
+    
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_input_order(self, corpus, workers):
+        """Test reports follow input order and match validate_case."""
+        cases = find_cases(corpus)[::-1]
+        
+        reports = validate_cases(cases, workers=workers)
+        
+        assert [report.path for report in reports] == [str(case) for case in cases]
+        assert reports == [validate_case(case) for case in cases]
+    
+    def test_unknown_engine(self, corpus):
+        """Test an unknown engine is rejected up front."""
+        with pytest.raises(ValueError, match="Unknown CSV engine"):
+            validate_cases(find_cases(corpus), engine="excel")
+
+
+class TestValidateScript:
+    """Tests for scripts/validate_test_csv.py."""
+    
+    def run(self, *args):
+        script = Path(__file__).parent.parent / "scripts" / "validate_test_csv.py"
+        return subprocess.run([sys.executable, str(script), *map(str, args)], capture_output=True, text=True)
+    
+    def test_json_output(self, corpus):
+        """Test --json gives one entry per case and the exit code reflects errors."""
+        result = self.run(corpus, "--json", "--workers", "1")
+        
+        output = json.loads(result.stdout)
+        assert result.returncode == 1
+        assert output["valid"] is False
+        assert [case["valid"] for case in output["cases"]] == [True, False, True]
+        assert output["cases"][1]["errors"][0]["code"] == "invalid_sessions"
+    
+    def test_strict_fails_on_warnings(self, corpus):
+        """Test --strict turns warnings into a failure."""
+        assert self.run(corpus / "c-no-recurring").returncode == 0
+        assert self.run(corpus / "c-no-recurring", "--strict").returncode == 1